@@ -4,7 +4,6 @@ import matplotlib.pyplot as plt
 import os
 from datetime import datetime, timedelta
 import sys
-import sqlite3
 import re
 
 # Add current directory to path for imports
@@ -13,8 +12,14 @@ sys.path.append(os.path.dirname(__file__))
 from auth_manager import AuthManager
 from database_manager import DatabaseManager
 from report_generator import ReportGenerator
+from text_cleaning import clean_text_series
+from model_registry import get_registry
+from dataset_store import get_dataset_store
+from dataset_cache import get_dataset_cache
+from schema_inference import get_schema
+from sentiment_labels import NEGATIVE, sentiment_codes
+from issue_matcher import ISSUE_RECOMMENDATIONS, IssueMatcher
 from wordcloud import WordCloud
-import joblib
 import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.model_selection import train_test_split
@@ -25,6 +30,9 @@ from sklearn.metrics import accuracy_score, classification_report
 auth = AuthManager()
 db = DatabaseManager()
 report_gen = ReportGenerator()
+dataset_store = get_dataset_store(os.path.join(os.path.dirname(__file__), '..', 'data'))
+dataset_cache = get_dataset_cache()
+issue_matcher = IssueMatcher()
 
 # Configure page
 st.set_page_config(
@@ -43,18 +51,6 @@ def check_authentication():
         return False
     return True
 
-def clean_text_for_training(text):
-    """Clean text for model training"""
-    import re
-    if pd.isna(text):
-        return ""
-    text = str(text).lower()
-    text = re.sub(r'http\S+|www\S+|https\S+', '', text, flags=re.MULTILINE)
-    text = re.sub(r'@\w+|#\w+', '', text)
-    text = re.sub(r'[^a-zA-Z\s]', '', text)
-    text = re.sub(r'\s+', ' ', text).strip()
-    return text
-
 def train_sentiment_model(df, text_col, sentiment_col):
     """Train sentiment model on provided data"""
     from sklearn.feature_extraction.text import TfidfVectorizer
@@ -64,7 +60,7 @@ def train_sentiment_model(df, text_col, sentiment_col):
     
     # Clean the data
     df_clean = df.copy()
-    df_clean[text_col] = df_clean[text_col].apply(clean_text_for_training)
+    df_clean[text_col] = clean_text_series(df_clean[text_col])
     df_clean = df_clean.dropna(subset=[text_col, sentiment_col])
     df_clean = df_clean[df_clean[text_col].str.len() > 0]
     
@@ -99,9 +95,9 @@ def show_admin_panel():
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.metric("Total Users", len(pd.read_sql("SELECT * FROM users", sqlite3.connect(db.db_path))))
+        st.metric("Total Users", db.count_users())
     with col2:
-        st.metric("Total Feedback", len(pd.read_sql("SELECT * FROM feedback", sqlite3.connect(db.db_path))))
+        st.metric("Total Feedback", f"{db.count_feedback():,}")
     with col3:
         st.metric("System Status", "✅ Healthy")
     with col4:
@@ -145,7 +141,7 @@ def show_admin_panel():
                         # Clean and preview data
                         st.write("**Data Cleaning Results:**")
                         clean_df = new_df.copy()
-                        clean_df[text_column] = clean_df[text_column].apply(clean_text_for_training)
+                        clean_df[text_column] = clean_text_series(clean_df[text_column])
                         
                         # Remove empty/invalid entries
                         initial_count = len(clean_df)
@@ -214,26 +210,17 @@ def show_admin_panel():
                         dataset_path = os.path.join(data_folder, filename)
                         clean_df.to_csv(dataset_path, index=False)
                         
-                        # Save model
-                        models_folder = os.path.join(os.path.dirname(__file__), '..', 'models')
-                        os.makedirs(models_folder, exist_ok=True)
-                        model_path = os.path.join(models_folder, f"model_{timestamp}.joblib")
-                        vectorizer_path = os.path.join(models_folder, f"vectorizer_{timestamp}.joblib")
-                        
-                        joblib.dump(model, model_path)
-                        joblib.dump(vectorizer, vectorizer_path)
-                        
-                        # Update main model files
+                        # Register and promote the model (also updates the main model files)
                         main_model_path = os.path.join(os.path.dirname(__file__), '..', "sentiment_model.joblib")
                         main_vectorizer_path = os.path.join(os.path.dirname(__file__), '..', "tfidf_vectorizer.joblib")
-                        joblib.dump(model, main_model_path)
-                        joblib.dump(vectorizer, main_vectorizer_path)
+                        version = get_registry(main_model_path, main_vectorizer_path).register(
+                            model, vectorizer, accuracy=accuracy, dataset=filename,
+                            rows=len(clean_df), training_mode='full')
                         
                         st.success(f"""
                         ✅ Dataset processed successfully!
                         - Cleaned dataset saved: {dataset_path}
-                        - Model saved: {model_path}
-                        - Vectorizer saved: {vectorizer_path}
+                        - Model version promoted: {version}
                         - Main model files updated
                         """)
                         
@@ -280,34 +267,29 @@ def show_admin_panel():
             selected_dataset = st.selectbox("Select dataset to view", csv_files)
             if st.button("View Dataset Info"):
                 try:
-                    dataset_path = os.path.join(data_folder, selected_dataset)
-                    dataset_df = pd.read_csv(dataset_path)
+                    # Row count and columns come from the cached metadata, not a full parse
+                    dataset_info = dataset_store.info(selected_dataset)
                     
                     col1, col2, col3 = st.columns(3)
                     with col1:
-                        st.metric("Rows", len(dataset_df))
+                        st.metric("Rows", dataset_info['rows'])
                     with col2:
-                        st.metric("Columns", len(dataset_df.columns))
+                        st.metric("Columns", len(dataset_info['columns']))
                     with col3:
-                        st.metric("Size (MB)", f"{os.path.getsize(dataset_path)/(1024*1024):.2f}")
+                        st.metric("Size (MB)", f"{dataset_info['source_size_bytes']/(1024*1024):.2f}")
                     
-                    st.write("**Columns:**", list(dataset_df.columns))
-                    st.dataframe(dataset_df.head())
+                    st.write("**Columns:**", list(dataset_info['columns']))
+                    st.dataframe(dataset_store.head(selected_dataset))
                     
                 except Exception as e:
                     st.error(f"Error reading dataset: {e}")
     
     # User Activity Logs
     st.subheader("Recent User Activity")
-    try:
-        activity_df = pd.read_sql("""
-        SELECT u.username, ua.action, ua.details, ua.timestamp 
-        FROM user_activity ua 
-        JOIN users u ON ua.user_id = u.user_id 
-        ORDER BY ua.timestamp DESC LIMIT 10
-        """, sqlite3.connect(db.db_path))
+    activity_df = db.get_user_activity(limit=10)
+    if not activity_df.empty:
         st.dataframe(activity_df)
-    except:
+    else:
         st.info("No activity logs available")
 
 def show_product_manager_panel(df):
@@ -354,7 +336,9 @@ def show_product_manager_panel(df):
             st.warning("No valid sentiment data found in the dataset.")
             return
         
-        negative_count = len(product_df[product_df[sentiment_col].str.lower().str.contains('negative|bad|poor|1|2', na=False)])
+        # Integer comparison on the normalized sentiment codes
+        product_codes = sentiment_codes(product_df, sentiment_col)
+        negative_count = int((product_codes == NEGATIVE).sum())
         total_count = len(product_df.dropna(subset=[sentiment_col]))
         negative_ratio = negative_count / total_count if total_count > 0 else 0
         
@@ -377,25 +361,10 @@ def show_product_manager_panel(df):
         # Get negative feedback - handle different sentiment formats
         negative_df = product_df.copy()
         
-        # Try different ways to identify negative sentiment
-        sentiment_values = product_df[sentiment_col].astype(str).str.lower()
-        
-        # Method 1: Direct negative keywords
-        negative_mask = sentiment_values.str.contains('negative|bad|poor|awful|terrible', na=False)
-        
-        # Method 2: Numeric ratings (1-2 out of 5, or 1-4 out of 10)
-        if not negative_mask.any():
-            try:
-                numeric_sentiment = pd.to_numeric(product_df[sentiment_col], errors='coerce')
-                max_rating = numeric_sentiment.max()
-                if max_rating <= 5:  # 1-5 scale
-                    negative_mask = numeric_sentiment <= 2
-                elif max_rating <= 10:  # 1-10 scale
-                    negative_mask = numeric_sentiment <= 4
-            except:
-                pass
+        # Method 1: Normalized codes (text labels, 1-5 and 1-10 ratings)
+        negative_mask = product_codes == NEGATIVE
         
-        # Method 3: Check unique values to understand the sentiment format
+        # Method 2: Check unique values to understand the sentiment format
         if not negative_mask.any():
             unique_sentiments = product_df[sentiment_col].value_counts()
             st.write("**Available sentiment categories:**")
@@ -445,25 +414,10 @@ def show_product_manager_panel(df):
             else:
                 st.info("No date column found for time-based analysis.")
             
-            # Continue with rest of root cause analysis...
-            # Common negative keywords analysis
+            # Tag each negative entry with issue categories in a single pass
             st.write("**🔤 Most Common Issues (Keywords):**")
-            all_negative_text = ' '.join(negative_df[text_col].astype(str).str.lower())
-            
-            # Define common issue keywords
-            issue_keywords = {
-                'Quality Issues': ['broken', 'defective', 'poor quality', 'cheap', 'flimsy', 'damaged', 'bad', 'awful', 'terrible'],
-                'Shipping/Delivery': ['shipping', 'delivery', 'late', 'delayed', 'arrived', 'package', 'slow'],
-                'Customer Service': ['service', 'support', 'help', 'rude', 'unhelpful', 'response', 'staff'],
-                'Price/Value': ['expensive', 'overpriced', 'cost', 'price', 'money', 'value', 'cheap'],
-                'Functionality': ['doesn\'t work', 'not working', 'malfunction', 'failed', 'error', 'problem', 'issue']
-            }
-            
-            issue_counts = {}
-            for category, keywords in issue_keywords.items():
-                count = sum(all_negative_text.count(keyword) for keyword in keywords)
-                if count > 0:
-                    issue_counts[category] = count
+            issue_matches = issue_matcher.match(negative_df[text_col])
+            issue_counts = issue_matches.issue_counts()
             
             if issue_counts:
                 # Display issue breakdown
@@ -499,6 +453,25 @@ def show_product_manager_panel(df):
                 with st.expander(f"Negative Feedback #{i}"):
                     st.write(str(text)[:500] + "..." if len(str(text)) > 500 else str(text))
             
+            if issue_counts:
+                # Sample negative feedback for the top issue, straight from the row tags
+                st.write("**📝 Sample Negative Feedback by Issue:**")
+                top_issue = max(issue_counts.items(), key=lambda x: x[1])[0]
+                issue_feedback = negative_df.loc[issue_matches.examples(top_issue, 3)]
+                
+                st.write(f"**Top Issue: {top_issue}**")
+                for idx, row in issue_feedback.iterrows():
+                    with st.expander(f"Feedback #{idx}"):
+                        st.write(row[text_col])
+                
+                # Actionable recommendations
+                st.write("**💡 Recommended Actions:**")
+                top_3_issues = sorted(issue_counts.items(), key=lambda x: x[1], reverse=True)[:3]
+                for issue, count in top_3_issues:
+                    st.write(f"**For {issue} issues:**")
+                    for recommendation in ISSUE_RECOMMENDATIONS.get(issue, ["Review and investigate further"]):
+                        st.write(f"  {recommendation}")
+            
         else:
             st.info("No negative feedback found for analysis. This could mean:")
             st.write("- All feedback is positive (great!)")
@@ -507,135 +480,6 @@ def show_product_manager_panel(df):
     else:
         st.error("❌ Could not detect sentiment or text columns for root cause analysis.")
         st.info("💡 Make sure your dataset has clearly named sentiment and text columns.")
-
-    # Time-based analysis
-    st.write("**📅 Negative Sentiment Over Time:**")
-    if any(col for col in df.columns if 'date' in col.lower() or 'time' in col.lower()):
-        date_col = next((col for col in df.columns if 'date' in col.lower() or 'time' in col.lower()), None)
-        if date_col:
-            try:
-                negative_df_time = negative_df.copy()
-                negative_df_time[date_col] = pd.to_datetime(negative_df_time[date_col], errors='coerce')
-                negative_df_time = negative_df_time.dropna(subset=[date_col])
-                
-                # Group by date and count
-                daily_negative = negative_df_time.groupby(negative_df_time[date_col].dt.date).size()
-                
-                fig, ax = plt.subplots(figsize=(10, 4))
-                daily_negative.plot(kind='line', ax=ax, color='red')
-                ax.set_title('Negative Sentiment Trend')
-                ax.set_ylabel('Negative Feedback Count')
-                ax.tick_params(axis='x', rotation=45)
-                st.pyplot(fig)
-                plt.close()
-            except Exception as e:
-                st.write(f"Could not analyze time trends: {e}")
-    
-    # Common negative keywords analysis
-    st.write("**🔤 Most Common Issues (Keywords):**")
-    all_negative_text = ' '.join(negative_df[text_col].astype(str).str.lower())
-    
-    # Define common issue keywords
-    issue_keywords = {
-    'Quality Issues': ['broken', 'defective', 'poor quality', 'cheap', 'flimsy', 'damaged'],
-    'Shipping/Delivery': ['shipping', 'delivery', 'late', 'delayed', 'arrived', 'package'],
-    'Customer Service': ['service', 'support', 'help', 'rude', 'unhelpful', 'response'],
-    'Price/Value': ['expensive', 'overpriced', 'cost', 'price', 'money', 'value'],
-    'Functionality': ['doesn\'t work', 'not working', 'malfunction', 'failed', 'error', 'problem']
-    }
-    
-    issue_counts = {}
-    for category, keywords in issue_keywords.items():
-        count = sum(all_negative_text.count(keyword) for keyword in keywords)
-        if count > 0:
-            issue_counts[category] = count
-    
-    if issue_counts:
-        # Display issue breakdown
-        col1, col2 = st.columns([1, 1])
-        
-        with col1:
-            # Bar chart of issues
-            fig, ax = plt.subplots(figsize=(8, 6))
-            categories = list(issue_counts.keys())
-            counts = list(issue_counts.values())
-            bars = ax.bar(categories, counts, color=['red', 'orange', 'yellow', 'purple', 'brown'][:len(categories)])
-            ax.set_title('Issue Categories in Negative Feedback')
-            ax.set_ylabel('Mention Count')
-            plt.xticks(rotation=45, ha='right')
-            plt.tight_layout()
-            st.pyplot(fig)
-            plt.close()
-        
-        with col2:
-            # Top issues table
-            st.write("**Issue Breakdown:**")
-            sorted_issues = sorted(issue_counts.items(), key=lambda x: x[1], reverse=True)
-            for category, count in sorted_issues:
-                percentage = (count / sum(issue_counts.values())) * 100
-                st.write(f"• **{category}**: {count} mentions ({percentage:.1f}%)")
-    
-    # Sample negative feedback by category
-    st.write("**📝 Sample Negative Feedback by Issue:**")
-    
-    # Find top issue category
-    if issue_counts:
-        top_issue = max(issue_counts.items(), key=lambda x: x[1])[0]
-        top_keywords = issue_keywords[top_issue]
-        
-        # Find feedback containing top issue keywords
-        issue_feedback = negative_df[
-            negative_df[text_col].str.lower().str.contains('|'.join(top_keywords), na=False)
-        ].head(3)
-        
-        st.write(f"**Top Issue: {top_issue}**")
-        for idx, row in issue_feedback.iterrows():
-            with st.expander(f"Feedback #{idx}"):
-                st.write(row[text_col])
-    
-    # Actionable recommendations
-    st.write("**💡 Recommended Actions:**")
-    
-    if issue_counts:
-        top_3_issues = sorted(issue_counts.items(), key=lambda x: x[1], reverse=True)[:3]
-        
-        recommendations = {
-            'Quality Issues': [
-                "🔧 Review manufacturing processes and quality control",
-                "📊 Conduct product testing with focus groups",
-                "🏭 Audit supplier quality standards"
-            ],
-            'Shipping/Delivery': [
-                "📦 Review shipping partner performance",
-                "⏰ Improve delivery time estimates",
-                "📱 Implement better package tracking"
-            ],
-            'Customer Service': [
-                "👥 Provide additional customer service training",
-                "⚡ Reduce response times",
-                "📞 Implement escalation procedures"
-            ],
-            'Price/Value': [
-                "💰 Review pricing strategy",
-                "🎁 Consider value-added bundles",
-                "📈 Communicate product value better"
-            ],
-            'Functionality': [
-                "🔧 Update product documentation",
-                "🛠️ Improve product design",
-                "📞 Enhance technical support"
-            ]
-        }
-        
-        for issue, count in top_3_issues:
-            st.write(f"**For {issue} issues:**")
-            for recommendation in recommendations.get(issue, ["Review and investigate further"]):
-                st.write(f"  {recommendation}")
-    else:
-        st.info("No negative feedback found for analysis. This could mean:")
-        st.write("- All feedback is positive (great!)")
-        st.write("- The sentiment detection needs adjustment")
-        st.write("- The dataset uses a different sentiment format")
     
     # PDF Report Generation
     st.subheader("📄 Generate Product Report")
@@ -704,52 +548,11 @@ def show_marketing_panel(df):
 
 def guess_sentiment_column(df):
     """Guess sentiment column name"""
-    sentiment_keywords = ['sentiment', 'label', 'rating', 'score', 'class', 'category', 'polarity']
-    for col in df.columns:
-        col_lower = col.lower()
-        if any(keyword in col_lower for keyword in sentiment_keywords):
-            return col
-    # If no obvious sentiment column, check for columns with sentiment-like values
-    for col in df.columns:
-        if df[col].dtype == 'object':
-            unique_vals = df[col].dropna().unique()
-            unique_str = [str(val).lower() for val in unique_vals[:10]]  # Check first 10 unique values
-            sentiment_words = ['positive', 'negative', 'neutral', 'good', 'bad', 'poor', 'excellent']
-            if any(word in ' '.join(unique_str) for word in sentiment_words):
-                return col
-    return None
+    return get_schema(df)['sentiment_column']
 
 def guess_text_column(df):
     """Guess text column name"""
-    text_keywords = ['text', 'review', 'comment', 'feedback', 'message', 'content', 'description']
-    
-    # First, look for columns with text-related names
-    for col in df.columns:
-        col_lower = col.lower()
-        if any(keyword in col_lower for keyword in text_keywords):
-            return col
-    
-    # If no obvious text column, find the column with longest average text length
-    text_candidates = []
-    for col in df.columns:
-        if df[col].dtype == 'object':
-            try:
-                avg_length = df[col].astype(str).str.len().mean()
-                if avg_length > 20:  # Likely to be text if average length > 20 chars
-                    text_candidates.append((col, avg_length))
-            except:
-                continue
-    
-    if text_candidates:
-        # Return column with longest average text
-        return max(text_candidates, key=lambda x: x[1])[0]
-    
-    # Fallback to first string column
-    for col in df.columns:
-        if df[col].dtype == 'object':
-            return col
-    
-    return df.columns[0] if len(df.columns) > 0 else None
+    return get_schema(df)['text_column']
 
 def main():
     # Check authentication
@@ -817,22 +620,19 @@ def main():
     elif st.session_state['current_page'] == 'product':
         # Load data for product panel
         selected_file = st.sidebar.selectbox('Select dataset', available_files)
-        data_path = os.path.join(data_folder, selected_file)
-        df = pd.read_csv(data_path)
+        df = dataset_cache.get(os.path.join(data_folder, selected_file), dataset_store.load)
         show_product_manager_panel(df)
     elif st.session_state['current_page'] == 'marketing':
         # Load data for marketing panel
         selected_file = st.sidebar.selectbox('Select dataset', available_files)
-        data_path = os.path.join(data_folder, selected_file)
-        df = pd.read_csv(data_path)
+        df = dataset_cache.get(os.path.join(data_folder, selected_file), dataset_store.load)
         show_marketing_panel(df)
     else:
         # General dashboard (existing functionality)
         selected_file = st.sidebar.selectbox('Select dataset', available_files)
-        data_path = os.path.join(data_folder, selected_file)
         
         try:
-            df = pd.read_csv(data_path)
+            df = dataset_cache.get(os.path.join(data_folder, selected_file), dataset_store.load)
         except Exception as e:
             st.error(f"Failed to load data: {e}")
             return
@@ -1,11 +1,20 @@
 import streamlit as st
 import bcrypt
-import sqlite3
 import os
 
+from connection_pool import get_pool
+
+# Demo accounts created on first start: (username, email, password, role)
+DEFAULT_USERS = (
+    ("admin", "admin@example.com", "admin123", "administrator"),
+    ("product_manager", "pm@example.com", "pm123", "product_manager"),
+    ("marketing", "marketing@example.com", "marketing123", "marketing"),
+)
+
 class AuthManager:
     def __init__(self):
         self.db_path = 'data/sentiment_system.db'
+        self.pool = get_pool(self.db_path)
         self.setup_auth_config()
     
     def setup_auth_config(self):
@@ -19,44 +28,33 @@ class AuthManager:
     def create_default_users(self):
         """Create default users for demo"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Create users table if not exists
-            cursor.execute('''
-            CREATE TABLE IF NOT EXISTS users (
-                user_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                username TEXT UNIQUE NOT NULL,
-                email TEXT UNIQUE NOT NULL,
-                password_hash TEXT NOT NULL,
-                role TEXT NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-            ''')
-            
-            # Create default admin user
-            admin_password = bcrypt.hashpw("admin123".encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
-            cursor.execute('''
-            INSERT OR IGNORE INTO users (username, email, password_hash, role) 
-            VALUES (?, ?, ?, ?)
-            ''', ("admin", "admin@example.com", admin_password, "administrator"))
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
             
-            # Create product manager user
-            pm_password = bcrypt.hashpw("pm123".encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
-            cursor.execute('''
-            INSERT OR IGNORE INTO users (username, email, password_hash, role) 
-            VALUES (?, ?, ?, ?)
-            ''', ("product_manager", "pm@example.com", pm_password, "product_manager"))
+                # Create users table if not exists
+                cursor.execute('''
+                CREATE TABLE IF NOT EXISTS users (
+                    user_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    username TEXT UNIQUE NOT NULL,
+                    email TEXT UNIQUE NOT NULL,
+                    password_hash TEXT NOT NULL,
+                    role TEXT NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+                ''')
             
-            # Create marketing user
-            marketing_password = bcrypt.hashpw("marketing123".encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
-            cursor.execute('''
-            INSERT OR IGNORE INTO users (username, email, password_hash, role) 
-            VALUES (?, ?, ?, ?)
-            ''', ("marketing", "marketing@example.com", marketing_password, "marketing"))
-            
-            conn.commit()
-            conn.close()
+                # Hash passwords only for default users that do not exist yet - bcrypt
+                # takes a few hundred ms per hash and this runs on every cold start
+                cursor.execute('SELECT username FROM users')
+                existing = {row[0] for row in cursor.fetchall()}
+                for username, email, password, role in DEFAULT_USERS:
+                    if username in existing:
+                        continue
+                    password_hash = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+                    cursor.execute('''
+                    INSERT OR IGNORE INTO users (username, email, password_hash, role) 
+                    VALUES (?, ?, ?, ?)
+                    ''', (username, email, password_hash, role))
         except Exception as e:
             st.error(f"Database setup error: {e}")
     
@@ -106,16 +104,11 @@ class AuthManager:
     def authenticate_user(self, username, password):
         """Authenticate user"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-            SELECT user_id, username, email, password_hash, role 
-            FROM users WHERE username = ?
-            ''', (username,))
-            
-            user_data = cursor.fetchone()
-            conn.close()
+            with self.pool.connection() as conn:
+                user_data = conn.execute('''
+                SELECT user_id, username, email, password_hash, role 
+                FROM users WHERE username = ?
+                ''', (username,)).fetchone()
             
             if user_data and bcrypt.checkpw(password.encode('utf-8'), user_data[3].encode('utf-8')):
                 return {
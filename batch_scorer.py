@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Batch sentiment scoring for unlabeled feedback.
+
+Streams a CSV file or the feedback table in fixed-size chunks, so memory
+stays bounded no matter how many rows there are. Each chunk is cleaned,
+vectorized and scored in one sparse transform + predict_proba call, and
+chunks can be spread over a process pool.
+
+Usage:
+    python batch_scorer.py csv data/new_feedback.csv data/scored.csv --text-column text
+    python batch_scorer.py --workers 4 feedback --db data/sentiment_system.db
+    python batch_scorer.py --workers 4 --numpy-model sentiment_model.npz csv data/new.csv data/scored.csv
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from model_manager import DEFAULT_MODEL_PATH, DEFAULT_VECTORIZER_PATH, get_model_manager
+from numpy_scorer import NumpyScorer
+from prediction_cache import get_prediction_cache
+from text_cleaning import clean_texts
+
+DEFAULT_CHUNKSIZE = 10000
+
+
+def score_texts(texts, model, vectorizer, cache=None, version=None):
+    """Score an iterable of raw texts, returning (labels, confidences) arrays.
+
+    With a PredictionCache, texts already scored by this model version are
+    served from it and only the rest go through the model.
+    """
+    if cache is not None:
+        proba = cache.predict_proba(texts, model, vectorizer, version)
+    else:
+        cleaned = clean_texts(list(texts))
+        if not cleaned:
+            return np.array([], dtype=object), np.array([], dtype=float)
+        proba = model.predict_proba(vectorizer.transform(cleaned))
+    best = proba.argmax(axis=1)
+    labels = model.classes_[best]
+    confidences = proba[np.arange(len(best)), best]
+    return labels, confidences
+
+
+_numpy_scorers = {}
+
+
+def load_scoring_pair(model_path, vectorizer_path, numpy_model_path=None):
+    """(model, vectorizer, version) to score with, loaded once per process.
+
+    With a NumPy scoring artifact the scorer stands in for both objects and
+    scikit-learn is never imported.
+    """
+    if numpy_model_path:
+        scorer = _numpy_scorers.get(numpy_model_path)
+        if scorer is None:
+            scorer = _numpy_scorers[numpy_model_path] = NumpyScorer(numpy_model_path)
+        return scorer, scorer, scorer.version
+    return get_model_manager(model_path, vectorizer_path).get_versioned_model()
+
+
+# Worker process state - each worker loads the model once in its initializer
+_worker_paths = None
+_worker_cache = None
+
+
+def _init_worker(model_path, vectorizer_path, use_cache=True, numpy_model_path=None):
+    """Load the model pair once per worker process"""
+    global _worker_paths, _worker_cache
+    _worker_paths = (model_path, vectorizer_path, numpy_model_path)
+    _worker_cache = get_prediction_cache() if use_cache else None
+    load_scoring_pair(*_worker_paths)
+
+
+def _score_chunk(texts):
+    """Score one chunk inside a worker process"""
+    model, vectorizer, version = load_scoring_pair(*_worker_paths)
+    labels, confidences = score_texts(texts, model, vectorizer, _worker_cache, version)
+    return labels.tolist(), confidences.tolist()
+
+
+class BatchScorer:
+    def __init__(self, model_path=None, vectorizer_path=None, workers=1, chunksize=DEFAULT_CHUNKSIZE,
+                 use_cache=True, numpy_model_path=None):
+        self.model_path = model_path or DEFAULT_MODEL_PATH
+        self.vectorizer_path = vectorizer_path or DEFAULT_VECTORIZER_PATH
+        # Exported .npz artifact to score with instead of the joblib pair
+        self.numpy_model_path = numpy_model_path
+        self.workers = max(1, int(workers or 1))
+        self.chunksize = chunksize
+        # Duplicate texts (retweets, boilerplate) are scored once per process
+        self.use_cache = use_cache
+        self.cache = get_prediction_cache() if use_cache else None
+        # At most this many chunks are in flight, which bounds memory use
+        self.max_pending = self.workers * 2
+
+    def score_frame(self, df, text_column):
+        """Score a single in-memory frame, returning (labels, confidences)"""
+        model, vectorizer, version = load_scoring_pair(self.model_path, self.vectorizer_path, self.numpy_model_path)
+        return score_texts(df[text_column].tolist(), model, vectorizer, self.cache, version)
+
+    def _map_chunks(self, chunks, text_of):
+        """Yield (chunk, labels, confidences) in input order"""
+        if self.workers == 1:
+            for chunk in chunks:
+                model, vectorizer, version = load_scoring_pair(self.model_path, self.vectorizer_path,
+                                                               self.numpy_model_path)
+                labels, confidences = score_texts(text_of(chunk), model, vectorizer, self.cache, version)
+                yield chunk, labels.tolist(), confidences.tolist()
+            return
+
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                 initargs=(self.model_path, self.vectorizer_path, self.use_cache,
+                                           self.numpy_model_path)) as pool:
+            pending = deque()
+            for chunk in chunks:
+                pending.append((chunk, pool.submit(_score_chunk, text_of(chunk))))
+                if len(pending) >= self.max_pending:
+                    chunk, future = pending.popleft()
+                    yield (chunk,) + future.result()
+            while pending:
+                chunk, future = pending.popleft()
+                yield (chunk,) + future.result()
+
+    def score_csv(self, input_path, output_path, text_column='text', label_column='sentiment',
+                  progress_callback=None):
+        """Score a CSV file chunk by chunk, writing label and confidence columns"""
+        chunks = pd.read_csv(input_path, chunksize=self.chunksize)
+        total = 0
+        first = True
+
+        for chunk, labels, confidences in self._map_chunks(chunks, lambda c: c[text_column].tolist()):
+            chunk[label_column] = labels
+            chunk['confidence'] = confidences
+            chunk.to_csv(output_path, mode='w' if first else 'a', header=first, index=False)
+            first = False
+            total += len(chunk)
+            if progress_callback:
+                progress_callback(total)
+
+        return total
+
+    def score_feedback(self, db, overwrite=False, progress_callback=None):
+        """Score every feedback row that has no confidence yet (every row with overwrite)"""
+        def pages():
+            after_id = 0
+            while True:
+                page = db.get_unscored_feedback(after_id=after_id, limit=self.chunksize, include_scored=overwrite)
+                if page.empty:
+                    return
+                after_id = int(page['feedback_id'].iloc[-1])
+                yield page
+
+        total = 0
+        for page, labels, confidences in self._map_chunks(pages(), lambda p: p['text'].tolist()):
+            feedback_ids = [int(feedback_id) for feedback_id in page['feedback_id']]
+            db.update_feedback_predictions(zip(feedback_ids, labels, confidences))
+            total += len(page)
+            if progress_callback:
+                progress_callback(total)
+
+        return total
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Batch sentiment scoring")
+    parser.add_argument('--model', default=DEFAULT_MODEL_PATH, help="Path to sentiment_model.joblib")
+    parser.add_argument('--vectorizer', default=DEFAULT_VECTORIZER_PATH, help="Path to tfidf_vectorizer.joblib")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="Number of scoring processes")
+    parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE, help="Rows per chunk")
+    parser.add_argument('--no-cache', action='store_true', help="Score every text, even repeated ones")
+    parser.add_argument('--numpy-model', help="Score with an exported .npz artifact (see numpy_scorer.py)")
+    subparsers = parser.add_subparsers(dest='source', required=True)
+
+    csv_parser = subparsers.add_parser('csv', help="Score a CSV file")
+    csv_parser.add_argument('input', help="Input CSV path")
+    csv_parser.add_argument('output', help="Output CSV path")
+    csv_parser.add_argument('--text-column', default='text')
+    csv_parser.add_argument('--label-column', default='sentiment',
+                            help="Column to write predicted labels into")
+
+    feedback_parser = subparsers.add_parser('feedback', help="Score unscored rows of the feedback table")
+    feedback_parser.add_argument('--db', default='data/sentiment_system.db')
+    feedback_parser.add_argument('--overwrite', action='store_true',
+                                 help="Re-score rows that already have a prediction")
+
+    args = parser.parse_args(argv)
+    scorer = BatchScorer(args.model, args.vectorizer, workers=args.workers, chunksize=args.chunksize,
+                         use_cache=not args.no_cache, numpy_model_path=args.numpy_model)
+    start = time.time()
+
+    def report(total):
+        print(f"  scored {total:,} rows ({total / max(time.time() - start, 1e-9):,.0f} rows/s)")
+
+    if args.source == 'csv':
+        total = scorer.score_csv(args.input, args.output, text_column=args.text_column,
+                                 label_column=args.label_column, progress_callback=report)
+    else:
+        from database_manager import DatabaseManager
+        total = scorer.score_feedback(DatabaseManager(args.db), overwrite=args.overwrite,
+                                      progress_callback=report)
+
+    print(f"✅ Scored {total:,} rows in {time.time() - start:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Benchmark startup and first render of every role page with Streamlit's AppTest.
+
+For each dataset size a synthetic CSV (text, sentiment, date, product,
+platform) is written to its own data folder. Then, for each demo role, a
+fresh interpreter logs in through the login form and renders the role's
+default page and the general dashboard, each once cold and once as a
+rerun. Every step records wall time, peak RSS and per-section timings -
+the time from one st.title/header/subheader call to the next - so a slow
+chart or index build shows up by name.
+
+Each role runs against a fresh SQLite database and columnar store (the
+child's working directory and SENTIMENT_DATA_DIR), so every first render
+is cold and nothing from the real data folder is used or touched. Results are written as JSON; pass an
+earlier file with --compare to print the change per step.
+
+Usage:
+    python benchmarks/bench_pages.py --rows 10000 100000 1000000 --json pages.json
+    python benchmarks/bench_pages.py --rows 10000 --roles marketing --compare pages.json
+"""
+
+import argparse
+import json
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+from auth_manager import DEFAULT_USERS
+
+DEFAULT_ROWS = (10000, 100000, 1000000)
+# Seconds one AppTest script run may take
+DEFAULT_TIMEOUT = 1800
+DASHBOARD_BUTTON = "📋 General Dashboard"
+
+OPINIONS = {
+    'positive': ["love the", "great experience with the", "really happy with the", "thank you for the",
+                 "impressed by the", "best ever"],
+    'negative': ["terrible", "really disappointed with the", "worst", "still waiting on the",
+                 "broken again", "cannot believe the"],
+    'neutral': ["just tried the", "looking at the", "any update on the", "switched to the",
+                "question about the", "received the"],
+}
+SUBJECTS = ["app", "delivery", "customer service", "battery", "update", "checkout", "refund",
+            "login", "price", "support team", "notifications", "screen"]
+DETAILS = ["today", "this week", "after the update", "on my phone", "again", "for the second time",
+           "since monday", "at the store", "", "lol", "#fail", "#win"]
+PRODUCTS = ["Phone X", "Tablet S", "Watch 2", "Earbuds Pro", "Laptop Air"]
+PLATFORMS = ["twitter", "app_store", "email", "facebook", "survey"]
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def make_dataset(rows, seed=0):
+    """Synthetic feedback with a sentiment that matches its wording"""
+    rng = np.random.default_rng(seed)
+    sentiments = rng.choice(list(OPINIONS), size=rows, p=[0.35, 0.4, 0.25])
+    opinions = np.empty(rows, dtype=object)
+    for sentiment, phrases in OPINIONS.items():
+        mask = sentiments == sentiment
+        opinions[mask] = rng.choice(phrases, size=mask.sum())
+    text = (pd.Series(opinions) + ' ' + rng.choice(SUBJECTS, size=rows) + ' '
+            + rng.choice(DETAILS, size=rows)).str.strip()
+    dates = pd.Timestamp('2025-01-01') + pd.to_timedelta(rng.integers(0, 90 * 24 * 3600, size=rows), unit='s')
+    return pd.DataFrame({
+        'text': text,
+        'sentiment': sentiments,
+        'date': dates,
+        'product': rng.choice(PRODUCTS, size=rows),
+        'platform': rng.choice(PLATFORMS, size=rows),
+    })
+
+
+class SectionTimer:
+    """Record when each st.title/st.header/st.subheader is called during a script run"""
+
+    def __init__(self):
+        self.marks = []
+
+    def install(self):
+        import streamlit as st
+        for name in ('title', 'header', 'subheader'):
+            original = getattr(st, name)
+
+            def patched(body, *args, _original=original, **kwargs):
+                self.marks.append((str(body), time.perf_counter()))
+                return _original(body, *args, **kwargs)
+
+            setattr(st, name, patched)
+
+    def sections(self, start, end):
+        """(title, seconds) from each mark to the next; work before the first mark is '(setup)'"""
+        marks = [('(setup)', start)] + self.marks + [(None, end)]
+        self.marks = []
+        return [(title, round(next_time - mark_time, 4))
+                for (title, mark_time), (_, next_time) in zip(marks, marks[1:])]
+
+
+def peak_rss_mb():
+    """Peak RSS of this process; ru_maxrss is not used on Linux as it survives fork and exec"""
+    try:
+        with open('/proc/self/status') as status:
+            for line in status:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_step(at, timer, name, action):
+    """Run one AppTest interaction and describe it"""
+    start = time.perf_counter()
+    action()
+    end = time.perf_counter()
+    return {
+        'step': name,
+        'page': at.session_state['current_page'] if 'current_page' in at.session_state else 'login',
+        'seconds': round(end - start, 4),
+        'peak_rss_mb': round(peak_rss_mb(), 1),
+        'sections': [{'title': title, 'seconds': seconds} for title, seconds in timer.sections(start, end)],
+        'exceptions': [str(exception.value) for exception in at.exception],
+    }
+
+
+def run_role(username, password, timeout):
+    """Log in as one role and render its default page and the general dashboard (child process)"""
+    from streamlit.testing.v1 import AppTest
+
+    timer = SectionTimer()
+    timer.install()
+    at = AppTest.from_file(os.path.join(ROOT, 'app.py'), default_timeout=timeout)
+
+    def log_in():
+        at.text_input[0].input(username)
+        at.text_input[1].input(password)
+        next(button for button in at.button if button.label == "Login").click().run()
+
+    def open_dashboard():
+        next(button for button in at.sidebar.button if button.label == DASHBOARD_BUTTON).click().run()
+
+    steps = [run_step(at, timer, 'startup', at.run)]
+    steps.append(run_step(at, timer, 'first_render', log_in))
+    steps.append(run_step(at, timer, 'rerun', at.run))
+    steps.append(run_step(at, timer, 'dashboard_first_render', open_dashboard))
+    steps.append(run_step(at, timer, 'dashboard_rerun', at.run))
+    return steps
+
+
+def bench_role(work_root, dataset_path, username, password, timeout):
+    """Run one role in a fresh interpreter, with a data folder holding only dataset_path.
+
+    The folder, its database and its columnar copies are created for this
+    run and removed after it, so every role starts as a new container would.
+    """
+    work_dir = tempfile.mkdtemp(prefix=f"{username}_", dir=work_root)
+    try:
+        data_dir = os.path.join(work_dir, 'data')
+        os.makedirs(data_dir)
+        try:
+            os.link(dataset_path, os.path.join(data_dir, os.path.basename(dataset_path)))
+        except OSError:
+            shutil.copy(dataset_path, data_dir)
+        env = dict(os.environ, SENTIMENT_DATA_DIR=data_dir)
+        command = [sys.executable, os.path.abspath(__file__), '--child', username, password,
+                   '--timeout', str(timeout)]
+        process, wall = timed(lambda: subprocess.run(command, cwd=work_dir, env=env, capture_output=True, text=True))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    if process.returncode != 0:
+        raise RuntimeError(f"Benchmark for {username} failed:\n{process.stderr[-2000:]}")
+    return json.loads(process.stdout.strip().splitlines()[-1]), wall
+
+
+def git_commit():
+    """Short hash of the checked-out commit, or None outside a git checkout"""
+    try:
+        process = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True, text=True)
+    except OSError:
+        return None
+    return process.stdout.strip() or None
+
+
+def print_comparison(results, baseline_path):
+    """Print each step's time against the same step in an earlier results file"""
+    with open(baseline_path) as file:
+        baseline = {(run['rows'], run['username'], step['step']): step['seconds']
+                    for run in json.load(file)['runs'] for step in run['steps']}
+    print(f"\nCompared with {baseline_path}")
+    for run in results:
+        for step in run['steps']:
+            before = baseline.get((run['rows'], run['username'], step['step']))
+            if before:
+                print(f"  {run['rows']:>9,} {run['username']:<16} {step['step']:<24} "
+                      f"{before:7.2f}s -> {step['seconds']:7.2f}s  ({step['seconds'] / before:5.2f}x)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Role page startup and first-render benchmark")
+    parser.add_argument('--rows', type=int, nargs='+', default=list(DEFAULT_ROWS), help="Synthetic dataset sizes")
+    parser.add_argument('--roles', nargs='+', default=[user[0] for user in DEFAULT_USERS],
+                        choices=[user[0] for user in DEFAULT_USERS], help="Demo users to log in as")
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT, help="Seconds allowed per script run")
+    parser.add_argument('--work-dir', help="Where datasets and databases are created (default: a temp dir)")
+    parser.add_argument('--sections', type=int, default=3, help="Slowest sections printed per step")
+    parser.add_argument('--json', help="Write the results to this file")
+    parser.add_argument('--compare', help="Earlier --json output to compare against")
+    parser.add_argument('--child', nargs=2, metavar=('USERNAME', 'PASSWORD'), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(run_role(*args.child, args.timeout)))
+        return 0
+
+    passwords = {username: password for username, _, password, _ in DEFAULT_USERS}
+    work_root = args.work_dir or tempfile.mkdtemp(prefix='bench_pages_')
+    os.makedirs(work_root, exist_ok=True)
+    results = []
+    for rows in args.rows:
+        # Datasets are kept in the work dir and reused by later runs with the same --work-dir
+        dataset_path = os.path.join(work_root, f"feedback_{rows}.csv")
+        if not os.path.exists(dataset_path):
+            _, elapsed = timed(lambda: make_dataset(rows).to_csv(dataset_path, index=False))
+            print(f"Wrote {rows:,} synthetic rows to {dataset_path} in {elapsed:.1f}s")
+
+        for username in args.roles:
+            steps, wall = bench_role(work_root, dataset_path, username, passwords[username], args.timeout)
+            results.append({'rows': rows, 'username': username, 'process_seconds': round(wall, 4), 'steps': steps})
+            print(f"{rows:>9,} rows  {username:<16} process {wall:6.2f}s")
+            for step in steps:
+                slowest = sorted(step['sections'], key=lambda section: section['seconds'], reverse=True)
+                print(f"    {step['step']:<24} {step['page']:<10} {step['seconds']:7.2f}s  "
+                      f"rss {step['peak_rss_mb']:7.1f} MB"
+                      + (f"  EXCEPTIONS: {step['exceptions']}" if step['exceptions'] else ''))
+                for section in slowest[:args.sections]:
+                    print(f"        {section['seconds']:7.3f}s  {section['title']}")
+
+    if args.compare:
+        print_comparison(results, args.compare)
+
+    if args.json:
+        with open(args.json, 'w') as file:
+            json.dump({'commit': git_commit(), 'python': sys.version.split()[0],
+                       'timestamp': pd.Timestamp.now().isoformat(), 'runs': results}, file, indent=2)
+        print(f"✅ Results written to {args.json}")
+
+    return 1 if any(step['exceptions'] for run in results for step in run['steps']) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Measure cold-start import time of the app and its pages against a budget.
+
+Each target is imported in a fresh interpreter (--runs times, median
+reported), so nothing is shared with an earlier import. For every target
+the script reports the import time, the wall time of the whole process,
+peak RSS, which heavy libraries ended up loaded and the slowest modules
+by self time from `python -X importtime`. A page target imports app.py
+plus that page's module, which is what the first render of the page
+costs a new container.
+
+Exits with 1 when a target is over its budget. Budgets are seconds on a
+developer laptop; scale them for slower machines with --budget-scale.
+
+Usage:
+    python benchmarks/bench_startup.py --runs 3 --json startup.json
+    python benchmarks/bench_startup.py --targets app dashboard --budget-scale 2
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules imported by each target, and its import-time budget in seconds
+TARGETS = {
+    'app': (['app'], 2.0),
+    'dashboard': (['app', 'views.dashboard'], 2.5),
+    'product': (['app', 'views.product'], 2.5),
+    'marketing': (['app', 'views.marketing'], 2.5),
+    'admin': (['app', 'views.admin'], 3.0),
+    'batch_scorer': (['batch_scorer'], 1.0),
+    'scoring_service': (['scoring_service'], 1.0),
+}
+# Libraries that should only be loaded by the pages that use them (plotly is not
+# listed: streamlit imports it itself whenever it is installed)
+HEAVY_MODULES = ('sklearn', 'scipy', 'matplotlib', 'reportlab', 'wordcloud')
+
+CHILD_SCRIPT = """
+import json, resource, sys, time
+start = time.perf_counter()
+for name in {modules!r}:
+    __import__(name)
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    'import_seconds': elapsed,
+    'max_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    'heavy_modules': [name for name in {heavy!r} if name in sys.modules],
+}}))
+"""
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def slowest_imports(importtime_output, top):
+    """(module, self seconds) of the slowest imports in `-X importtime` output"""
+    timings = []
+    for line in importtime_output.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, _, name = line[len('import time:'):].split('|')
+        timings.append((name.strip(), int(self_us) / 1e6))
+    return sorted(timings, key=lambda item: item[1], reverse=True)[:top]
+
+
+def run_target(modules, importtime=False):
+    """Import modules in a fresh interpreter from the repo root; returns (result, wall seconds, stderr)"""
+    command = [sys.executable]
+    if importtime:
+        command += ['-X', 'importtime']
+    command += ['-c', CHILD_SCRIPT.format(modules=modules, heavy=HEAVY_MODULES)]
+    process, wall = timed(lambda: subprocess.run(command, cwd=ROOT, capture_output=True, text=True))
+    if process.returncode != 0:
+        raise RuntimeError(f"Importing {', '.join(modules)} failed:\n{process.stderr[-2000:]}")
+    return json.loads(process.stdout.strip().splitlines()[-1]), wall, process.stderr
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Startup import-time benchmark")
+    parser.add_argument('--targets', nargs='+', choices=sorted(TARGETS), default=list(TARGETS))
+    parser.add_argument('--runs', type=int, default=3, help="Fresh interpreters per target")
+    parser.add_argument('--budget-scale', type=float, default=1.0, help="Multiply every budget by this")
+    parser.add_argument('--top', type=int, default=5, help="Slowest imports listed per target")
+    parser.add_argument('--json', help="Write the results to this file")
+    args = parser.parse_args(argv)
+
+    # Warm the OS file cache so the first target is not charged for it
+    run_target(['app'])
+    print(f"Cold-start imports, median of {args.runs} fresh interpreters")
+
+    results = []
+    for target in args.targets:
+        modules, budget = TARGETS[target]
+        budget *= args.budget_scale
+        runs = [run_target(modules) for _ in range(args.runs)]
+        last, _, stderr = run_target(modules, importtime=True)
+        import_seconds = statistics.median(result['import_seconds'] for result, _, _ in runs)
+        results.append({
+            'target': target,
+            'modules': modules,
+            'import_seconds': round(import_seconds, 4),
+            'wall_seconds': round(statistics.median(wall for _, wall, _ in runs), 4),
+            'max_rss_mb': round(max(result['max_rss_mb'] for result, _, _ in runs), 1),
+            'heavy_modules': last['heavy_modules'],
+            'budget_seconds': budget,
+            'within_budget': import_seconds <= budget,
+            'slowest_imports': [{'module': name, 'self_seconds': round(seconds, 4)}
+                                for name, seconds in slowest_imports(stderr, args.top)],
+        })
+        entry = results[-1]
+        print(f"  {target:<16} {import_seconds:6.2f}s / {budget:4.1f}s budget  "
+              f"wall {entry['wall_seconds']:5.2f}s  rss {entry['max_rss_mb']:6.1f} MB  "
+              f"{'OK  ' if entry['within_budget'] else 'OVER'}  "
+              f"heavy: {', '.join(entry['heavy_modules']) or '-'}")
+        for item in entry['slowest_imports']:
+            print(f"      {item['self_seconds']:6.3f}s  {item['module']}")
+
+    if args.json:
+        with open(args.json, 'w') as file:
+            json.dump({'python': sys.version.split()[0], 'runs': args.runs,
+                       'budget_scale': args.budget_scale, 'results': results}, file, indent=2)
+        print(f"✅ Results written to {args.json}")
+
+    return 0 if all(entry['within_budget'] for entry in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Benchmark the batch text cleaner against the row-wise Series.apply path.
+
+Checks that both produce identical output on data/Tweets.csv (replicated
+--repeat times) and reports the speedup.
+
+Usage:
+    python benchmarks/bench_text_cleaning.py --repeat 10 --workers 4
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+from text_cleaning import clean_text_for_training, clean_text_series
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Text cleaning benchmark")
+    parser.add_argument('--data', default=os.path.join(ROOT, 'data', 'Tweets.csv'))
+    parser.add_argument('--column', default='text')
+    parser.add_argument('--repeat', type=int, default=10, help="Replicate the dataset this many times")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+
+    texts = pd.read_csv(args.data, usecols=[args.column])[args.column]
+    texts = pd.concat([texts] * args.repeat, ignore_index=True)
+    print(f"Cleaning {len(texts):,} rows from {args.data}")
+
+    baseline, baseline_time = timed(lambda: texts.apply(clean_text_for_training))
+    print(f"  Series.apply          {baseline_time:7.3f}s")
+
+    runs = [('batch, 1 process', 1)]
+    if args.workers > 1:
+        runs.append((f'batch, {args.workers} processes', args.workers))
+
+    all_match = True
+    for label, workers in runs:
+        cleaned, elapsed = timed(lambda: clean_text_series(texts, workers=workers))
+        match = cleaned.tolist() == baseline.tolist()
+        all_match = all_match and match
+        print(f"  {label:<21} {elapsed:7.3f}s  speedup {baseline_time / elapsed:5.2f}x  "
+              f"parity {'OK' if match else 'MISMATCH'}")
+
+    return 0 if all_match else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
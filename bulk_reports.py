@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Bulk report generation: one report per product (or airline, brand, campaign).
+
+The dataset is reduced to the columns the reports use and grouped once;
+each group's report is then built in a process pool whose workers create
+the ReportLab styles a single time and reuse them for every report they
+build. The reports land in a fresh directory together with a manifest.json,
+optionally packed into a zip.
+
+Usage:
+    python bulk_reports.py data/Tweets.csv --group-column airline --workers 4 --zip
+    python bulk_reports.py data/sales.csv --report-type marketing --group-column campaign
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+
+import pandas as pd
+
+from report_generator import REPORT_EXTENSION, REPORTLAB_AVAILABLE, ReportGenerator, safe_file_name
+from schema_inference import SAMPLE_ROWS, infer_sentiment_column
+
+# Columns tried, in order, when no group column is given
+GROUP_COLUMNS = ('product', 'airline', 'brand', 'campaign')
+REPORT_TYPES = ('product', 'marketing')
+MANIFEST_NAME = 'manifest.json'
+
+
+def find_group_column(columns):
+    """First column named like a product, airline, brand or campaign"""
+    by_name = {str(col).lower(): col for col in columns}
+    return next((by_name[name] for name in GROUP_COLUMNS if name in by_name), None)
+
+
+def _file_name(report_type, name, taken):
+    """Unique report file name for a group within one bulk run"""
+    safe = safe_file_name(name)
+    file_name = f"{report_type}_report_{safe}.{REPORT_EXTENSION}"
+    suffix = 1
+    while file_name in taken:
+        suffix += 1
+        file_name = f"{report_type}_report_{safe}_{suffix}.{REPORT_EXTENSION}"
+    taken.add(file_name)
+    return file_name
+
+
+def report_frames(df, group_col, sentiment_col=None, date_col=None):
+    """Yield (group name, report frame) pairs from one groupby pass.
+
+    Each frame holds only the columns a report reads, renamed to the
+    'sentiment' and 'date' names the report generator expects.
+    """
+    columns = {col: target for col, target in ((sentiment_col, 'sentiment'), (date_col, 'date')) if col}
+    slim = df[[group_col] + list(columns)].rename(columns=columns)
+    for name, group in slim.groupby(group_col, sort=True):
+        yield name, group.drop(columns=[group_col])
+
+
+# Worker process state - each worker creates its generator and styles once in its initializer
+_generator = None
+
+
+def _init_worker():
+    """Create the report generator and its ReportLab styles once per worker process"""
+    global _generator
+    _generator = ReportGenerator()
+    if REPORTLAB_AVAILABLE:
+        _generator.styles
+
+
+def _build_report(report_type, name, data, output_path):
+    """Build one report inside a worker; returns (output path, error message or None)"""
+    generator = _generator or ReportGenerator()
+    try:
+        generator.build_report(report_type, data, name, output_path)
+        return output_path, None
+    except Exception as e:
+        return output_path, str(e)
+
+
+def generate_bulk_reports(df, group_col, output_dir, report_type='product', workers=1,
+                          sentiment_col=None, date_col=None, zip_output=False, progress_callback=None):
+    """Build a report per group of df into output_dir and return the manifest.
+
+    sentiment_col defaults to the inferred sentiment column and date_col to
+    a 'date' column if there is one. The manifest lists every group with its
+    file, row count and error (None on success); with zip_output the
+    directory is also packed into output_dir + '.zip', recorded as 'zip'.
+    """
+    if report_type not in REPORT_TYPES:
+        raise ValueError(f"Unknown report type: {report_type}")
+    if group_col not in df.columns:
+        raise ValueError(f"Group column not found: {group_col}")
+    if sentiment_col is None:
+        sentiment_col = infer_sentiment_column(df)
+    if date_col is None and 'date' in df.columns:
+        date_col = 'date'
+
+    os.makedirs(output_dir, exist_ok=True)
+    taken = set()
+    jobs = [(str(name), data, os.path.join(output_dir, _file_name(report_type, name, taken)))
+            for name, data in report_frames(df, group_col, sentiment_col, date_col)]
+
+    entries = {}
+    workers = max(1, min(int(workers or 1), len(jobs)))
+    if workers == 1:
+        _init_worker()
+        for name, data, path in jobs:
+            entries[path] = _build_report(report_type, name, data, path)
+            if progress_callback:
+                progress_callback(len(entries), len(jobs))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            futures = {pool.submit(_build_report, report_type, name, data, path): path
+                       for name, data, path in jobs}
+            for future in as_completed(futures):
+                entries[futures[future]] = future.result()
+                if progress_callback:
+                    progress_callback(len(entries), len(jobs))
+
+    manifest = {
+        'report_type': report_type,
+        'group_column': group_col,
+        'sentiment_column': sentiment_col,
+        'date_column': date_col,
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'reports': [
+            {
+                'name': name,
+                'file': os.path.basename(path),
+                'rows': len(data),
+                'error': entries[path][1],
+            }
+            for name, data, path in jobs
+        ],
+    }
+    with open(os.path.join(output_dir, MANIFEST_NAME), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+
+    if zip_output:
+        manifest['zip'] = shutil.make_archive(output_dir, 'zip', output_dir)
+    return manifest
+
+
+def bulk_output_dir(reports_dir, report_type):
+    """Fresh directory for one bulk run, unique even for runs started in the same second"""
+    stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    return os.path.join(reports_dir, f"bulk_{report_type}_{stamp}_{uuid.uuid4().hex[:8]}")
+
+
+def read_report_columns(csv_path, group_col=None, sentiment_col=None, date_col=None):
+    """Read only the columns a bulk run needs; returns (frame, group, sentiment, date column)"""
+    sample = pd.read_csv(csv_path, nrows=SAMPLE_ROWS)
+    group_col = group_col or find_group_column(sample.columns)
+    if group_col is None:
+        raise ValueError(f"No group column found - pass --group-column (tried {', '.join(GROUP_COLUMNS)})")
+    sentiment_col = sentiment_col or infer_sentiment_column(sample)
+    date_col = date_col or ('date' if 'date' in sample.columns else None)
+    columns = list(dict.fromkeys(col for col in (group_col, sentiment_col, date_col) if col))
+    return pd.read_csv(csv_path, usecols=columns), group_col, sentiment_col, date_col
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a report for every product or campaign")
+    parser.add_argument('input', help="Dataset CSV path")
+    parser.add_argument('--report-type', choices=REPORT_TYPES, default='product')
+    parser.add_argument('--group-column', help=f"Column to report on (default: first of {', '.join(GROUP_COLUMNS)})")
+    parser.add_argument('--sentiment-column', help="Sentiment column (default: inferred)")
+    parser.add_argument('--date-column', help="Date column (default: 'date' if present)")
+    parser.add_argument('--output-dir', help="Directory for the reports (default: a new folder under reports/)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="Number of report processes")
+    parser.add_argument('--zip', action='store_true', help="Also pack the reports and manifest into a zip")
+    args = parser.parse_args(argv)
+
+    start = time.time()
+    df, group_col, sentiment_col, date_col = read_report_columns(args.input, args.group_column,
+                                                                 args.sentiment_column, args.date_column)
+    output_dir = args.output_dir or bulk_output_dir('reports', args.report_type)
+
+    def report(done, total):
+        print(f"  built {done:,} / {total:,} reports")
+
+    manifest = generate_bulk_reports(df, group_col, output_dir, report_type=args.report_type,
+                                     workers=args.workers, sentiment_col=sentiment_col,
+                                     date_col=date_col, zip_output=args.zip,
+                                     progress_callback=report)
+    failed = [entry for entry in manifest['reports'] if entry['error']]
+    for entry in failed:
+        print(f"  ❌ {entry['name']}: {entry['error']}")
+    print(f"✅ Built {len(manifest['reports']) - len(failed):,} reports by {group_col} "
+          f"in {time.time() - start:.1f}s → {manifest.get('zip', output_dir)}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
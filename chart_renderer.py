@@ -0,0 +1,168 @@
+import io
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+# Memory budget for rendered charts, overridable with the CHART_CACHE_MB env var
+DEFAULT_MAX_MB = 64
+# Figures rendered at once across all sessions
+RENDER_WORKERS = 4
+DPI = 100
+
+
+def chart_key(dataset_path, chart, **filters):
+    """Cache key for a chart: the dataset file version, the chart and its filter state"""
+    stat = os.stat(dataset_path)
+    return (os.path.abspath(dataset_path), stat.st_mtime_ns, stat.st_size, chart,
+            tuple(sorted((name, str(value)) for name, value in filters.items())))
+
+
+def render_png(draw, figsize=(8, 6)):
+    """Draw a chart on a fresh Figure and return it as PNG bytes.
+
+    draw(fig) adds the axes and artists. The Figure is not registered with
+    pyplot, so no global state is touched and it is freed with the last
+    reference; PNG output always goes through the Agg canvas. Matplotlib
+    is imported on the first render, so pages showing only Plotly charts
+    never load it.
+    """
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=figsize, dpi=DPI, layout='tight')
+    draw(fig)
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png')
+    return buffer.getvalue()
+
+
+class ChartRenderer:
+    """Process-wide cache of rendered charts with a pool of render threads.
+
+    Matplotlib charts are rendered to PNG by worker threads; Plotly charts
+    are kept as the built figure, shared read-only by every session. Both
+    are cached by key (see chart_key), so a rerun with the same dataset and
+    filters serves the stored chart without recomputing its data or drawing
+    it again - chart callables should do their own aggregation for that
+    reason. A key of None renders without caching. Concurrent requests for
+    the same key share one render.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_MB * 1024 * 1024, workers=RENDER_WORKERS):
+        self.max_bytes = max_bytes
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='chart-render')
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> (PNG bytes or Plotly figure, size in bytes)
+        self._pending = {}  # key -> Future of a render in progress
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _cached(self, key):
+        """Cached value for key, or None; caller holds the lock"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def _store(self, key, value, size):
+        """Insert a rendered chart and evict least recently used ones over the budget"""
+        with self._lock:
+            self._pending.pop(key, None)
+            if size > self.max_bytes or key in self._entries:
+                return
+            self._entries[key] = (value, size)
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_size
+
+    def submit(self, key, draw, figsize=(8, 6)):
+        """Start rendering a matplotlib chart; returns a Future of its PNG bytes.
+
+        Submitting several charts before waiting on them renders them in
+        parallel.
+        """
+        if key is None:
+            return self._executor.submit(render_png, draw, figsize)
+
+        with self._lock:
+            value = self._cached(key)
+            if value is None:
+                future = self._pending.get(key)
+                if future is not None:
+                    return future
+                self.misses += 1
+                future = self._executor.submit(render_png, draw, figsize)
+                self._pending[key] = future
+        if value is not None:
+            cached = Future()
+            cached.set_result(value)
+            return cached
+
+        def store(finished):
+            if finished.exception() is None:
+                png = finished.result()
+                self._store(key, png, len(png))
+            else:
+                with self._lock:
+                    self._pending.pop(key, None)
+
+        future.add_done_callback(store)
+        return future
+
+    def png(self, key, draw, figsize=(8, 6)):
+        """PNG bytes of a matplotlib chart, from cache or rendered on a worker thread"""
+        return self.submit(key, draw, figsize).result()
+
+    def plotly(self, key, build):
+        """Plotly figure for a chart, built by build() only on a cache miss.
+
+        The returned figure may be shared with other sessions - display it,
+        do not modify it.
+        """
+        if key is not None:
+            with self._lock:
+                fig = self._cached(key)
+                if fig is None:
+                    self.misses += 1
+            if fig is not None:
+                return fig
+
+        fig = build()
+        if key is not None:
+            self._store(key, fig, len(fig.to_json()))
+        return fig
+
+    def clear(self):
+        """Drop every cached chart"""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self):
+        """Counters for the admin System Health section"""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self.current_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+            }
+
+
+_renderer = None
+_renderer_lock = threading.Lock()
+
+
+def get_chart_renderer():
+    """Return the process-wide chart renderer"""
+    global _renderer
+    with _renderer_lock:
+        if _renderer is None:
+            max_mb = float(os.environ.get('CHART_CACHE_MB', DEFAULT_MAX_MB))
+            _renderer = ChartRenderer(int(max_mb * 1024 * 1024))
+        return _renderer
@@ -0,0 +1,108 @@
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+# Applied to every new connection. WAL lets dashboard readers run while a
+# writer commits; synchronous=NORMAL is safe with WAL and skips an fsync per
+# commit. cache_size is negative = KiB.
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA temp_store=MEMORY",
+)
+
+DEFAULT_POOL_SIZE = 8
+# Seconds to wait for a lock held by another writer before "database is locked"
+BUSY_TIMEOUT = 30
+
+
+class ConnectionPool:
+    """Thread-safe pool of SQLite connections for one database file.
+
+    A connection is only ever used by one thread at a time: it is checked out
+    with connection() and returned to the pool when the block exits.
+    """
+
+    def __init__(self, db_path, max_size=DEFAULT_POOL_SIZE, busy_timeout=BUSY_TIMEOUT):
+        self.db_path = db_path
+        self.max_size = max_size
+        self.busy_timeout = busy_timeout
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        """Start with an empty pool (also used after a fork)"""
+        self._pid = os.getpid()
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(self.max_size)
+        self.created = 0
+
+    def _connect(self):
+        """Open a new tuned connection"""
+        conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout, check_same_thread=False)
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        with self._lock:
+            self.created += 1
+        return conn
+
+    @contextmanager
+    def connection(self):
+        """Check out a connection; commit on success, roll back on error"""
+        with self._lock:
+            # Connections must not be shared with a forked child process
+            if self._pid != os.getpid():
+                self._reset()
+            slots, idle = self._slots, self._idle
+
+        if not slots.acquire(timeout=self.busy_timeout):
+            raise TimeoutError(f"No free database connection for {self.db_path}")
+        try:
+            try:
+                conn = idle.get_nowait()
+            except queue.Empty:
+                conn = self._connect()
+
+            try:
+                yield conn
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+            finally:
+                idle.put(conn)
+        finally:
+            slots.release()
+
+    def stats(self):
+        """Pool usage numbers for the health dashboard"""
+        return {
+            'created': self.created,
+            'idle': self._idle.qsize(),
+            'max_size': self.max_size,
+        }
+
+    def close_all(self):
+        """Close every idle connection"""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_path):
+    """Return the process-wide pool for a database file"""
+    key = os.path.abspath(db_path)
+    with _pools_lock:
+        if key not in _pools:
+            _pools[key] = ConnectionPool(db_path)
+        return _pools[key]
@@ -1,20 +1,49 @@
-import sqlite3
 import pandas as pd
 from datetime import datetime
 import os
+import sqlite3
+
+from connection_pool import get_pool
+from log_writer import get_log_writer
+from search_index import row_range
+
+# Columns accepted by insert_feedback_batch
+FEEDBACK_COLUMNS = ('user_id', 'product_id', 'platform', 'text', 'sentiment', 'predicted_sentiment', 'confidence',
+                    'date', 'campaign_id')
+FEEDBACK_INSERT_BATCH_SIZE = 5000
+
+# Feedback columns that may be used for grouping and equality filters
+FEEDBACK_GROUP_COLUMNS = ('sentiment', 'platform', 'product_id', 'campaign_id', 'user_id')
 
 class DatabaseManager:
     def __init__(self, db_path='data/sentiment_system.db'):
         self.db_path = db_path
+        self.pool = get_pool(db_path)
+        self.log_writer = get_log_writer(db_path)
         self.init_database()
     
+    def connection(self):
+        """Check out a pooled connection (use as a context manager)"""
+        return self.pool.connection()
+    
     def init_database(self):
         """Initialize database with required tables"""
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self.connection() as conn:
+            self._create_tables(conn.cursor())
         
+        try:
+            with self.connection() as conn:
+                self._create_search_tables(conn.cursor())
+            self.fts_available = True
+        except sqlite3.OperationalError as e:
+            # SQLite built without FTS5 - search falls back to scanning
+            print(f"Full-text search unavailable: {e}")
+            self.fts_available = False
+    
+    def _create_tables(self, cursor):
+        """Create tables if they do not exist yet"""
         # Users table
         cursor.execute('''
         CREATE TABLE IF NOT EXISTS users (
@@ -36,6 +65,7 @@ class DatabaseManager:
             platform TEXT,
             text TEXT,
             sentiment TEXT,
+            predicted_sentiment TEXT,
             confidence REAL,
             date TIMESTAMP,
             campaign_id TEXT,
@@ -43,6 +73,62 @@ class DatabaseManager:
         )
         ''')
         
+        # Model predictions live apart from the human sentiment labels; add the column to older databases
+        feedback_columns = [row[1] for row in cursor.execute('PRAGMA table_info(feedback)')]
+        if 'predicted_sentiment' not in feedback_columns:
+            cursor.execute('ALTER TABLE feedback ADD COLUMN predicted_sentiment TEXT')
+        
+        # Indexes for date-range and per-product/campaign/platform aggregates
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_feedback_date ON feedback (date)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_feedback_product_date ON feedback (product_id, date)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_feedback_campaign_date ON feedback (campaign_id, date)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_feedback_platform_sentiment ON feedback (platform, sentiment)')
+        
+        # Token counts per dataset and sentiment label, for word clouds
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS token_frequencies (
+            dataset TEXT NOT NULL,
+            sentiment TEXT NOT NULL,
+            token TEXT NOT NULL,
+            count INTEGER NOT NULL,
+            PRIMARY KEY (dataset, sentiment, token)
+        ) WITHOUT ROWID
+        ''')
+        
+        # Source file and row count each token index was built from
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS token_index_state (
+            dataset TEXT PRIMARY KEY,
+            signature TEXT,
+            rows INTEGER NOT NULL DEFAULT 0,
+            updated_at TIMESTAMP
+        )
+        ''')
+        
+        # Daily sentiment counts per dataset; '' stands for a missing platform or product
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS daily_sentiment_rollup (
+            dataset TEXT NOT NULL,
+            day TEXT NOT NULL,
+            sentiment TEXT NOT NULL,
+            platform TEXT NOT NULL DEFAULT '',
+            product_id TEXT NOT NULL DEFAULT '',
+            count INTEGER NOT NULL,
+            PRIMARY KEY (dataset, day, sentiment, platform, product_id)
+        ) WITHOUT ROWID
+        ''')
+        
+        # Source file and date column each rollup was built from
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS rollup_state (
+            dataset TEXT PRIMARY KEY,
+            signature TEXT,
+            date_column TEXT,
+            rows INTEGER NOT NULL DEFAULT 0,
+            updated_at TIMESTAMP
+        )
+        ''')
+        
         # User activity table
         cursor.execute('''
         CREATE TABLE IF NOT EXISTS user_activity (
@@ -65,68 +151,87 @@ class DatabaseManager:
             timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
         ''')
+    
+    def _create_search_tables(self, cursor):
+        """Create the FTS5 full-text indexes and the triggers that sync them"""
+        existed = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'feedback_fts'").fetchone() is not None
+        
+        # External-content index over feedback.text; prefix indexes speed up "term*" queries
+        cursor.execute('''
+        CREATE VIRTUAL TABLE IF NOT EXISTS feedback_fts 
+        USING fts5(text, content='feedback', content_rowid='feedback_id', prefix='2 3')
+        ''')
+        cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS feedback_fts_insert AFTER INSERT ON feedback BEGIN
+            INSERT INTO feedback_fts (rowid, text) VALUES (new.feedback_id, new.text);
+        END
+        ''')
+        cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS feedback_fts_delete AFTER DELETE ON feedback BEGIN
+            INSERT INTO feedback_fts (feedback_fts, rowid, text) VALUES ('delete', old.feedback_id, old.text);
+        END
+        ''')
+        cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS feedback_fts_update AFTER UPDATE OF text ON feedback BEGIN
+            INSERT INTO feedback_fts (feedback_fts, rowid, text) VALUES ('delete', old.feedback_id, old.text);
+            INSERT INTO feedback_fts (rowid, text) VALUES (new.feedback_id, new.text);
+        END
+        ''')
+        if not existed:
+            # Index feedback stored before the index existed
+            cursor.execute("INSERT INTO feedback_fts (feedback_fts) VALUES ('rebuild')")
         
-        conn.commit()
-        conn.close()
+        # Dataset file rows, one rowid range per dataset (see search_index.row_range)
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS dataset_search_state (
+            dataset_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            dataset TEXT UNIQUE NOT NULL,
+            signature TEXT,
+            rows INTEGER NOT NULL DEFAULT 0
+        )
+        ''')
+        cursor.execute("CREATE VIRTUAL TABLE IF NOT EXISTS dataset_fts USING fts5(text, prefix='2 3')")
     
     def add_user(self, username, email, password_hash, role):
         """Add a user to the database"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-            INSERT OR IGNORE INTO users (username, email, password_hash, role) 
-            VALUES (?, ?, ?, ?)
-            ''', (username, email, password_hash, role))
-            
-            conn.commit()
-            conn.close()
+            with self.connection() as conn:
+                conn.execute('''
+                INSERT OR IGNORE INTO users (username, email, password_hash, role) 
+                VALUES (?, ?, ?, ?)
+                ''', (username, email, password_hash, role))
             return True
         except Exception as e:
             print(f"Error adding user: {e}")
             return False
     
     def log_activity(self, user_id, action, details):
-        """Log user activity"""
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-            INSERT INTO user_activity (user_id, action, details) 
-            VALUES (?, ?, ?)
-            ''', (user_id, action, details))
-            
-            conn.commit()
-            conn.close()
-        except Exception as e:
-            print(f"Error logging activity: {e}")
+        """Log user activity (written in the background)"""
+        self.log_writer.log('user_activity', user_id, action, details)
     
     def log_system_health(self, metric_name, metric_value, status):
-        """Log system health metrics"""
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-            INSERT INTO system_health (metric_name, metric_value, status) 
-            VALUES (?, ?, ?)
-            ''', (metric_name, metric_value, status))
-            
-            conn.commit()
-            conn.close()
-        except Exception as e:
-            print(f"Error logging system health: {e}")
+        """Log system health metrics (written in the background)"""
+        self.log_writer.log('system_health', metric_name, metric_value, status)
+    
+    def flush_logs(self, timeout=None):
+        """Wait until queued activity/health rows are on disk"""
+        return self.log_writer.flush(timeout)
     
-    def insert_feedback_batch(self, feedback_df):
-        """Insert batch feedback data"""
+    def insert_feedback_batch(self, feedback_df, batch_size=FEEDBACK_INSERT_BATCH_SIZE):
+        """Insert batch feedback data with executemany in sized transactions"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            columns = [col for col in FEEDBACK_COLUMNS if col in feedback_df.columns]
+            values = feedback_df[columns].copy()
+            for col in values.columns:
+                if pd.api.types.is_datetime64_any_dtype(values[col]):
+                    values[col] = values[col].map(lambda value: None if pd.isna(value) else str(value))
+            rows = values.astype(object).where(values.notna(), None).values.tolist()
             
-            feedback_df.to_sql('feedback', conn, if_exists='append', index=False)
-            
-            conn.close()
+            query = f"INSERT INTO feedback ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+            for start in range(0, len(rows), batch_size):
+                with self.connection() as conn:
+                    conn.executemany(query, rows[start:start + batch_size])
             return True
         except Exception as e:
             print(f"Error inserting feedback batch: {e}")
@@ -135,25 +240,479 @@ class DatabaseManager:
     def get_feedback_data(self, limit=None):
         """Get feedback data from database"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            
             query = "SELECT * FROM feedback ORDER BY date DESC"
             if limit:
-                query += f" LIMIT {limit}"
-                
-            df = pd.read_sql(query, conn)
-            conn.close()
+                query += f" LIMIT {int(limit)}"
             
-            return df
+            with self.connection() as conn:
+                return pd.read_sql(query, conn)
         except Exception as e:
             print(f"Error getting feedback data: {e}")
             return pd.DataFrame()
     
+    def _feedback_filter(self, start=None, end=None, **filters):
+        """Build a WHERE clause for feedback queries.
+
+        start is inclusive and end exclusive; filters match columns exactly.
+        """
+        clauses, params = [], []
+        if start is not None:
+            clauses.append("date >= ?")
+            params.append(str(pd.Timestamp(start)))
+        if end is not None:
+            clauses.append("date < ?")
+            params.append(str(pd.Timestamp(end)))
+        for column, value in filters.items():
+            if column not in FEEDBACK_GROUP_COLUMNS:
+                raise ValueError(f"Cannot filter feedback by {column!r}")
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
+    
+    def _group_columns(self, by):
+        """Validate grouping columns (they are interpolated into SQL)"""
+        if by is None:
+            return []
+        columns = [by] if isinstance(by, str) else list(by)
+        for column in columns:
+            if column not in FEEDBACK_GROUP_COLUMNS:
+                raise ValueError(f"Cannot group feedback by {column!r}")
+        return columns
+    
+    def get_all_users(self):
+        """Get registered users, without their password hashes"""
+        try:
+            with self.connection() as conn:
+                return pd.read_sql(
+                    "SELECT user_id, username, email, role, created_at FROM users ORDER BY user_id", conn)
+        except Exception as e:
+            print(f"Error getting users: {e}")
+            return pd.DataFrame()
+    
+    def count_users(self):
+        """Count registered users"""
+        try:
+            with self.connection() as conn:
+                return conn.execute("SELECT COUNT(*) FROM users").fetchone()[0]
+        except Exception as e:
+            print(f"Error counting users: {e}")
+            return 0
+    
+    def get_max_feedback_id(self):
+        """Highest feedback_id in the table, 0 when it is empty"""
+        try:
+            with self.connection() as conn:
+                return conn.execute("SELECT COALESCE(MAX(feedback_id), 0) FROM feedback").fetchone()[0]
+        except Exception as e:
+            print(f"Error getting max feedback id: {e}")
+            return 0
+    
+    def count_feedback(self, start=None, end=None, **filters):
+        """Count feedback rows, optionally within a date range and filters"""
+        where, params = self._feedback_filter(start, end, **filters)
+        try:
+            with self.connection() as conn:
+                return conn.execute(f"SELECT COUNT(*) FROM feedback{where}", params).fetchone()[0]
+        except Exception as e:
+            print(f"Error counting feedback: {e}")
+            return 0
+    
+    def sentiment_counts(self, by=None, start=None, end=None, **filters):
+        """Count feedback per sentiment, optionally grouped by other columns"""
+        group_columns = [col for col in self._group_columns(by) if col != 'sentiment'] + ['sentiment']
+        where, params = self._feedback_filter(start, end, **filters)
+        query = f"""
+        SELECT {', '.join(group_columns)}, COUNT(*) AS count 
+        FROM feedback{where} 
+        GROUP BY {', '.join(group_columns)} 
+        ORDER BY {', '.join(group_columns)}
+        """
+        
+        try:
+            with self.connection() as conn:
+                return pd.read_sql(query, conn, params=params)
+        except Exception as e:
+            print(f"Error getting sentiment counts: {e}")
+            return pd.DataFrame(columns=group_columns + ['count'])
+    
+    def daily_series(self, start=None, end=None, by='sentiment', **filters):
+        """Daily feedback counts, one row per (day, group) combination"""
+        group_columns = self._group_columns(by)
+        select = ', '.join(['date(date) AS day'] + group_columns)
+        group = ', '.join(['day'] + group_columns)
+        where, params = self._feedback_filter(start, end, **filters)
+        query = f"""
+        SELECT {select}, COUNT(*) AS count 
+        FROM feedback{where} 
+        GROUP BY {group} 
+        ORDER BY {group}
+        """
+        
+        try:
+            with self.connection() as conn:
+                return pd.read_sql(query, conn, params=params)
+        except Exception as e:
+            print(f"Error getting daily series: {e}")
+            return pd.DataFrame(columns=['day'] + group_columns + ['count'])
+    
+    def get_unscored_feedback(self, after_id=0, limit=10000, include_scored=False):
+        """Get the next page of feedback rows without a confidence score (or every row with include_scored)"""
+        try:
+            query = f'''
+            SELECT feedback_id, text FROM feedback 
+            WHERE {'1 = 1' if include_scored else 'confidence IS NULL'} AND feedback_id > ? 
+            ORDER BY feedback_id 
+            LIMIT ?
+            '''
+            
+            with self.connection() as conn:
+                return pd.read_sql(query, conn, params=(after_id, limit))
+        except Exception as e:
+            print(f"Error getting unscored feedback: {e}")
+            return pd.DataFrame(columns=['feedback_id', 'text'])
+    
+    def get_labeled_feedback(self, after_id=0, limit=10000):
+        """Get the next page of feedback rows that have a human sentiment label (predictions are not labels)"""
+        try:
+            query = '''
+            SELECT feedback_id, text, sentiment FROM feedback
+            WHERE sentiment IS NOT NULL AND feedback_id > ?
+            ORDER BY feedback_id
+            LIMIT ?
+            '''
+
+            with self.connection() as conn:
+                return pd.read_sql(query, conn, params=(after_id, limit))
+        except Exception as e:
+            print(f"Error getting labeled feedback: {e}")
+            return pd.DataFrame(columns=['feedback_id', 'text', 'sentiment'])
+
+    def update_feedback_predictions(self, predictions):
+        """Write (feedback_id, sentiment, confidence) predictions back to feedback.
+
+        Predictions go to predicted_sentiment; the human sentiment label is
+        never touched, so the trainer cannot learn from the model's own output.
+        """
+        query = 'UPDATE feedback SET predicted_sentiment = ?, confidence = ? WHERE feedback_id = ?'
+        
+        try:
+            with self.connection() as conn:
+                conn.executemany(query, [
+                    (sentiment, confidence, feedback_id)
+                    for feedback_id, sentiment, confidence in predictions
+                ])
+            return True
+        except Exception as e:
+            print(f"Error updating feedback predictions: {e}")
+            return False
+    
+    def add_token_counts(self, dataset, counts, rows):
+        """Add (sentiment, token, count) rows to a dataset's token index.
+
+        Counts are summed into existing rows with an UPSERT, so the index can
+        be extended chunk by chunk; rows is the number of texts counted.
+        """
+        try:
+            with self.connection() as conn:
+                conn.executemany('''
+                INSERT INTO token_frequencies (dataset, sentiment, token, count) 
+                VALUES (?, ?, ?, ?) 
+                ON CONFLICT (dataset, sentiment, token) DO UPDATE SET count = count + excluded.count
+                ''', [(dataset, str(sentiment), token, int(count)) for sentiment, token, count in counts])
+                conn.execute('''
+                INSERT INTO token_index_state (dataset, rows, updated_at) VALUES (?, ?, ?) 
+                ON CONFLICT (dataset) DO UPDATE SET rows = rows + excluded.rows, updated_at = excluded.updated_at
+                ''', (dataset, int(rows), str(datetime.now())))
+            return True
+        except Exception as e:
+            print(f"Error adding token counts: {e}")
+            return False
+    
+    def get_token_frequencies(self, dataset, sentiments=None, limit=200):
+        """Most frequent tokens of a dataset as {token: count}, optionally for some sentiment labels"""
+        where, params = "dataset = ?", [dataset]
+        if sentiments is not None:
+            sentiments = [str(sentiment) for sentiment in sentiments]
+            where += f" AND sentiment IN ({', '.join('?' * len(sentiments))})"
+            params += sentiments
+        query = f"""
+        SELECT token, SUM(count) AS count 
+        FROM token_frequencies 
+        WHERE {where} 
+        GROUP BY token 
+        ORDER BY count DESC, token 
+        LIMIT ?
+        """
+        
+        try:
+            with self.connection() as conn:
+                return dict(conn.execute(query, params + [int(limit)]).fetchall())
+        except Exception as e:
+            print(f"Error getting token frequencies: {e}")
+            return {}
+    
+    def get_token_index_state(self, dataset):
+        """(signature, rows) of a dataset's token index, or None if it has none"""
+        try:
+            with self.connection() as conn:
+                row = conn.execute("SELECT signature, rows FROM token_index_state WHERE dataset = ?",
+                                   (dataset,)).fetchone()
+            return tuple(row) if row else None
+        except Exception as e:
+            print(f"Error getting token index state: {e}")
+            return None
+    
+    def set_token_index_signature(self, dataset, signature):
+        """Record the source file signature a dataset's token index matches"""
+        try:
+            with self.connection() as conn:
+                conn.execute('''
+                INSERT INTO token_index_state (dataset, signature, updated_at) VALUES (?, ?, ?) 
+                ON CONFLICT (dataset) DO UPDATE SET signature = excluded.signature, updated_at = excluded.updated_at
+                ''', (dataset, signature, str(datetime.now())))
+            return True
+        except Exception as e:
+            print(f"Error setting token index signature: {e}")
+            return False
+    
+    def clear_token_counts(self, dataset):
+        """Drop a dataset's token index"""
+        try:
+            with self.connection() as conn:
+                conn.execute("DELETE FROM token_frequencies WHERE dataset = ?", (dataset,))
+                conn.execute("DELETE FROM token_index_state WHERE dataset = ?", (dataset,))
+            return True
+        except Exception as e:
+            print(f"Error clearing token counts: {e}")
+            return False
+    
+    def add_rollup_counts(self, dataset, counts, rows, date_column=None):
+        """Add (day, sentiment, platform, product_id, count) rows to a dataset's daily rollup.
+
+        Counts are summed into existing days with an UPSERT, so the rollup
+        can be extended chunk by chunk; rows is the number of rows counted.
+        """
+        try:
+            with self.connection() as conn:
+                conn.executemany('''
+                INSERT INTO daily_sentiment_rollup (dataset, day, sentiment, platform, product_id, count) 
+                VALUES (?, ?, ?, ?, ?, ?) 
+                ON CONFLICT (dataset, day, sentiment, platform, product_id) DO UPDATE SET count = count + excluded.count
+                ''', [(dataset, day, str(sentiment), str(platform), str(product_id), int(count))
+                      for day, sentiment, platform, product_id, count in counts])
+                conn.execute('''
+                INSERT INTO rollup_state (dataset, date_column, rows, updated_at) VALUES (?, ?, ?, ?) 
+                ON CONFLICT (dataset) DO UPDATE SET rows = rows + excluded.rows, 
+                    date_column = excluded.date_column, updated_at = excluded.updated_at
+                ''', (dataset, date_column, int(rows), str(datetime.now())))
+            return True
+        except Exception as e:
+            print(f"Error adding rollup counts: {e}")
+            return False
+    
+    def get_daily_rollup(self, dataset, start=None, end=None, sentiments=None, platform=None, product_id=None):
+        """Daily counts per sentiment label of a dataset as (day, sentiment, count) rows.
+
+        start and end are inclusive days; platform and product_id narrow the
+        counts to one platform or product.
+        """
+        clauses, params = ["dataset = ?"], [dataset]
+        if start is not None:
+            clauses.append("day >= ?")
+            params.append(str(pd.Timestamp(start).date()))
+        if end is not None:
+            clauses.append("day <= ?")
+            params.append(str(pd.Timestamp(end).date()))
+        if sentiments is not None:
+            sentiments = [str(sentiment) for sentiment in sentiments]
+            clauses.append(f"sentiment IN ({', '.join('?' * len(sentiments))})")
+            params += sentiments
+        if platform is not None:
+            clauses.append("platform = ?")
+            params.append(str(platform))
+        if product_id is not None:
+            clauses.append("product_id = ?")
+            params.append(str(product_id))
+        query = f"""
+        SELECT day, sentiment, SUM(count) AS count 
+        FROM daily_sentiment_rollup 
+        WHERE {' AND '.join(clauses)} 
+        GROUP BY day, sentiment 
+        ORDER BY day, sentiment
+        """
+        
+        try:
+            with self.connection() as conn:
+                return pd.read_sql(query, conn, params=params)
+        except Exception as e:
+            print(f"Error getting daily rollup: {e}")
+            return pd.DataFrame(columns=['day', 'sentiment', 'count'])
+    
+    def get_rollup_state(self, dataset):
+        """(signature, date_column, rows) of a dataset's rollup, or None if it has none"""
+        try:
+            with self.connection() as conn:
+                row = conn.execute("SELECT signature, date_column, rows FROM rollup_state WHERE dataset = ?",
+                                   (dataset,)).fetchone()
+            return tuple(row) if row else None
+        except Exception as e:
+            print(f"Error getting rollup state: {e}")
+            return None
+    
+    def set_rollup_signature(self, dataset, signature, date_column):
+        """Record the source file signature and date column a dataset's rollup matches"""
+        try:
+            with self.connection() as conn:
+                conn.execute('''
+                INSERT INTO rollup_state (dataset, signature, date_column, updated_at) VALUES (?, ?, ?, ?) 
+                ON CONFLICT (dataset) DO UPDATE SET signature = excluded.signature, 
+                    date_column = excluded.date_column, updated_at = excluded.updated_at
+                ''', (dataset, signature, date_column, str(datetime.now())))
+            return True
+        except Exception as e:
+            print(f"Error setting rollup signature: {e}")
+            return False
+    
+    def clear_rollup(self, dataset):
+        """Drop a dataset's daily rollup"""
+        try:
+            with self.connection() as conn:
+                conn.execute("DELETE FROM daily_sentiment_rollup WHERE dataset = ?", (dataset,))
+                conn.execute("DELETE FROM rollup_state WHERE dataset = ?", (dataset,))
+            return True
+        except Exception as e:
+            print(f"Error clearing rollup: {e}")
+            return False
+    
+    def search_feedback(self, match, limit=20, offset=0):
+        """Feedback rows matching an FTS5 query (see search_index.fts_query), best match first"""
+        columns = ['feedback_id', 'text', 'sentiment', 'platform', 'product_id', 'date', 'rank']
+        if match is None:
+            return pd.DataFrame(columns=columns)
+        query = '''
+        SELECT f.feedback_id, f.text, f.sentiment, f.platform, f.product_id, f.date, feedback_fts.rank AS rank 
+        FROM feedback_fts JOIN feedback f ON f.feedback_id = feedback_fts.rowid 
+        WHERE feedback_fts MATCH ? 
+        ORDER BY feedback_fts.rank 
+        LIMIT ? OFFSET ?
+        '''
+        
+        try:
+            with self.connection() as conn:
+                return pd.read_sql(query, conn, params=(match, -1 if limit is None else limit, offset))
+        except Exception as e:
+            print(f"Error searching feedback: {e}")
+            return pd.DataFrame(columns=columns)
+    
+    def count_feedback_matches(self, match):
+        """Number of feedback rows matching an FTS5 query"""
+        if match is None:
+            return 0
+        try:
+            with self.connection() as conn:
+                return conn.execute("SELECT COUNT(*) FROM feedback_fts WHERE feedback_fts MATCH ?",
+                                    (match,)).fetchone()[0]
+        except Exception as e:
+            print(f"Error counting feedback matches: {e}")
+            return 0
+    
+    def get_dataset_search_state(self, dataset):
+        """(dataset_id, signature, rows) of a dataset's search index, or None if it has none"""
+        try:
+            with self.connection() as conn:
+                row = conn.execute("SELECT dataset_id, signature, rows FROM dataset_search_state WHERE dataset = ?",
+                                   (dataset,)).fetchone()
+            return tuple(row) if row else None
+        except Exception as e:
+            print(f"Error getting dataset search state: {e}")
+            return None
+    
+    def add_dataset_search_rows(self, dataset, texts, start_row):
+        """Index dataset texts as rows start_row, start_row + 1, ..."""
+        try:
+            with self.connection() as conn:
+                conn.execute("INSERT OR IGNORE INTO dataset_search_state (dataset) VALUES (?)", (dataset,))
+                dataset_id = conn.execute("SELECT dataset_id FROM dataset_search_state WHERE dataset = ?",
+                                          (dataset,)).fetchone()[0]
+                first, _ = row_range(dataset_id)
+                conn.executemany("INSERT INTO dataset_fts (rowid, text) VALUES (?, ?)", [
+                    (first + start_row + i, None if pd.isna(text) else str(text))
+                    for i, text in enumerate(texts)
+                ])
+                conn.execute("UPDATE dataset_search_state SET rows = rows + ? WHERE dataset_id = ?",
+                             (len(texts), dataset_id))
+            return True
+        except Exception as e:
+            print(f"Error adding dataset search rows: {e}")
+            return False
+    
+    def set_dataset_search_signature(self, dataset, signature):
+        """Record the source file signature a dataset's search index matches"""
+        try:
+            with self.connection() as conn:
+                conn.execute("UPDATE dataset_search_state SET signature = ? WHERE dataset = ?", (signature, dataset))
+            return True
+        except Exception as e:
+            print(f"Error setting dataset search signature: {e}")
+            return False
+    
+    def clear_dataset_search(self, dataset):
+        """Drop a dataset's rows from the search index"""
+        state = self.get_dataset_search_state(dataset)
+        if state is None:
+            return True
+        try:
+            with self.connection() as conn:
+                conn.execute("DELETE FROM dataset_fts WHERE rowid BETWEEN ? AND ?", row_range(state[0]))
+                conn.execute("UPDATE dataset_search_state SET signature = NULL, rows = 0 WHERE dataset_id = ?",
+                             (state[0],))
+            return True
+        except Exception as e:
+            print(f"Error clearing dataset search: {e}")
+            return False
+    
+    def search_dataset(self, dataset, match, limit=20, offset=0):
+        """Row numbers of a dataset matching an FTS5 query, best match first"""
+        state = self.get_dataset_search_state(dataset)
+        if match is None or state is None:
+            return pd.DataFrame(columns=['row', 'rank'])
+        first, last = row_range(state[0])
+        query = '''
+        SELECT rowid - ? AS row, rank 
+        FROM dataset_fts 
+        WHERE dataset_fts MATCH ? AND rowid BETWEEN ? AND ? 
+        ORDER BY rank 
+        LIMIT ? OFFSET ?
+        '''
+        
+        try:
+            with self.connection() as conn:
+                return pd.read_sql(query, conn, params=(first, match, first, last,
+                                                        -1 if limit is None else limit, offset))
+        except Exception as e:
+            print(f"Error searching dataset: {e}")
+            return pd.DataFrame(columns=['row', 'rank'])
+    
+    def count_dataset_matches(self, dataset, match):
+        """Number of rows of a dataset matching an FTS5 query"""
+        state = self.get_dataset_search_state(dataset)
+        if match is None or state is None:
+            return 0
+        try:
+            with self.connection() as conn:
+                return conn.execute(
+                    "SELECT COUNT(*) FROM dataset_fts WHERE dataset_fts MATCH ? AND rowid BETWEEN ? AND ?",
+                    (match,) + row_range(state[0])).fetchone()[0]
+        except Exception as e:
+            print(f"Error counting dataset matches: {e}")
+            return 0
+    
     def get_user_activity(self, limit=10):
         """Get recent user activity"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            
             query = '''
             SELECT u.username, ua.action, ua.details, ua.timestamp 
             FROM user_activity ua 
@@ -162,10 +721,8 @@ class DatabaseManager:
             LIMIT ?
             '''
             
-            df = pd.read_sql(query, conn, params=(limit,))
-            conn.close()
-            
-            return df
+            with self.connection() as conn:
+                return pd.read_sql(query, conn, params=(limit,))
         except Exception as e:
             print(f"Error getting user activity: {e}")
             return pd.DataFrame()
@@ -0,0 +1,124 @@
+import os
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+# Memory budget for cached frames, overridable with the DATASET_CACHE_MB env var
+DEFAULT_MAX_MB = 512
+
+
+def _read_csv(path, columns=None):
+    """Default loader"""
+    return pd.read_csv(path, usecols=columns)
+
+
+def _fingerprint(path, columns):
+    """Cache key: the file identity plus the requested columns"""
+    stat = os.stat(path)
+    return (os.path.abspath(path), stat.st_mtime_ns, stat.st_size,
+            tuple(columns) if columns is not None else None)
+
+
+class DatasetCache:
+    """Process-wide LRU cache of loaded datasets, bounded by memory.
+
+    Frames are keyed by path, mtime and size, so an edited or replaced file
+    is loaded again, and one copy is shared by every session. Callers get a
+    shallow copy: with pandas copy-on-write, changing it never touches the
+    cached frame, but callers should still derive new frames (assign, filters)
+    rather than modify in place.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_MB * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> (frame, nbytes)
+        self._loading = {}  # key -> lock, so concurrent misses load once
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, path, loader=None, columns=None):
+        """Return the dataset at path, loading it with loader(path, columns=...) on a miss"""
+        key = _fingerprint(path, columns)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0].copy(deep=False)
+            load_lock = self._loading.setdefault(key, threading.Lock())
+
+        with load_lock:
+            # Another session may have finished loading while we waited
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[0].copy(deep=False)
+                self.misses += 1
+
+            frame = (loader or _read_csv)(path, columns=columns)
+            self._store(key, frame)
+
+            with self._lock:
+                self._loading.pop(key, None)
+            return frame.copy(deep=False)
+
+    def _store(self, key, frame):
+        """Insert a frame and evict least recently used ones over the budget"""
+        nbytes = int(frame.memory_usage(index=True, deep=True).sum())
+        if nbytes > self.max_bytes:
+            return
+
+        with self._lock:
+            # Older versions of the same file can never be hit again
+            for stale in [k for k in self._entries if k[0] == key[0] and k[1:3] != key[1:3]]:
+                self._evict(stale)
+
+            self._entries[key] = (frame, nbytes)
+            self.current_bytes += nbytes
+            while self.current_bytes > self.max_bytes:
+                self._evict(next(iter(self._entries)))
+
+    def _evict(self, key):
+        """Drop one entry; caller holds the lock"""
+        _, nbytes = self._entries.pop(key)
+        self.current_bytes -= nbytes
+        self.evictions += 1
+
+    def clear(self):
+        """Drop every cached frame"""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self):
+        """Counters for the admin System Health section"""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self.current_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_dataset_cache():
+    """Return the process-wide dataset cache"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            max_mb = float(os.environ.get('DATASET_CACHE_MB', DEFAULT_MAX_MB))
+            _cache = DatasetCache(int(max_mb * 1024 * 1024))
+        return _cache
@@ -0,0 +1,280 @@
+import itertools
+import json
+import os
+import threading
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from schema_inference import SCHEMA_ATTR, infer_schema
+from sentiment_labels import SENTIMENT_CODE_COLUMN, UNKNOWN, add_sentiment_codes, normalize_labels
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+    import pyarrow.feather as feather
+    import pyarrow.ipc as ipc
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Columnar copies live in a hidden folder next to the CSV files they mirror
+STORE_FOLDER = ".columnar"
+# Bumped when the stored layout changes, so older copies are converted again
+STORE_VERSION = 2
+# Bytes of CSV parsed into each record batch while converting; the reader keeps a
+# few dozen blocks in flight, so this bounds conversion memory
+CONVERT_BLOCK_SIZE = 1024 * 1024
+# Rows per chunk when pyarrow is missing and the CSV is only scanned for metadata
+SCAN_CHUNKSIZE = 100000
+
+
+def file_signature(path):
+    """mtime and size of a dataset file - the columnar copy and every index store it to spot a changed file"""
+    stat = os.stat(path)
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
+_build_locks = {}
+_build_locks_lock = threading.Lock()
+
+
+def build_lock(kind, db_path, dataset):
+    """Process-wide lock held while one kind of index is rebuilt or ingested for a dataset.
+
+    Streamlit sessions are threads, so two first loads of a dataset would
+    otherwise both clear and re-add its counts.
+    """
+    key = (kind, os.path.abspath(db_path), dataset)
+    with _build_locks_lock:
+        if key not in _build_locks:
+            _build_locks[key] = threading.Lock()
+        return _build_locks[key]
+
+
+def _open_csv(csv_path, columns=None, column_types=None):
+    """Streaming Arrow reader over a CSV; column types are inferred from the first block"""
+    return pa_csv.open_csv(
+        csv_path,
+        read_options=pa_csv.ReadOptions(block_size=CONVERT_BLOCK_SIZE),
+        convert_options=pa_csv.ConvertOptions(include_columns=columns or [], column_types=column_types,
+                                              strings_can_be_null=True))
+
+
+def _column_types(csv_path, as_strings=False):
+    """Types to read a CSV with: dates and empty columns stay text, as pd.read_csv leaves them"""
+    reader = _open_csv(csv_path)
+    inferred = reader.schema
+    reader.close()
+    return {field.name: pa.string() if as_strings or pa.types.is_temporal(field.type)
+            or pa.types.is_null(field.type) else field.type
+            for field in inferred}
+
+
+def _label_codes(csv_path, column, column_type):
+    """(distinct labels, their codes) of a column, so every batch is coded on the same scale"""
+    uniques = pa.array([], type=column_type)
+    reader = _open_csv(csv_path, columns=[column], column_types={column: column_type})
+    for batch in reader:
+        uniques = pc.unique(pa.concat_arrays([uniques, pc.unique(batch.column(0))]))
+    reader.close()
+    labels = pd.Index(uniques.drop_null().to_pandas())
+    return labels, np.append(normalize_labels(labels), np.int8(UNKNOWN))
+
+
+def _write_arrow(csv_path, arrow_path, as_strings=False):
+    """Convert a CSV batch by batch into an Arrow IPC file; returns (rows, dtypes, schema)"""
+    column_types = _column_types(csv_path, as_strings)
+    reader = _open_csv(csv_path, column_types=column_types)
+    try:
+        first_batch = reader.read_next_batch()
+    except StopIteration:
+        first_batch = None
+    schema = infer_schema((first_batch if first_batch is not None else reader.schema.empty_table()).to_pandas())
+
+    sentiment_col = schema['sentiment_column']
+    coded = sentiment_col is not None and SENTIMENT_CODE_COLUMN not in reader.schema.names
+    output_schema = reader.schema
+    if coded:
+        labels, codes = _label_codes(csv_path, sentiment_col, column_types[sentiment_col])
+        output_schema = output_schema.append(pa.field(SENTIMENT_CODE_COLUMN, pa.int8()))
+
+    rows = 0
+    with ipc.new_file(arrow_path, output_schema) as writer:
+        for batch in itertools.chain([first_batch], reader) if first_batch is not None else reader:
+            if coded:
+                positions = labels.get_indexer(batch.column(sentiment_col).to_pandas())
+                batch = pa.RecordBatch.from_arrays(batch.columns + [pa.array(codes[positions])],
+                                                   schema=output_schema)
+            writer.write_batch(batch)
+            rows += batch.num_rows
+    reader.close()
+    return rows, output_schema.empty_table().to_pandas().dtypes, schema
+
+
+def _scan_csv(csv_path):
+    """(rows, dtypes, schema) of a CSV read in chunks, for when pyarrow is missing"""
+    rows = 0
+    dtypes = schema = None
+    for chunk in pd.read_csv(csv_path, chunksize=SCAN_CHUNKSIZE):
+        if schema is None:
+            schema = infer_schema(chunk)
+            if schema['sentiment_column'] is not None:
+                chunk = add_sentiment_codes(chunk, schema['sentiment_column'])
+            dtypes = chunk.dtypes
+        rows += len(chunk)
+    return rows, dtypes, schema
+
+
+class DatasetStore:
+    """Columnar cache of the CSV datasets in the data folder.
+
+    Each CSV is converted once into an uncompressed Arrow IPC (Feather v2)
+    file, which is read back memory-mapped and only for the requested columns
+    instead of re-parsing the CSV. Row count, column types and the detected
+    sentiment/text/date columns are kept in a small JSON file so dataset info
+    and schema detection need no data read at all. The sentiment labels are
+    normalized into an int8 sentiment_code column once, when the copy is
+    written. Conversion streams the CSV in record batches, so memory use
+    does not grow with the file. Without pyarrow every call falls back to
+    reading the CSV.
+    """
+
+    def __init__(self, data_folder):
+        self.data_folder = data_folder
+        self.store_folder = os.path.join(data_folder, STORE_FOLDER)
+        self._lock = threading.Lock()
+        # csv path -> metadata dict, so reruns skip reading the JSON file
+        self._metadata = {}
+
+    def _paths(self, csv_path):
+        """(arrow path, metadata path) for a CSV file"""
+        stem = os.path.splitext(os.path.basename(csv_path))[0]
+        return (os.path.join(self.store_folder, f"{stem}.arrow"),
+                os.path.join(self.store_folder, f"{stem}.json"))
+
+    def _resolve(self, dataset):
+        """Accept a file name in the data folder or a full path"""
+        if os.path.dirname(dataset):
+            return dataset
+        return os.path.join(self.data_folder, dataset)
+
+    def convert(self, dataset):
+        """Write the columnar copy and metadata for a CSV; returns the metadata"""
+        csv_path = self._resolve(dataset)
+        signature = file_signature(csv_path)
+        os.makedirs(self.store_folder, exist_ok=True)
+        arrow_path, metadata_path = self._paths(csv_path)
+
+        if PYARROW_AVAILABLE:
+            tmp_path = f"{arrow_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            try:
+                rows, dtypes, schema = _write_arrow(csv_path, tmp_path)
+            except pa.ArrowInvalid:
+                # A later block did not match the types inferred from the first one
+                rows, dtypes, schema = _write_arrow(csv_path, tmp_path, as_strings=True)
+            os.replace(tmp_path, arrow_path)
+        else:
+            rows, dtypes, schema = _scan_csv(csv_path)
+
+        metadata = {
+            'store_version': STORE_VERSION,
+            'source': os.path.basename(csv_path),
+            'source_signature': signature,
+            'rows': rows,
+            'columns': {col: str(dtype) for col, dtype in dtypes.items()},
+            'schema': schema,
+            'source_size_bytes': os.path.getsize(csv_path),
+            'format': 'arrow' if PYARROW_AVAILABLE else 'csv',
+            'converted_at': datetime.now().isoformat(timespec='seconds'),
+        }
+
+        tmp_path = f"{metadata_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(metadata, f, indent=2)
+        os.replace(tmp_path, metadata_path)
+
+        with self._lock:
+            self._metadata[csv_path] = metadata
+        return metadata
+
+    def info(self, dataset):
+        """Cached metadata (rows, columns, dtypes), converting if missing or stale"""
+        csv_path = self._resolve(dataset)
+        signature = file_signature(csv_path)
+
+        metadata = self._metadata.get(csv_path)
+        if metadata is None:
+            try:
+                with open(self._paths(csv_path)[1], 'r', encoding='utf-8') as f:
+                    metadata = json.load(f)
+            except (FileNotFoundError, ValueError):
+                metadata = None
+
+        stale = (metadata is None or metadata['source_signature'] != signature
+                 or metadata.get('store_version') != STORE_VERSION
+                 or (PYARROW_AVAILABLE and metadata['format'] != 'arrow')
+                 or (metadata['format'] == 'arrow' and not os.path.exists(self._paths(csv_path)[0])))
+        if stale:
+            return self.convert(csv_path)
+
+        with self._lock:
+            self._metadata[csv_path] = metadata
+        return metadata
+
+    def load(self, dataset, columns=None):
+        """Load a dataset, optionally only some columns, from the columnar copy"""
+        csv_path = self._resolve(dataset)
+        metadata = self.info(csv_path)
+        if metadata['format'] != 'arrow':
+            df = pd.read_csv(csv_path, usecols=columns)
+        else:
+            df = feather.read_table(self._paths(csv_path)[0], columns=columns, memory_map=True).to_pandas()
+
+        # The columnar copy already has the codes; the CSV fallback gets them here
+        sentiment_col = metadata['schema']['sentiment_column']
+        if columns is None or SENTIMENT_CODE_COLUMN in columns:
+            df = add_sentiment_codes(df, sentiment_col) if sentiment_col else df
+
+        # Lets get_schema() skip inference for this frame and frames derived from it
+        df.attrs[SCHEMA_ATTR] = metadata['schema']
+        return df
+
+    def schema(self, dataset):
+        """Detected sentiment/text/date columns, computed once per file version"""
+        return self.info(dataset)['schema']
+
+    def head(self, dataset, n=5):
+        """First rows of a dataset without loading the rest"""
+        csv_path = self._resolve(dataset)
+        metadata = self.info(csv_path)
+        if metadata['format'] != 'arrow':
+            return pd.read_csv(csv_path, nrows=n)
+
+        with pa.memory_map(self._paths(csv_path)[0]) as source:
+            reader = ipc.open_file(source)
+            batches = []
+            rows = 0
+            for i in range(reader.num_record_batches):
+                if rows >= n:
+                    break
+                batch = reader.get_batch(i)
+                batches.append(batch)
+                rows += batch.num_rows
+            table = pa.Table.from_batches(batches, schema=reader.schema) if batches else reader.schema.empty_table()
+            return table.slice(0, n).to_pandas()
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def get_dataset_store(data_folder):
+    """Return the process-wide store for a data folder"""
+    key = os.path.abspath(data_folder)
+    with _stores_lock:
+        if key not in _stores:
+            _stores[key] = DatasetStore(data_folder)
+        return _stores[key]
@@ -1,5 +1,4 @@
 import pandas as pd
-import re
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.model_selection import train_test_split
 from sklearn.linear_model import LogisticRegression
@@ -9,25 +8,18 @@ from sklearn.model_selection import GridSearchCV
 import joblib
 import numpy as np
 
+from text_cleaning import clean_text_series
+
 # Path to the Twitter dataset (update if needed)
 dataset_path = 'data/Tweets.csv'
 
-def clean_text(text):
-    """Clean tweet text by removing URLs, mentions, hashtags, special characters, and extra whitespace."""
-    text = str(text).lower()
-    text = re.sub(r'http\S+|www\.\S+', '', text)  # Remove URLs
-    text = re.sub(r'@\w+', '', text)  # Remove mentions
-    text = re.sub(r'#', '', text)  # Remove hashtag symbol (keep the word)
-    text = re.sub(r'[^a-z\s]', '', text)  # Remove special characters and numbers
-    text = re.sub(r'\s+', ' ', text).strip()  # Remove extra whitespace
-    return text
-
 def main():
     # Load the dataset
     df = pd.read_csv(dataset_path)
     # Clean the tweet text
     if 'text' in df.columns and 'airline_sentiment' in df.columns:
-        df['cleaned_text'] = df['text'].apply(clean_text)
+        # Same cleaning pipeline as the app uses at inference time
+        df['cleaned_text'] = clean_text_series(df['text'])
         print(df[['text', 'cleaned_text']].head())
         # Feature extraction
         X = df['cleaned_text']
@@ -0,0 +1,149 @@
+import os
+from contextlib import ExitStack
+from datetime import datetime
+
+import pandas as pd
+
+from schema_inference import infer_date_columns
+from sentiment_rollup import dimension_columns
+from text_cleaning import clean_text_series
+
+DEFAULT_CHUNKSIZE = 50000
+
+
+class DatasetIngestor:
+    """Stream an uploaded CSV into a cleaned dataset file and the feedback table.
+
+    The file is read in chunks; each chunk is cleaned, optionally scored,
+    appended to the cleaned CSV and inserted into the database before the
+    next one is read, so memory use depends on the chunk size rather than
+    the file size. With a token_index, search_index or rollup, each chunk is
+    also added to the dataset's word-cloud counts, full-text index or daily
+    sentiment rollup as it goes. A chunk the database rejects is counted in
+    failed_chunks and left out of the cleaned file and the indexes.
+    """
+
+    def __init__(self, db, chunksize=DEFAULT_CHUNKSIZE, token_index=None, search_index=None, rollup=None):
+        self.db = db
+        self.chunksize = chunksize
+        self.token_index = token_index
+        self.search_index = search_index
+        self.rollup = rollup
+
+    def ingest(self, source, text_column, sentiment_column, dataset_path, user_id,
+               platform='uploaded_dataset', scorer=None, progress_callback=None):
+        """Ingest a CSV path or file object; returns a summary dict.
+
+        scorer, if given, is a callable returning (labels, confidences) for a
+        list of raw texts. Missing sentiment labels in the cleaned dataset are
+        then filled with the prediction; the feedback table keeps the human
+        label in sentiment and the prediction in predicted_sentiment.
+        """
+        dataset_name = os.path.basename(dataset_path)
+        # Hold the indexes' rebuild locks, so a page load cannot rebuild them mid-ingest
+        with ExitStack() as locks:
+            for index in (self.token_index, self.search_index, self.rollup):
+                if index is not None:
+                    locks.enter_context(index.lock(dataset_name))
+            return self._ingest(source, text_column, sentiment_column, dataset_path, dataset_name, user_id,
+                                platform, scorer, progress_callback)
+
+    def _ingest(self, source, text_column, sentiment_column, dataset_path, dataset_name, user_id,
+                platform, scorer, progress_callback):
+        """ingest() with the index locks held"""
+        rows_read = 0
+        rows_kept = 0
+        rows_inserted = 0
+        failed_chunks = 0
+        written = False
+        sentiment_counts = pd.Series(dtype='int64')
+        ingested_at = datetime.now()
+        # Indexes that missed a chunk are left without a current signature, so pages rebuild them
+        incomplete = set()
+        if self.token_index is not None:
+            self.token_index.clear(dataset_name)
+        if self.search_index is not None:
+            self.search_index.clear(dataset_name)
+        if self.rollup is not None:
+            self.rollup.clear(dataset_name)
+        date_column = None
+        first_feedback_id = self.db.get_max_feedback_id() + 1
+
+        for chunk in pd.read_csv(source, chunksize=self.chunksize):
+            rows_read += len(chunk)
+
+            human_labels = chunk[sentiment_column]
+            predicted = confidence = None
+            if scorer is not None:
+                labels, confidences = scorer(chunk[text_column].tolist())
+                predicted = pd.Series(labels, index=chunk.index)
+                chunk[sentiment_column] = chunk[sentiment_column].fillna(predicted)
+                confidence = pd.Series(confidences, index=chunk.index)
+
+            # Clean and drop empty/invalid entries
+            chunk[text_column] = clean_text_series(chunk[text_column])
+            chunk = chunk.dropna(subset=[text_column, sentiment_column])
+            chunk = chunk[chunk[text_column].str.len() > 0]
+            rows_kept += len(chunk)
+
+            inserted = self.db.insert_feedback_batch(pd.DataFrame({
+                'user_id': user_id,
+                'product_id': None,
+                'platform': platform,
+                'text': chunk[text_column],
+                'sentiment': human_labels.loc[chunk.index],
+                'predicted_sentiment': predicted.loc[chunk.index] if predicted is not None else None,
+                'confidence': confidence.loc[chunk.index] if confidence is not None else None,
+                'date': ingested_at,
+                'campaign_id': None,
+            }))
+            if not inserted:
+                # Leave the chunk out of the cleaned file and the indexes, which mirror the database
+                failed_chunks += 1
+                if progress_callback:
+                    progress_callback(rows_read, rows_kept)
+                continue
+
+            first_row = rows_inserted
+            rows_inserted += len(chunk)
+            first_chunk = not written
+            chunk.to_csv(dataset_path, mode='w' if first_chunk else 'a', header=first_chunk, index=False)
+            written = True
+
+            if self.token_index is not None:
+                if not self.token_index.add(dataset_name, chunk[text_column], chunk[sentiment_column]):
+                    incomplete.add('token_index')
+            if self.search_index is not None:
+                if not self.search_index.add(dataset_name, chunk[text_column], first_row):
+                    incomplete.add('search_index')
+            if self.rollup is not None:
+                if first_chunk:
+                    date_columns = infer_date_columns(chunk)
+                    date_column = date_columns[0] if date_columns else None
+                    platform_column, product_column = dimension_columns(chunk.columns)
+                if date_column is not None:
+                    if not self.rollup.add(dataset_name, chunk, date_column, sentiment_column,
+                                           platform_column, product_column):
+                        incomplete.add('rollup')
+
+            sentiment_counts = sentiment_counts.add(chunk[sentiment_column].value_counts(), fill_value=0)
+            if progress_callback:
+                progress_callback(rows_read, rows_kept)
+
+        if self.token_index is not None and written and 'token_index' not in incomplete:
+            self.token_index.mark_current(dataset_name, dataset_path)
+        if self.search_index is not None and written and 'search_index' not in incomplete:
+            self.search_index.mark_current(dataset_name, dataset_path)
+        if self.rollup is not None and date_column is not None and 'rollup' not in incomplete:
+            self.rollup.mark_current(dataset_name, dataset_path, date_column)
+
+        return {
+            'rows_read': rows_read,
+            'rows_kept': rows_kept,
+            'rows_inserted': rows_inserted,
+            'failed_chunks': failed_chunks,
+            'sentiment_counts': sentiment_counts.astype('int64').sort_values(ascending=False),
+            'dataset_path': dataset_path,
+            'dataset_size_mb': os.path.getsize(dataset_path) / (1024 * 1024) if written else 0,
+            'feedback_ids': (first_feedback_id, self.db.get_max_feedback_id()) if rows_inserted else None,
+        }
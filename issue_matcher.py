@@ -0,0 +1,127 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+# Issue categories for root cause analysis of negative feedback
+ISSUE_KEYWORDS = {
+    'Quality Issues': ['broken', 'defective', 'poor quality', 'cheap', 'flimsy', 'damaged', 'bad', 'awful', 'terrible'],
+    'Shipping/Delivery': ['shipping', 'delivery', 'late', 'delayed', 'arrived', 'package', 'slow'],
+    'Customer Service': ['service', 'support', 'help', 'rude', 'unhelpful', 'response', 'staff'],
+    'Price/Value': ['expensive', 'overpriced', 'cost', 'price', 'money', 'value', 'cheap'],
+    'Functionality': ['doesn\'t work', 'not working', 'malfunction', 'failed', 'error', 'problem', 'issue'],
+}
+
+# Suggested follow-ups for the issue categories found in negative feedback
+ISSUE_RECOMMENDATIONS = {
+    'Quality Issues': [
+        "🔧 Review manufacturing processes and quality control",
+        "📊 Conduct product testing with focus groups",
+        "🏭 Audit supplier quality standards"
+    ],
+    'Shipping/Delivery': [
+        "📦 Review shipping partner performance",
+        "⏰ Improve delivery time estimates",
+        "📱 Implement better package tracking"
+    ],
+    'Customer Service': [
+        "👥 Provide additional customer service training",
+        "⚡ Reduce response times",
+        "📞 Implement escalation procedures"
+    ],
+    'Price/Value': [
+        "💰 Review pricing strategy",
+        "🎁 Consider value-added bundles",
+        "📈 Communicate product value better"
+    ],
+    'Functionality': [
+        "🔧 Update product documentation",
+        "🛠️ Improve product design",
+        "📞 Enhance technical support"
+    ]
+}
+
+
+def trie_pattern(words):
+    """Regex alternation for words with shared prefixes factored out.
+
+    ['delay', 'delayed', 'delivery'] becomes 'del(?:ay(?:ed)?|ivery)', so the
+    regex engine tests each prefix once instead of once per keyword.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node):
+        ends = '' in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if ends:
+            # A word ends here and longer words continue - the rest is optional
+            return body + '?' if len(branches) == 1 and len(branches[0]) == 1 else '(?:' + body + ')?'
+        return body
+
+    return build(trie)
+
+
+class IssueMatcher:
+    """Tag texts with issue categories in one regex pass per row.
+
+    All keywords are compiled into a single case-insensitive trie regex, so each
+    text is scanned once and never concatenated with the others. Keywords match
+    whole words, optionally plural: 'late' does not match 'chocolate' and
+    'cost' matches 'costs' but not 'costume'.
+    """
+
+    def __init__(self, issue_keywords=ISSUE_KEYWORDS):
+        self.issue_keywords = issue_keywords
+        self.categories = list(issue_keywords)
+        self._keyword_categories = {}
+        for category, keywords in issue_keywords.items():
+            for keyword in keywords:
+                self._keyword_categories.setdefault(keyword.lower(), []).append(category)
+        # The group captures the keyword itself, so findall returns 'cost' for 'costs'
+        self.pattern = re.compile(r'\b(' + trie_pattern(self._keyword_categories) + r')(?:s|es)?\b',
+                                  re.IGNORECASE)
+
+    def match(self, texts):
+        """Match a Series of texts; returns an IssueMatches result"""
+        texts = pd.Series(texts)
+        # Work on positions so duplicate index labels are harmless
+        matches = pd.Series(texts.astype(str).to_numpy()).str.findall(self.pattern)
+        found = matches.explode().dropna()
+        categories = found.str.lower().map(self._keyword_categories).explode()
+        category_codes = categories.map({category: i for i, category in enumerate(self.categories)})
+
+        tag_matrix = np.zeros((len(texts), len(self.categories)), dtype=bool)
+        tag_matrix[categories.index.to_numpy(dtype=np.int64), category_codes.to_numpy(dtype=np.int64)] = True
+        mentions = np.bincount(category_codes.to_numpy(dtype=np.int64), minlength=len(self.categories))
+
+        tags = pd.DataFrame(tag_matrix, index=texts.index, columns=self.categories)
+        return IssueMatches(tags, pd.Series(mentions, index=self.categories))
+
+
+class IssueMatches:
+    """Per-row issue tags plus per-category mention counts"""
+
+    def __init__(self, tags, mentions):
+        self.tags = tags
+        self.mentions = mentions
+
+    @property
+    def row_counts(self):
+        """Number of texts tagged with each category"""
+        return self.tags.sum()
+
+    def issue_counts(self):
+        """Mention counts for categories that were found at all"""
+        return {category: int(count) for category, count in self.mentions.items() if count > 0}
+
+    def examples(self, category, n=3):
+        """Index labels of the first n texts tagged with a category"""
+        return self.tags.index[self.tags[category].to_numpy()][:n]
@@ -0,0 +1,169 @@
+import atexit
+import os
+import queue
+import threading
+import time
+from datetime import datetime, timezone
+
+from connection_pool import get_pool
+
+# Insert statements for the tables written through the background writer.
+# The timestamp is captured when the event is logged, not when it is flushed.
+LOG_STATEMENTS = {
+    'user_activity': 'INSERT INTO user_activity (user_id, action, details, timestamp) VALUES (?, ?, ?, ?)',
+    'system_health': 'INSERT INTO system_health (metric_name, metric_value, status, timestamp) VALUES (?, ?, ?, ?)',
+}
+
+DEFAULT_BATCH_SIZE = 200
+DEFAULT_FLUSH_INTERVAL = 1.0
+DEFAULT_MAX_QUEUE_SIZE = 10000
+
+_STOP = object()
+
+
+class BackgroundLogWriter:
+    """Queue log rows in memory and write them in batches on a daemon thread.
+
+    Callers only pay for a queue put. The writer flushes when batch_size rows
+    are waiting or flush_interval seconds have passed, using one executemany
+    per table inside a single transaction, and drains the queue at exit.
+    """
+
+    def __init__(self, db_path, batch_size=DEFAULT_BATCH_SIZE, flush_interval=DEFAULT_FLUSH_INTERVAL,
+                 max_queue_size=DEFAULT_MAX_QUEUE_SIZE):
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_queue_size = max_queue_size
+        self._lock = threading.Lock()
+        self._thread = None
+        self._pid = None
+        self.enqueued = 0
+        self.written = 0
+        self.dropped = 0
+        self.batches = 0
+        self.errors = 0
+        self.last_flush_ms = 0.0
+
+    def _ensure_started(self):
+        """Start the writer thread (again after a fork)"""
+        if self._thread is not None and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._thread is not None and self._pid == os.getpid():
+                return
+            self._queue = queue.Queue(maxsize=self.max_queue_size)
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+            self._thread.start()
+
+    def log(self, table, *values):
+        """Queue one row for the given log table"""
+        if table not in LOG_STATEMENTS:
+            raise ValueError(f"Unknown log table {table!r}")
+        self._ensure_started()
+
+        timestamp = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+        try:
+            self._queue.put_nowait((table, values + (timestamp,)))
+            self.enqueued += 1
+        except queue.Full:
+            self.dropped += 1
+
+    def flush(self, timeout=None):
+        """Block until everything queued so far has been written"""
+        if self._thread is None or self._pid != os.getpid():
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self, timeout=5):
+        """Drain the queue and stop the writer thread"""
+        if self._thread is None or self._pid != os.getpid():
+            return
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        self._thread = None
+
+    def stats(self):
+        """Queue depth and throughput counters"""
+        return {
+            'queue_depth': self._queue.qsize() if self._thread is not None else 0,
+            'enqueued': self.enqueued,
+            'written': self.written,
+            'dropped': self.dropped,
+            'batches': self.batches,
+            'errors': self.errors,
+            'last_flush_ms': self.last_flush_ms,
+        }
+
+    def _run(self):
+        """Writer loop: collect a batch, write it, repeat"""
+        pending, waiters = [], []
+        deadline = None
+        stopping = False
+
+        while not stopping:
+            timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if item is _STOP:
+                stopping = True
+            elif isinstance(item, threading.Event):
+                waiters.append(item)
+            elif item is not None:
+                pending.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+
+            due = deadline is not None and time.monotonic() >= deadline
+            if pending and (len(pending) >= self.batch_size or due or waiters or stopping):
+                self._write(pending)
+                pending = []
+                deadline = None
+            if not pending:
+                for waiter in waiters:
+                    waiter.set()
+                waiters = []
+
+    def _write(self, rows):
+        """Write a batch in one transaction"""
+        start = time.perf_counter()
+        by_table = {}
+        for table, values in rows:
+            by_table.setdefault(table, []).append(values)
+
+        try:
+            with get_pool(self.db_path).connection() as conn:
+                for table, values in by_table.items():
+                    conn.executemany(LOG_STATEMENTS[table], values)
+            self.written += len(rows)
+            self.batches += 1
+        except Exception as e:
+            self.errors += 1
+            print(f"Error writing log batch: {e}")
+        self.last_flush_ms = (time.perf_counter() - start) * 1000
+
+
+_writers = {}
+_writers_lock = threading.Lock()
+
+
+def get_log_writer(db_path):
+    """Return the process-wide log writer for a database file"""
+    key = os.path.abspath(db_path)
+    with _writers_lock:
+        if key not in _writers:
+            _writers[key] = BackgroundLogWriter(db_path)
+        return _writers[key]
+
+
+@atexit.register
+def _close_writers():
+    """Drain pending log rows on interpreter shutdown"""
+    for writer in list(_writers.values()):
+        writer.close()
@@ -0,0 +1,139 @@
+import os
+import hashlib
+import threading
+
+try:
+    import joblib
+    JOBLIB_AVAILABLE = True
+except ImportError:
+    JOBLIB_AVAILABLE = False
+
+from model_registry import get_registry
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_MODEL_PATH = os.path.join(BASE_DIR, "sentiment_model.joblib")
+DEFAULT_VECTORIZER_PATH = os.path.join(BASE_DIR, "tfidf_vectorizer.joblib")
+
+# Number of times to retry a load when the files change underneath us
+MAX_LOAD_ATTEMPTS = 3
+
+
+class ModelManager:
+    """Keep the trained model/vectorizer pair in memory for the whole process.
+
+    Streamlit re-executes the page script on every interaction, but imported
+    modules survive between reruns and are shared by all sessions. The pair is
+    unpickled once and only reloaded when the files on disk change.
+
+    When the model registry next to the files has a promoted version, that
+    bundle is served instead and a promotion or rollback is picked up on the
+    next call; otherwise the legacy pair of files is used.
+    """
+
+    def __init__(self, model_path=DEFAULT_MODEL_PATH, vectorizer_path=DEFAULT_VECTORIZER_PATH):
+        self.model_path = model_path
+        self.vectorizer_path = vectorizer_path
+        self.registry = get_registry(model_path, vectorizer_path)
+        self._lock = threading.Lock()
+        # (signature, version, model, vectorizer) - replaced as a whole on reload
+        self._loaded = None
+        self.load_count = 0
+
+    def is_available(self):
+        """Check that a promoted version or both model files exist"""
+        if self.registry.current_version() is not None:
+            return True
+        return os.path.exists(self.model_path) and os.path.exists(self.vectorizer_path)
+
+    def _file_signature(self):
+        """Cheap change detector: the promoted version, else mtime and size of both files"""
+        current = self.registry.current_version()
+        if current is not None:
+            return ('registry', current)
+        signature = []
+        for path in (self.model_path, self.vectorizer_path):
+            stat = os.stat(path)
+            signature.append((stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+    def _content_hash(self):
+        """Hash of both files, used as the model version"""
+        digest = hashlib.sha1()
+        for path in (self.model_path, self.vectorizer_path):
+            with open(path, 'rb') as f:
+                for block in iter(lambda: f.read(1024 * 1024), b''):
+                    digest.update(block)
+        return digest.hexdigest()[:12]
+
+    def get_model(self):
+        """Return (model, vectorizer), reloading only if the files changed"""
+        model, vectorizer, _ = self.get_versioned_model()
+        return model, vectorizer
+
+    def get_versioned_model(self):
+        """Return (model, vectorizer, version) taken from the same load"""
+        signature = self._file_signature()
+        loaded = self._loaded
+        if loaded is not None and loaded[0] == signature:
+            return loaded[2], loaded[3], loaded[1]
+
+        with self._lock:
+            # Another session may have reloaded while we waited for the lock
+            loaded = self._loaded
+            if loaded is None or loaded[0] != self._file_signature():
+                loaded = self._loaded = self._load()
+            return loaded[2], loaded[3], loaded[1]
+
+    def _load(self):
+        """Load both files, retrying if they are rewritten while loading"""
+        if not JOBLIB_AVAILABLE:
+            raise RuntimeError("joblib is not installed - cannot load trained model")
+
+        for _ in range(MAX_LOAD_ATTEMPTS):
+            signature = self._file_signature()
+            if signature[0] == 'registry':
+                # Bundles are immutable once registered, so no retry is needed
+                model, vectorizer = self.registry.load(signature[1])
+                self.load_count += 1
+                return (signature, signature[1], model, vectorizer)
+
+            version = self._content_hash()
+
+            # Touched but identical files (e.g. re-saved model) need no unpickle
+            if self._loaded is not None and self._loaded[1] == version:
+                return (signature, version, self._loaded[2], self._loaded[3])
+
+            model = joblib.load(self.model_path)
+            vectorizer = joblib.load(self.vectorizer_path)
+            if self._file_signature() == signature:
+                self.load_count += 1
+                return (signature, version, model, vectorizer)
+
+        raise RuntimeError("Model files kept changing while loading - try again shortly")
+
+    @property
+    def version(self):
+        """Registry version or content hash of the pair currently held in memory"""
+        loaded = self._loaded
+        return loaded[1] if loaded is not None else None
+
+    def invalidate(self):
+        """Drop the in-memory pair so the next call reloads from disk"""
+        with self._lock:
+            self._loaded = None
+
+
+_managers = {}
+_managers_lock = threading.Lock()
+
+
+def get_model_manager(model_path=None, vectorizer_path=None):
+    """Return the process-wide ModelManager for the given model files"""
+    model_path = os.path.abspath(model_path or DEFAULT_MODEL_PATH)
+    vectorizer_path = os.path.abspath(vectorizer_path or DEFAULT_VECTORIZER_PATH)
+    key = (model_path, vectorizer_path)
+
+    with _managers_lock:
+        if key not in _managers:
+            _managers[key] = ModelManager(model_path, vectorizer_path)
+        return _managers[key]
@@ -0,0 +1,237 @@
+import hashlib
+import json
+import os
+import shutil
+import threading
+from datetime import datetime
+
+try:
+    import joblib
+    JOBLIB_AVAILABLE = True
+except ImportError:
+    JOBLIB_AVAILABLE = False
+
+from numpy_scorer import export_numpy_model
+
+MANIFEST_FILE = "manifest.json"
+CURRENT_FILE = "CURRENT"
+
+
+def registry_dir_for(model_path):
+    """Registry that lives alongside a deployed sentiment_model.joblib"""
+    return os.path.join(os.path.dirname(os.path.abspath(model_path)), "models", "registry")
+
+
+def _atomic_write(path, write):
+    """Write a file through a temporary name and rename it into place"""
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+class ModelRegistry:
+    """Versioned store of trained model/vectorizer bundles.
+
+    Each version is one joblib file holding both objects, so a reader can
+    never pair a model with the wrong vectorizer. manifest.json lists the
+    versions with their training metadata and CURRENT names the promoted one.
+    Both are replaced with os.replace, so promotion and rollback are a single
+    atomic rename. If legacy paths are given, the promoted pair is also written
+    to sentiment_model.joblib / tfidf_vectorizer.joblib for older loaders.
+
+    Versions whose pair the NumPy scorer can reproduce also get a .npz
+    scoring artifact, copied to sentiment_model.npz on promotion.
+    """
+
+    def __init__(self, root, legacy_model_path=None, legacy_vectorizer_path=None):
+        self.root = root
+        self.legacy_model_path = legacy_model_path
+        self.legacy_vectorizer_path = legacy_vectorizer_path
+        self._lock = threading.Lock()
+
+    @property
+    def manifest_path(self):
+        return os.path.join(self.root, MANIFEST_FILE)
+
+    @property
+    def current_path(self):
+        return os.path.join(self.root, CURRENT_FILE)
+
+    def bundle_path(self, version):
+        """Path of the bundle file for a version"""
+        return os.path.join(self.root, "versions", f"{version}.joblib")
+
+    def numpy_path(self, version):
+        """Path of the NumPy scoring artifact for a version (may not exist)"""
+        return os.path.join(self.root, "versions", f"{version}.npz")
+
+    @property
+    def legacy_numpy_path(self):
+        """sentiment_model.npz next to the legacy model file, or None"""
+        if not self.legacy_model_path:
+            return None
+        return os.path.splitext(self.legacy_model_path)[0] + ".npz"
+
+    def _read_manifest(self):
+        """Manifest contents, or an empty manifest for a new registry"""
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {'versions': [], 'promotions': []}
+
+    def _write_manifest(self, manifest):
+        def write(path):
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, indent=2)
+        _atomic_write(self.manifest_path, write)
+
+    def list_versions(self):
+        """Registered versions, newest first"""
+        return list(reversed(self._read_manifest()['versions']))
+
+    def get_version_info(self, version):
+        """Manifest entry for one version"""
+        for entry in self._read_manifest()['versions']:
+            if entry['version'] == version:
+                return entry
+        raise KeyError(f"Unknown model version {version!r}")
+
+    def current_version(self):
+        """Promoted version, or None if nothing has been promoted yet"""
+        try:
+            with open(self.current_path, 'r', encoding='utf-8') as f:
+                return f.read().strip() or None
+        except FileNotFoundError:
+            return None
+
+    def register(self, model, vectorizer, accuracy=None, dataset=None, rows=None,
+                 training_mode=None, promote=True):
+        """Store a trained pair as a new version; returns the version id"""
+        if not JOBLIB_AVAILABLE:
+            raise RuntimeError("joblib is not installed - cannot save trained model")
+        os.makedirs(os.path.join(self.root, "versions"), exist_ok=True)
+        created_at = datetime.now()
+
+        tmp_path = os.path.join(self.root, "versions", f"pending.{os.getpid()}.{threading.get_ident()}.tmp")
+        joblib.dump({'model': model, 'vectorizer': vectorizer}, tmp_path)
+        digest = hashlib.sha1()
+        with open(tmp_path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+
+        version = f"{created_at.strftime('%Y%m%d_%H%M%S')}_{digest.hexdigest()[:8]}"
+        os.replace(tmp_path, self.bundle_path(version))
+        try:
+            export_numpy_model(model, vectorizer, self.numpy_path(version), version=version)
+        except ValueError as e:
+            print(f"No NumPy scoring artifact for version {version}: {e}")
+
+        entry = {
+            'version': version,
+            'created_at': created_at.isoformat(timespec='seconds'),
+            'accuracy': float(accuracy) if accuracy is not None else None,
+            'dataset': dataset,
+            'rows': int(rows) if rows is not None else None,
+            'training_mode': training_mode,
+            'model_type': type(model).__name__,
+            'vectorizer_type': type(vectorizer).__name__,
+            'classes': [str(label) for label in getattr(model, 'classes_', [])],
+            'size_bytes': os.path.getsize(self.bundle_path(version)),
+        }
+        with self._lock:
+            manifest = self._read_manifest()
+            manifest['versions'].append(entry)
+            self._write_manifest(manifest)
+
+        if promote:
+            self.promote(version)
+        return version
+
+    def promote(self, version):
+        """Make a version current with an atomic rename"""
+        self._promote(version, rollback=False)
+
+    def _promote(self, version, rollback):
+        """Promote a version and record it in the promotion history"""
+        if not os.path.exists(self.bundle_path(version)):
+            raise KeyError(f"Unknown model version {version!r}")
+
+        with self._lock:
+            self._export_legacy(version)
+
+            def write(path):
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write(version)
+            _atomic_write(self.current_path, write)
+
+            manifest = self._read_manifest()
+            promotion = {'version': version, 'promoted_at': datetime.now().isoformat(timespec='seconds')}
+            if rollback:
+                promotion['rollback'] = True
+            manifest['promotions'].append(promotion)
+            self._write_manifest(manifest)
+
+    def _live_history(self):
+        """Versions that were live, oldest first, with rolled-back promotions removed"""
+        history = []
+        for promotion in self._read_manifest()['promotions']:
+            if promotion.get('rollback'):
+                # A rollback undid the top promotion and went back to the one below it
+                history = history[:-1] or [promotion['version']]
+            elif not history or history[-1] != promotion['version']:
+                history.append(promotion['version'])
+        return history
+
+    def rollback(self):
+        """Promote the version that was live before the current one"""
+        history = self._live_history()
+        if len(history) < 2:
+            raise RuntimeError("No earlier model version to roll back to")
+        previous = history[-2]
+        self._promote(previous, rollback=True)
+        return previous
+
+    def load(self, version=None):
+        """Load (model, vectorizer) for a version, default the current one"""
+        if not JOBLIB_AVAILABLE:
+            raise RuntimeError("joblib is not installed - cannot load trained model")
+        version = version or self.current_version()
+        if version is None:
+            raise RuntimeError("No model version has been promoted yet")
+        bundle = joblib.load(self.bundle_path(version))
+        return bundle['model'], bundle['vectorizer']
+
+    def _export_legacy(self, version):
+        """Write the pair to the legacy single-object files, each atomically"""
+        if not (self.legacy_model_path and self.legacy_vectorizer_path):
+            return
+        model, vectorizer = self.load(version)
+        _atomic_write(self.legacy_model_path, lambda path: joblib.dump(model, path))
+        _atomic_write(self.legacy_vectorizer_path, lambda path: joblib.dump(vectorizer, path))
+
+        # Never leave an artifact of another version next to the promoted pair
+        if os.path.exists(self.numpy_path(version)):
+            _atomic_write(self.legacy_numpy_path, lambda path: shutil.copyfile(self.numpy_path(version), path))
+        elif os.path.exists(self.legacy_numpy_path):
+            os.remove(self.legacy_numpy_path)
+
+
+_registries = {}
+_registries_lock = threading.Lock()
+
+
+def get_registry(model_path, vectorizer_path):
+    """Return the process-wide registry next to the given deployed model files"""
+    model_path = os.path.abspath(model_path)
+    vectorizer_path = os.path.abspath(vectorizer_path)
+    key = (model_path, vectorizer_path)
+
+    with _registries_lock:
+        if key not in _registries:
+            _registries[key] = ModelRegistry(registry_dir_for(model_path), model_path, vectorizer_path)
+        return _registries[key]
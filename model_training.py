@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Incremental sentiment model training.
+
+A HashingVectorizer needs no fitted vocabulary, so new batches can be folded
+into an SGDClassifier with partial_fit without revisiting earlier data. Each
+update is registered and promoted in the model registry, which also keeps the
+sentiment_model.joblib / tfidf_vectorizer.joblib pair up to date. The model
+exposes the same transform / predict_proba / classes_ interface as the full
+TF-IDF + LogisticRegression model.
+
+Usage:
+    python model_training.py csv data/new_upload.csv --text-column text --sentiment-column sentiment
+    python model_training.py feedback --db data/sentiment_system.db
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import joblib
+
+from model_manager import DEFAULT_MODEL_PATH, DEFAULT_VECTORIZER_PATH
+from model_registry import get_registry
+from sentiment_labels import LABELS, code_labels, normalize_labels
+from text_cleaning import clean_texts
+
+# Labels a new incremental model is trained on. Raw labels (text or numeric
+# ratings) are normalized onto them and rows with unrecognized labels are skipped.
+DEFAULT_CLASSES = LABELS
+DEFAULT_CHUNKSIZE = 10000
+HASHING_FEATURES = 2 ** 18
+
+
+def create_incremental_pair():
+    """New untrained (model, vectorizer) pair for incremental training"""
+    # scikit-learn takes over a second to import - only pay for it when a new pair is built
+    from sklearn.feature_extraction.text import HashingVectorizer
+    from sklearn.linear_model import SGDClassifier
+
+    vectorizer = HashingVectorizer(n_features=HASHING_FEATURES, stop_words='english',
+                                   alternate_sign=False, norm='l2')
+    model = SGDClassifier(loss='log_loss', alpha=1e-5, random_state=42)
+    return model, vectorizer
+
+
+def is_incremental_pair(model, vectorizer):
+    """Check whether a saved pair can be updated with partial_fit"""
+    return type(vectorizer).__name__ == 'HashingVectorizer' and hasattr(model, 'partial_fit')
+
+
+class IncrementalTrainer:
+    """Update the deployed sentiment model batch by batch.
+
+    Accuracy is measured progressively: each batch is scored by the current
+    model before it is trained on, so no separate holdout pass is needed.
+    """
+
+    def __init__(self, model_path=None, vectorizer_path=None, chunksize=DEFAULT_CHUNKSIZE):
+        self.model_path = model_path or DEFAULT_MODEL_PATH
+        self.vectorizer_path = vectorizer_path or DEFAULT_VECTORIZER_PATH
+        self.chunksize = chunksize
+        self.registry = get_registry(self.model_path, self.vectorizer_path)
+        self.model = None
+        self.vectorizer = None
+        self.resumed = False
+        self._reset_counters()
+
+    def _reset_counters(self):
+        self.rows_trained = 0
+        self.rows_skipped = 0
+        self.batches = 0
+        self.evaluated = 0
+        self.correct = 0
+
+    def load(self):
+        """Continue from the current model if it is incremental, else start a new one"""
+        self.resumed = False
+        has_legacy_pair = os.path.exists(self.model_path) and os.path.exists(self.vectorizer_path)
+        if self.registry.current_version() is not None or has_legacy_pair:
+            try:
+                # A private copy - the served model must not change while we train
+                if self.registry.current_version() is not None:
+                    model, vectorizer = self.registry.load()
+                else:
+                    model = joblib.load(self.model_path)
+                    vectorizer = joblib.load(self.vectorizer_path)
+                if is_incremental_pair(model, vectorizer):
+                    self.model, self.vectorizer = model, vectorizer
+                    self.resumed = True
+            except Exception as e:
+                print(f"Error loading model for incremental training: {e}")
+
+        if not self.resumed:
+            self.model, self.vectorizer = create_incremental_pair()
+        self._reset_counters()
+        return self.resumed
+
+    @property
+    def last_feedback_id(self):
+        """Highest feedback_id already absorbed into the model"""
+        return getattr(self.model, 'last_feedback_id_', 0)
+
+    def partial_fit(self, texts, labels):
+        """Clean, vectorize and train on one batch of raw texts"""
+        if self.model is None:
+            self.load()
+
+        cleaned = clean_texts([text if isinstance(text, str) else '' for text in texts])
+        labels = np.asarray(code_labels(normalize_labels(list(labels))).astype(object), dtype=object)
+        keep = np.array([len(text) > 0 for text in cleaned], dtype=bool)
+        keep &= pd.notna(labels)
+
+        classes = getattr(self.model, 'classes_', None)
+        if classes is None:
+            classes = np.array(DEFAULT_CLASSES, dtype=object)
+        else:
+            keep &= np.isin(labels, classes)
+
+        self.rows_skipped += int((~keep).sum())
+        if not keep.any():
+            return 0
+
+        X = self.vectorizer.transform([text for text, k in zip(cleaned, keep) if k])
+        y = labels[keep]
+
+        # Test-then-train: score the batch before the model has seen it
+        if hasattr(self.model, 'classes_'):
+            self.correct += int((self.model.predict(X) == y).sum())
+            self.evaluated += len(y)
+
+        self.model.partial_fit(X, y, classes=classes)
+        self.rows_trained += len(y)
+        self.batches += 1
+        return len(y)
+
+    def train_from_frame(self, df, text_column, sentiment_column):
+        """Train on an in-memory frame in chunks"""
+        for start in range(0, len(df), self.chunksize):
+            chunk = df.iloc[start:start + self.chunksize]
+            self.partial_fit(chunk[text_column].tolist(), chunk[sentiment_column].tolist())
+        return self.summary()
+
+    def train_from_csv(self, path, text_column, sentiment_column, progress_callback=None, feedback_ids=None):
+        """Stream a CSV file into the model without loading it all.
+
+        feedback_ids is the (first, last) feedback_id range the file was
+        ingested as. When every earlier row is already absorbed, the
+        watermark moves past the range so train_from_feedback does not
+        train on the same rows again.
+        """
+        for chunk in pd.read_csv(path, usecols=[text_column, sentiment_column], chunksize=self.chunksize):
+            self.partial_fit(chunk[text_column].tolist(), chunk[sentiment_column].tolist())
+            if progress_callback:
+                progress_callback(self.rows_trained)
+
+        if feedback_ids is not None and hasattr(self.model, 'classes_'):
+            first_id, last_id = feedback_ids
+            if self.last_feedback_id >= first_id - 1:
+                self.model.last_feedback_id_ = max(self.last_feedback_id, last_id)
+        return self.summary()
+
+    def train_from_feedback(self, db, progress_callback=None):
+        """Absorb labelled feedback rows added since the last update"""
+        after_id = self.last_feedback_id
+        while True:
+            page = db.get_labeled_feedback(after_id=after_id, limit=self.chunksize)
+            if page.empty:
+                break
+            self.partial_fit(page['text'].tolist(), page['sentiment'].tolist())
+            after_id = int(page['feedback_id'].iloc[-1])
+            if progress_callback:
+                progress_callback(self.rows_trained)
+
+        if hasattr(self.model, 'classes_'):
+            self.model.last_feedback_id_ = after_id
+        return self.summary()
+
+    def summary(self):
+        """Counters for the current training run"""
+        return {
+            'rows_trained': self.rows_trained,
+            'rows_skipped': self.rows_skipped,
+            'batches': self.batches,
+            'accuracy': self.correct / self.evaluated if self.evaluated else None,
+            'resumed': self.resumed,
+        }
+
+    def save(self, dataset=None, promote=True):
+        """Register the updated pair as a new version; returns the version id"""
+        if not hasattr(self.model, 'classes_'):
+            raise RuntimeError("Model has not been trained on any rows yet")
+
+        return self.registry.register(self.model, self.vectorizer, accuracy=self.summary()['accuracy'],
+                                      dataset=dataset, rows=self.rows_trained,
+                                      training_mode='incremental', promote=promote)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Incremental sentiment model training")
+    parser.add_argument('--model', default=DEFAULT_MODEL_PATH, help="Path to sentiment_model.joblib")
+    parser.add_argument('--vectorizer', default=DEFAULT_VECTORIZER_PATH, help="Path to tfidf_vectorizer.joblib")
+    parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE, help="Rows per partial_fit batch")
+    subparsers = parser.add_subparsers(dest='source', required=True)
+
+    csv_parser = subparsers.add_parser('csv', help="Train on a labelled CSV file")
+    csv_parser.add_argument('input', help="Input CSV path")
+    csv_parser.add_argument('--text-column', default='text')
+    csv_parser.add_argument('--sentiment-column', default='sentiment')
+
+    feedback_parser = subparsers.add_parser('feedback', help="Train on feedback rows added since the last update")
+    feedback_parser.add_argument('--db', default='data/sentiment_system.db')
+
+    args = parser.parse_args(argv)
+    trainer = IncrementalTrainer(args.model, args.vectorizer, chunksize=args.chunksize)
+    if not trainer.load():
+        print("ℹ️ Saved model is not incremental - starting a new incremental model")
+    start = time.time()
+
+    def report(total):
+        print(f"  trained on {total:,} rows")
+
+    if args.source == 'csv':
+        summary = trainer.train_from_csv(args.input, args.text_column, args.sentiment_column,
+                                         progress_callback=report)
+    else:
+        from database_manager import DatabaseManager
+        summary = trainer.train_from_feedback(DatabaseManager(args.db), progress_callback=report)
+
+    if summary['rows_trained'] == 0:
+        print("No new labelled rows - model unchanged")
+        return 0
+
+    version = trainer.save(dataset=args.input if args.source == 'csv' else 'feedback')
+    accuracy = summary['accuracy']
+    print(f"✅ Trained on {summary['rows_trained']:,} rows in {time.time() - start:.1f}s "
+          f"({summary['rows_skipped']:,} skipped)"
+          + (f", progressive accuracy {accuracy:.3f}" if accuracy is not None else "")
+          + f" - promoted version {version}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Dependency-free scoring artifact for the TF-IDF + linear sentiment model.
+
+export_numpy_model() flattens a fitted TfidfVectorizer and linear
+classifier (LogisticRegression, or SGDClassifier with log loss) into one
+.npz file: the vocabulary terms, idf and coefficients as float32, the
+intercept, the class list, the stop words and the tokenizer settings.
+NumpyScorer loads that file with NumPy alone and reproduces the
+vectorizer's tokenization and TF-IDF weighting and the classifier's
+probabilities, so a scoring process starts in milliseconds without
+importing scikit-learn or unpickling its objects.
+
+NumpyScorer has transform(), predict_proba() and classes_, so it can
+stand in for both the vectorizer and the model wherever a pair is used
+(batch_scorer.score_texts, the prediction cache).
+
+Usage:
+    python numpy_scorer.py export sentiment_model.npz
+    python numpy_scorer.py verify sentiment_model.npz --input data/Tweets.csv
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+
+import numpy as np
+
+from text_cleaning import clean_texts
+
+FORMAT_VERSION = 1
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_NUMPY_MODEL_PATH = os.path.join(BASE_DIR, "sentiment_model.npz")
+
+
+def _probability_mode(model):
+    """How the classifier turns decision scores into probabilities"""
+    n_classes = len(model.classes_)
+    if n_classes == 2:
+        return 'binary'
+    if type(model).__name__ == 'LogisticRegression':
+        multi_class = getattr(model, 'multi_class', 'deprecated')
+        if multi_class == 'ovr' or (multi_class in ('auto', 'deprecated') and model.solver == 'liblinear'):
+            return 'ovr'
+        return 'softmax'
+    if getattr(model, 'loss', None) == 'log_loss':
+        return 'ovr'
+    raise ValueError(f"{type(model).__name__} has no probabilities this scorer can reproduce")
+
+
+def export_numpy_model(model, vectorizer, path, version=None):
+    """Write a fitted TfidfVectorizer + linear classifier pair to an .npz artifact.
+
+    Raises ValueError for pairs the NumPy scorer cannot reproduce (for
+    example the HashingVectorizer used by incremental training).
+    """
+    if type(vectorizer).__name__ not in ('TfidfVectorizer', 'CountVectorizer'):
+        raise ValueError(f"Cannot export a {type(vectorizer).__name__} - a fitted vocabulary is required")
+    if vectorizer.analyzer != 'word' or vectorizer.tokenizer is not None or vectorizer.preprocessor is not None:
+        raise ValueError("Only the built-in word analyzer can be exported")
+    if vectorizer.strip_accents is not None:
+        raise ValueError("Accent stripping is not supported by the NumPy scorer")
+
+    is_tfidf = type(vectorizer).__name__ == 'TfidfVectorizer'
+    terms = np.empty(len(vectorizer.vocabulary_), dtype=object)
+    for term, index in vectorizer.vocabulary_.items():
+        terms[index] = term
+    idf = vectorizer.idf_ if is_tfidf and vectorizer.use_idf else np.ones(len(terms))
+
+    coef = np.asarray(model.coef_)
+    config = {
+        'format_version': FORMAT_VERSION,
+        'version': version,
+        'lowercase': bool(vectorizer.lowercase),
+        'token_pattern': vectorizer.token_pattern,
+        'ngram_range': list(vectorizer.ngram_range),
+        'binary': bool(vectorizer.binary),
+        'norm': vectorizer.norm if is_tfidf else None,
+        'sublinear_tf': bool(vectorizer.sublinear_tf) if is_tfidf else False,
+        'probability': _probability_mode(model),
+    }
+    stop_words = sorted(vectorizer.get_stop_words() or ())
+
+    tmp_path = f"{path}.{os.getpid()}.tmp.npz"
+    try:
+        np.savez_compressed(
+            tmp_path,
+            terms=terms.astype(str),
+            idf=idf.astype(np.float32),
+            coef=coef.astype(np.float32),
+            intercept=np.asarray(model.intercept_, dtype=np.float32),
+            classes=np.asarray([str(label) for label in model.classes_]),
+            stop_words=np.asarray(stop_words, dtype=str),
+            config=np.asarray(json.dumps(config)),
+        )
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return path
+
+
+class _Features:
+    """Sparse TF-IDF rows as COO arrays: one entry per (row, feature) pair"""
+
+    def __init__(self, n_rows, rows, features, values):
+        self.n_rows = n_rows
+        self.rows = rows
+        self.features = features
+        self.values = values
+
+    def __len__(self):
+        return self.n_rows
+
+
+class NumpyScorer:
+    """TF-IDF + linear classifier scoring from an exported .npz, using NumPy only"""
+
+    def __init__(self, path=DEFAULT_NUMPY_MODEL_PATH):
+        self.path = path
+        with np.load(path, allow_pickle=False) as artifact:
+            self.config = json.loads(str(artifact['config']))
+            if self.config['format_version'] != FORMAT_VERSION:
+                raise ValueError(f"Unsupported scoring artifact format {self.config['format_version']}")
+            terms = artifact['terms'].tolist()
+            self.idf = artifact['idf'].astype(np.float64)
+            # Transposed so the weights of one feature are a contiguous row
+            self.coef_t = artifact['coef'].astype(np.float64).T.copy()
+            self.intercept = artifact['intercept'].astype(np.float64)
+            self.classes_ = artifact['classes'].astype(object)
+            stop_words = set(artifact['stop_words'].tolist())
+
+        self.vocabulary = {term: index for index, term in enumerate(terms)}
+        self.stop_words = stop_words
+        self.token_pattern = re.compile(self.config['token_pattern'])
+        self.min_n, self.max_n = self.config['ngram_range']
+        self.version = self.config.get('version')
+
+    def _tokens(self, text):
+        """Word n-grams of one text, as the fitted vectorizer's analyzer produces them"""
+        if self.config['lowercase']:
+            text = text.lower()
+        tokens = [token for token in self.token_pattern.findall(text) if token not in self.stop_words]
+        if self.max_n == 1:
+            return tokens
+        grams = list(tokens) if self.min_n == 1 else []
+        for n in range(max(self.min_n, 2), self.max_n + 1):
+            grams.extend(' '.join(tokens[i:i + n]) for i in range(len(tokens) - n + 1))
+        return grams
+
+    def transform(self, texts):
+        """TF-IDF features of already cleaned texts"""
+        rows, features = [], []
+        vocabulary = self.vocabulary
+        for row, text in enumerate(texts):
+            for token in self._tokens(text):
+                index = vocabulary.get(token)
+                if index is not None:
+                    rows.append(row)
+                    features.append(index)
+
+        n_features = len(self.idf)
+        pairs, counts = np.unique(np.asarray(rows, dtype=np.int64) * n_features
+                                  + np.asarray(features, dtype=np.int64), return_counts=True)
+        rows, features = np.divmod(pairs, n_features)
+        values = np.ones(len(pairs)) if self.config['binary'] else counts.astype(np.float64)
+        if self.config['sublinear_tf']:
+            values = np.log(values) + 1
+        values = values * self.idf[features]
+
+        norm = self.config['norm']
+        if norm is not None:
+            per_row = values * values if norm == 'l2' else np.abs(values)
+            totals = np.bincount(rows, weights=per_row, minlength=len(texts))
+            if norm == 'l2':
+                totals = np.sqrt(totals)
+            totals[totals == 0] = 1
+            values = values / totals[rows]
+        return _Features(len(texts), rows, features, values)
+
+    def decision_function(self, X):
+        """Linear scores, one column per coefficient row"""
+        scores = np.tile(self.intercept, (len(X), 1))
+        weighted = X.values[:, None] * self.coef_t[X.features]
+        for column in range(scores.shape[1]):
+            scores[:, column] += np.bincount(X.rows, weights=weighted[:, column], minlength=len(X))
+        return scores
+
+    def predict_proba(self, X):
+        """Class probabilities in classes_ order"""
+        scores = self.decision_function(X)
+        mode = self.config['probability']
+        if mode == 'binary':
+            positive = 1 / (1 + np.exp(-scores[:, 0]))
+            return np.column_stack([1 - positive, positive])
+        if mode == 'softmax':
+            scores = scores - scores.max(axis=1, keepdims=True)
+            exp = np.exp(scores)
+            return exp / exp.sum(axis=1, keepdims=True)
+        proba = 1 / (1 + np.exp(-scores))
+        return proba / proba.sum(axis=1, keepdims=True)
+
+    def score(self, texts):
+        """Clean and score raw texts, returning (labels, confidences) arrays"""
+        proba = self.predict_proba(self.transform(clean_texts(list(texts))))
+        best = proba.argmax(axis=1)
+        return self.classes_[best], proba[np.arange(len(best)), best]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export or verify the NumPy scoring artifact")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    export_parser = subparsers.add_parser('export', help="Export the deployed model pair")
+    export_parser.add_argument('output', nargs='?', default=DEFAULT_NUMPY_MODEL_PATH, help="Artifact path (.npz)")
+
+    verify_parser = subparsers.add_parser('verify', help="Compare the artifact with the deployed model pair")
+    verify_parser.add_argument('artifact', nargs='?', default=DEFAULT_NUMPY_MODEL_PATH)
+    verify_parser.add_argument('--input', default=os.path.join(BASE_DIR, 'data', 'Tweets.csv'),
+                               help="CSV whose text column is scored by both")
+    verify_parser.add_argument('--text-column', default='text')
+
+    for sub in (export_parser, verify_parser):
+        sub.add_argument('--model', help="Path to sentiment_model.joblib")
+        sub.add_argument('--vectorizer', help="Path to tfidf_vectorizer.joblib")
+    args = parser.parse_args(argv)
+
+    from model_manager import get_model_manager
+    manager = get_model_manager(args.model, args.vectorizer)
+    model, vectorizer, version = manager.get_versioned_model()
+
+    if args.command == 'export':
+        export_numpy_model(model, vectorizer, args.output, version=version)
+        print(f"✅ Exported model {version} to {args.output} ({os.path.getsize(args.output):,} bytes)")
+        return 0
+
+    import pandas as pd
+    texts = clean_texts(pd.read_csv(args.input, usecols=[args.text_column])[args.text_column].tolist())
+    scorer = NumpyScorer(args.artifact)
+    expected = model.predict_proba(vectorizer.transform(texts))
+    actual = scorer.predict_proba(scorer.transform(texts))
+    same_labels = (expected.argmax(axis=1) == actual.argmax(axis=1)).mean()
+    print(f"Max probability difference: {np.abs(expected - actual).max():.2e}")
+    print(f"Matching labels: {same_labels:.4%} of {len(texts):,} texts")
+    return 0 if same_labels == 1 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
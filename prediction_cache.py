@@ -0,0 +1,119 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from text_cleaning import clean_texts
+
+# Texts whose probabilities are kept, overridable with the PREDICTION_CACHE_ENTRIES env var
+DEFAULT_MAX_ENTRIES = 100000
+
+
+def text_key(cleaned):
+    """Cache key of a cleaned text: a 16-byte digest rather than the text itself"""
+    return hashlib.blake2b(cleaned.encode('utf-8'), digest_size=16).digest()
+
+
+class PredictionCache:
+    """LRU cache of class probabilities per cleaned text, for one model version at a time.
+
+    Texts are cleaned with the training cleaner and keyed by a hash of the
+    result, so retweets, copy-pasted complaints and texts differing only in
+    mentions, URLs or punctuation share an entry. Only texts missing from
+    the cache are vectorized and scored, in one call per batch. Every lookup
+    names the model version it is scoring with; when the version changes
+    (retraining, promotion, rollback) all entries of the previous version
+    are dropped, so a stale prediction is never served.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # text key -> tuple of class probabilities
+        self.version = None  # model version the entries were scored with
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def _use_version(self, version):
+        """Drop the entries of another model version; caller holds the lock"""
+        if version != self.version:
+            if self._entries:
+                self.invalidations += 1
+                self._entries.clear()
+            self.version = version
+
+    def predict_proba(self, texts, model, vectorizer, version):
+        """Probabilities for raw texts, one row per text in model.classes_ order.
+
+        Texts repeated within the call are scored once.
+        """
+        cleaned = clean_texts(list(texts))
+        keys = [text_key(text) for text in cleaned]
+        proba = np.empty((len(keys), len(model.classes_)))
+        missing = OrderedDict()  # text key -> (cleaned text, positions)
+
+        with self._lock:
+            self._use_version(version)
+            for i, key in enumerate(keys):
+                row = self._entries.get(key)
+                if row is not None:
+                    self._entries.move_to_end(key)
+                    proba[i] = row
+                elif key in missing:
+                    missing[key][1].append(i)
+                else:
+                    missing[key] = (cleaned[i], [i])
+            self.hits += len(keys) - len(missing)
+            self.misses += len(missing)
+
+        if missing:
+            scored = model.predict_proba(vectorizer.transform([text for text, _ in missing.values()]))
+            with self._lock:
+                current = self.version == version
+                for (key, (_, positions)), row in zip(missing.items(), scored):
+                    proba[positions] = row
+                    if current:
+                        self._entries[key] = tuple(row.tolist())
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return proba
+
+    def clear(self):
+        """Drop every entry"""
+        with self._lock:
+            if self._entries:
+                self.invalidations += 1
+            self._entries.clear()
+
+    def stats(self):
+        """Counters for the admin System Health section"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'model_version': self.version,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+            }
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_prediction_cache():
+    """Return the process-wide prediction cache"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = PredictionCache(int(os.environ.get('PREDICTION_CACHE_ENTRIES', DEFAULT_MAX_ENTRIES)))
+        return _cache
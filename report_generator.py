@@ -1,6 +1,6 @@
 import os
+import traceback
 from datetime import datetime
-import streamlit as st
 
 # Try to import reportlab for PDF generation
 try:
@@ -14,26 +14,93 @@ try:
 except ImportError:
     REPORTLAB_AVAILABLE = False
 
+# File type build_report writes: PDF with ReportLab, plain text without it
+REPORT_EXTENSION = 'pdf' if REPORTLAB_AVAILABLE else 'txt'
+REPORT_MIME = 'application/pdf' if REPORTLAB_AVAILABLE else 'text/plain'
+
+
+def safe_file_name(name):
+    """Report name reduced to characters that are safe in a file name"""
+    return ''.join(char if char.isalnum() or char in '-_' else '_' for char in str(name)) or 'unnamed'
+
+
+def _table_style(header_color, body_color, header_font_size=12):
+    """Grid table style with a colored header row, as used by every report table"""
+    return TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), header_color),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), header_font_size),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), body_color),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black)
+    ])
+
+
+def build_report_styles():
+    """Paragraph and table styles for the product and marketing reports"""
+    styles = getSampleStyleSheet()
+    report_styles = {'normal': styles['Normal']}
+    for report_type, color in (('product', colors.darkblue), ('marketing', colors.darkgreen)):
+        report_styles[f'{report_type}_title'] = ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=24,
+            textColor=color,
+            alignment=TA_CENTER,
+            spaceAfter=30
+        )
+        report_styles[f'{report_type}_heading'] = ParagraphStyle(
+            'CustomHeading',
+            parent=styles['Heading2'],
+            fontSize=16,
+            textColor=color,
+            spaceBefore=20,
+            spaceAfter=10
+        )
+    report_styles['product_summary_table'] = _table_style(colors.grey, colors.beige, header_font_size=14)
+    report_styles['product_sentiment_table'] = _table_style(colors.darkblue, colors.lightblue)
+    report_styles['marketing_table'] = _table_style(colors.darkgreen, colors.lightgreen)
+    return report_styles
+
+
 class ReportGenerator:
     def __init__(self):
         self.reports_dir = "reports"
         os.makedirs(self.reports_dir, exist_ok=True)
+        self._styles = None
+
+    @property
+    def styles(self):
+        """ReportLab styles, created once per generator and shared by its reports"""
+        if self._styles is None:
+            self._styles = build_report_styles()
+        return self._styles
     
+    def build_report(self, report_type, data, name, output_path):
+        """Write a 'product' or 'marketing' report to output_path; errors are raised"""
+        builders = {
+            'product': (self._generate_pdf_product_report, self._generate_text_product_report),
+            'marketing': (self._generate_pdf_marketing_report, self._generate_text_marketing_report),
+        }
+        if report_type not in builders:
+            raise ValueError(f"Unknown report type: {report_type}")
+        pdf_builder, text_builder = builders[report_type]
+
+        # Ensure the reports directory exists
+        os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+        if REPORTLAB_AVAILABLE:
+            return pdf_builder(data, name, output_path)
+        return text_builder(data, name, output_path)
+
     def generate_product_report(self, data, product_name, output_path):
         """Generate a product sentiment report as PDF"""
         try:
-            # Ensure the reports directory exists
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            
-            if REPORTLAB_AVAILABLE:
-                return self._generate_pdf_product_report(data, product_name, output_path)
-            else:
-                return self._generate_text_product_report(data, product_name, output_path)
-            
+            return self.build_report('product', data, product_name, output_path)
         except Exception as e:
-            st.error(f"Error generating report: {e}")
-            import traceback
-            st.text(traceback.format_exc())
+            print(f"Error generating report: {e}")
+            traceback.print_exc()
             return None
     
     def _generate_pdf_product_report(self, data, product_name, output_path):
@@ -42,37 +109,19 @@ class ReportGenerator:
         doc = SimpleDocTemplate(output_path, pagesize=A4)
         story = []
         
-        # Get styles
-        styles = getSampleStyleSheet()
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            textColor=colors.darkblue,
-            alignment=TA_CENTER,
-            spaceAfter=30
-        )
-        
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontSize=16,
-            textColor=colors.darkblue,
-            spaceBefore=20,
-            spaceAfter=10
-        )
+        styles = self.styles
         
         # Title
-        story.append(Paragraph("PRODUCT SENTIMENT REPORT", title_style))
+        story.append(Paragraph("PRODUCT SENTIMENT REPORT", styles['product_title']))
         story.append(Spacer(1, 20))
         
         # Product info
-        story.append(Paragraph(f"<b>Product:</b> {product_name}", styles['Normal']))
-        story.append(Paragraph(f"<b>Generated:</b> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", styles['Normal']))
+        story.append(Paragraph(f"<b>Product:</b> {product_name}", styles['normal']))
+        story.append(Paragraph(f"<b>Generated:</b> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", styles['normal']))
         story.append(Spacer(1, 20))
         
         # Summary section
-        story.append(Paragraph("SUMMARY", heading_style))
+        story.append(Paragraph("SUMMARY", styles['product_heading']))
         summary_data = [
             ['Metric', 'Value'],
             ['Total Feedback', str(len(data))],
@@ -80,22 +129,13 @@ class ReportGenerator:
         ]
         
         summary_table = Table(summary_data)
-        summary_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 14),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+        summary_table.setStyle(styles['product_summary_table'])
         story.append(summary_table)
         story.append(Spacer(1, 20))
         
         # Sentiment breakdown
         if 'sentiment' in data.columns:
-            story.append(Paragraph("SENTIMENT BREAKDOWN", heading_style))
+            story.append(Paragraph("SENTIMENT BREAKDOWN", styles['product_heading']))
             sentiment_counts = data['sentiment'].value_counts()
             
             sentiment_data = [['Sentiment', 'Count', 'Percentage']]
@@ -104,21 +144,12 @@ class ReportGenerator:
                 sentiment_data.append([str(sentiment), str(count), f"{percentage:.1f}%"])
             
             sentiment_table = Table(sentiment_data)
-            sentiment_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 12),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.lightblue),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black)
-            ]))
+            sentiment_table.setStyle(styles['product_sentiment_table'])
             story.append(sentiment_table)
             story.append(Spacer(1, 20))
         
         # Recommendations
-        story.append(Paragraph("RECOMMENDATIONS", heading_style))
+        story.append(Paragraph("RECOMMENDATIONS", styles['product_heading']))
         recommendations = [
             "• Monitor negative feedback trends to identify product issues",
             "• Focus on improving product quality based on customer feedback",
@@ -128,11 +159,10 @@ class ReportGenerator:
         ]
         
         for rec in recommendations:
-            story.append(Paragraph(rec, styles['Normal']))
+            story.append(Paragraph(rec, styles['normal']))
         
         # Build PDF
         doc.build(story)
-        st.success(f"PDF report generated: {output_path}")
         return output_path
     
     def _generate_text_product_report(self, data, product_name, output_path):
@@ -169,25 +199,16 @@ SENTIMENT BREAKDOWN:
         with open(output_path, 'w', encoding='utf-8') as f:
             f.write(report_content)
         
-        st.warning("ReportLab not available - generated text report instead of PDF")
-        st.success(f"Report generated: {output_path}")
+        print("ReportLab not available - generated text report instead of PDF")
         return output_path
     
     def generate_marketing_report(self, data, campaign_name, output_path):
         """Generate a marketing campaign report as PDF"""
         try:
-            # Ensure the reports directory exists
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            
-            if REPORTLAB_AVAILABLE:
-                return self._generate_pdf_marketing_report(data, campaign_name, output_path)
-            else:
-                return self._generate_text_marketing_report(data, campaign_name, output_path)
-            
+            return self.build_report('marketing', data, campaign_name, output_path)
         except Exception as e:
-            st.error(f"Error generating marketing report: {e}")
-            import traceback
-            st.text(traceback.format_exc())
+            print(f"Error generating marketing report: {e}")
+            traceback.print_exc()
             return None
     
     def _generate_pdf_marketing_report(self, data, campaign_name, output_path):
@@ -196,37 +217,19 @@ SENTIMENT BREAKDOWN:
         doc = SimpleDocTemplate(output_path, pagesize=A4)
         story = []
         
-        # Get styles
-        styles = getSampleStyleSheet()
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            textColor=colors.darkgreen,
-            alignment=TA_CENTER,
-            spaceAfter=30
-        )
-        
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontSize=16,
-            textColor=colors.darkgreen,
-            spaceBefore=20,
-            spaceAfter=10
-        )
+        styles = self.styles
         
         # Title
-        story.append(Paragraph("MARKETING CAMPAIGN REPORT", title_style))
+        story.append(Paragraph("MARKETING CAMPAIGN REPORT", styles['marketing_title']))
         story.append(Spacer(1, 20))
         
         # Campaign info
-        story.append(Paragraph(f"<b>Campaign:</b> {campaign_name}", styles['Normal']))
-        story.append(Paragraph(f"<b>Generated:</b> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", styles['Normal']))
+        story.append(Paragraph(f"<b>Campaign:</b> {campaign_name}", styles['normal']))
+        story.append(Paragraph(f"<b>Generated:</b> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", styles['normal']))
         story.append(Spacer(1, 20))
         
         # Campaign performance section
-        story.append(Paragraph("CAMPAIGN PERFORMANCE", heading_style))
+        story.append(Paragraph("CAMPAIGN PERFORMANCE", styles['marketing_heading']))
         performance_data = [
             ['Metric', 'Value'],
             ['Total Mentions', str(len(data))],
@@ -236,22 +239,13 @@ SENTIMENT BREAKDOWN:
         ]
         
         performance_table = Table(performance_data)
-        performance_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.darkgreen),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.lightgreen),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+        performance_table.setStyle(styles['marketing_table'])
         story.append(performance_table)
         story.append(Spacer(1, 20))
         
         # Sentiment analysis
         if 'sentiment' in data.columns:
-            story.append(Paragraph("SENTIMENT ANALYSIS", heading_style))
+            story.append(Paragraph("SENTIMENT ANALYSIS", styles['marketing_heading']))
             sentiment_counts = data['sentiment'].value_counts()
             
             sentiment_data = [['Sentiment', 'Count', 'Percentage']]
@@ -260,21 +254,12 @@ SENTIMENT BREAKDOWN:
                 sentiment_data.append([str(sentiment), str(count), f"{percentage:.1f}%"])
             
             sentiment_table = Table(sentiment_data)
-            sentiment_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.darkgreen),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 12),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.lightgreen),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black)
-            ]))
+            sentiment_table.setStyle(styles['marketing_table'])
             story.append(sentiment_table)
             story.append(Spacer(1, 20))
         
         # Recommendations
-        story.append(Paragraph("STRATEGIC RECOMMENDATIONS", heading_style))
+        story.append(Paragraph("STRATEGIC RECOMMENDATIONS", styles['marketing_heading']))
         recommendations = [
             "• Increase positive content engagement through targeted messaging",
             "• Focus on high-performing demographics for better ROI",
@@ -284,11 +269,10 @@ SENTIMENT BREAKDOWN:
         ]
         
         for rec in recommendations:
-            story.append(Paragraph(rec, styles['Normal']))
+            story.append(Paragraph(rec, styles['normal']))
         
         # Build PDF
         doc.build(story)
-        st.success(f"PDF marketing report generated: {output_path}")
         return output_path
     
     def _generate_text_marketing_report(self, data, campaign_name, output_path):
@@ -326,6 +310,5 @@ SENTIMENT ANALYSIS:
         with open(output_path, 'w', encoding='utf-8') as f:
             f.write(report_content)
         
-        st.warning("ReportLab not available - generated text report instead of PDF")
-        st.success(f"Marketing report generated: {output_path}")
+        print("ReportLab not available - generated text report instead of PDF")
         return output_path
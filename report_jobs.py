@@ -0,0 +1,182 @@
+import hashlib
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime
+
+import pandas as pd
+
+from report_generator import REPORT_EXTENSION, REPORT_MIME, ReportGenerator, safe_file_name
+
+# Reports built at once across all sessions
+REPORT_WORKERS = 2
+# Jobs remembered (and artifacts kept on disk) before the oldest finished ones are dropped
+MAX_JOBS = 100
+
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+
+
+def data_fingerprint(data):
+    """Content hash of a frame: column names plus a per-row hash of the values"""
+    digest = hashlib.sha1(repr(list(map(str, data.columns))).encode('utf-8'))
+    try:
+        rows = pd.util.hash_pandas_object(data, index=False).to_numpy()
+        digest.update(rows.tobytes())
+    except TypeError:
+        # Unhashable cells (lists, dicts) - fall back to the text form
+        digest.update(data.to_csv(index=False).encode('utf-8'))
+    return digest.hexdigest()
+
+
+class ReportJob:
+    """One requested report and where it stands"""
+
+    def __init__(self, job_id, key, report_type, name, path):
+        self.id = job_id
+        self.key = key
+        self.report_type = report_type
+        self.name = name
+        self.path = path
+        self.status = QUEUED
+        self.error = None
+        self.created_at = datetime.now()
+        self.finished_at = None
+        self.future = None
+
+    @property
+    def finished(self):
+        return self.status in (DONE, FAILED)
+
+    @property
+    def mime(self):
+        """Download type: PDF, or plain text when ReportLab is missing"""
+        return REPORT_MIME
+
+    @property
+    def download_name(self):
+        """File name offered to the browser"""
+        stamp = self.created_at.strftime('%Y%m%d_%H%M%S')
+        return f"{self.report_type}_report_{safe_file_name(self.name)}_{stamp}.{REPORT_EXTENSION}"
+
+
+class ReportJobQueue:
+    """Background report builds: submit, poll status by job id, download.
+
+    Reports are built by a bounded pool of worker threads, so a click
+    returns at once and many users cannot start more builds than there are
+    workers. Each job writes to its own uuid-named file. Requests for the
+    same data (by content hash), report type and name share one job,
+    so identical reports are built once and the PDF is reused while it
+    exists; a failed job is retried on the next submit.
+    """
+
+    def __init__(self, generator=None, reports_dir="reports", workers=REPORT_WORKERS, max_jobs=MAX_JOBS):
+        self.generator = generator or ReportGenerator()
+        self.reports_dir = reports_dir
+        self.max_jobs = max_jobs
+        os.makedirs(self.reports_dir, exist_ok=True)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='report-job')
+        self._lock = threading.Lock()
+        self._jobs = OrderedDict()  # job id -> ReportJob, oldest first
+        self._by_key = {}  # (fingerprint, report type, name) -> job id
+
+    def submit(self, report_type, data, name):
+        """Queue a report for data (or reuse an identical one); returns the job id"""
+        key = (data_fingerprint(data), report_type, str(name))
+        with self._lock:
+            job = self._jobs.get(self._by_key.get(key))
+            if job is not None and job.status != FAILED and (not job.finished or os.path.exists(job.path)):
+                self._jobs.move_to_end(job.id)
+                return job.id
+
+            job_id = uuid.uuid4().hex
+            path = os.path.join(self.reports_dir, f"{report_type}_report_{job_id}.{REPORT_EXTENSION}")
+            job = ReportJob(job_id, key, report_type, name, path)
+            self._jobs[job_id] = job
+            self._by_key[key] = job_id
+            self._evict()
+            job.future = self._executor.submit(self._run, job, data)
+        return job_id
+
+    def _run(self, job, data):
+        """Worker: build one report and record the outcome"""
+        job.status = RUNNING
+        try:
+            self.generator.build_report(job.report_type, data, job.name, job.path)
+            job.status = DONE
+        except Exception as e:
+            print(f"Error generating {job.report_type} report {job.id}: {e}")
+            job.error = str(e)
+            job.status = FAILED
+        job.finished_at = datetime.now()
+
+    def _evict(self):
+        """Forget the oldest finished jobs over the limit and delete their files; caller holds the lock"""
+        for job_id in list(self._jobs):
+            if len(self._jobs) <= self.max_jobs:
+                break
+            job = self._jobs[job_id]
+            if not job.finished:
+                continue
+            del self._jobs[job_id]
+            if self._by_key.get(job.key) == job_id:
+                del self._by_key[job.key]
+            try:
+                os.remove(job.path)
+            except OSError:
+                pass
+
+    def get(self, job_id):
+        """The job with this id, or None if it is unknown or was evicted"""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def status(self, job_id):
+        """'queued', 'running', 'done', 'failed', or None for an unknown job"""
+        job = self.get(job_id)
+        return job.status if job is not None else None
+
+    def wait(self, job_id, timeout=None):
+        """Block until a job finishes or timeout seconds pass; returns its status"""
+        job = self.get(job_id)
+        if job is None:
+            return None
+        wait([job.future], timeout=timeout)
+        return job.status
+
+    def read(self, job_id):
+        """Bytes of a finished report, or None if it is not ready or its file is gone"""
+        job = self.get(job_id)
+        if job is None or job.status != DONE:
+            return None
+        try:
+            with open(job.path, 'rb') as file:
+                return file.read()
+        except OSError:
+            return None
+
+    def stats(self):
+        """Job counts by status for the admin System Health section"""
+        with self._lock:
+            counts = {QUEUED: 0, RUNNING: 0, DONE: 0, FAILED: 0}
+            for job in self._jobs.values():
+                counts[job.status] += 1
+            return counts
+
+
+_queue = None
+_queue_lock = threading.Lock()
+
+
+def get_report_queue(reports_dir="reports"):
+    """Return the process-wide report job queue"""
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            _queue = ReportJobQueue(reports_dir=reports_dir)
+        return _queue
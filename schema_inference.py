@@ -0,0 +1,102 @@
+import pandas as pd
+
+from sentiment_labels import SENTIMENT_CODE_COLUMN
+
+# Rows inspected when a column has to be judged by its values
+SAMPLE_ROWS = 5000
+
+SENTIMENT_KEYWORDS = ['sentiment', 'label', 'rating', 'score', 'class', 'category', 'polarity']
+SENTIMENT_WORDS = ['positive', 'negative', 'neutral', 'good', 'bad', 'poor', 'excellent']
+TEXT_KEYWORDS = ['text', 'review', 'comment', 'feedback', 'message', 'content', 'description']
+
+# Key in DataFrame.attrs under which a precomputed schema travels with a frame
+SCHEMA_ATTR = 'schema'
+
+
+def sample_rows(df, n=SAMPLE_ROWS):
+    """Bounded, reproducible row sample of a frame"""
+    if len(df) <= n:
+        return df
+    return df.sample(n, random_state=42)
+
+
+def _is_text_dtype(dtype):
+    """Object or string columns (pandas 3 reads text as the str dtype)"""
+    return pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype)
+
+
+def infer_sentiment_column(df, sample=None):
+    """Column holding sentiment labels, by name and then by sampled values"""
+    for col in df.columns:
+        if col == SENTIMENT_CODE_COLUMN:
+            continue
+        col_lower = col.lower()
+        if any(keyword in col_lower for keyword in SENTIMENT_KEYWORDS):
+            return col
+
+    # If no obvious sentiment column, check for columns with sentiment-like values
+    sample = sample_rows(df) if sample is None else sample
+    for col in df.columns:
+        if _is_text_dtype(df[col].dtype):
+            unique_vals = sample[col].dropna().unique()
+            unique_str = [str(val).lower() for val in unique_vals[:10]]
+            if any(word in ' '.join(unique_str) for word in SENTIMENT_WORDS):
+                return col
+    return None
+
+
+def infer_text_column(df, sample=None):
+    """Column holding the feedback text, by name and then by sampled length"""
+    for col in df.columns:
+        col_lower = col.lower()
+        if any(keyword in col_lower for keyword in TEXT_KEYWORDS):
+            return col
+
+    # If no obvious text column, find the column with longest average text length
+    sample = sample_rows(df) if sample is None else sample
+    text_candidates = []
+    for col in df.columns:
+        if _is_text_dtype(df[col].dtype):
+            try:
+                avg_length = sample[col].astype(str).str.len().mean()
+                if avg_length > 20:  # Likely to be text if average length > 20 chars
+                    text_candidates.append((col, avg_length))
+            except Exception:
+                continue
+
+    if text_candidates:
+        return max(text_candidates, key=lambda x: x[1])[0]
+
+    # Fallback to first string column
+    for col in df.columns:
+        if _is_text_dtype(df[col].dtype):
+            return col
+
+    return df.columns[0] if len(df.columns) > 0 else None
+
+
+def infer_date_columns(df):
+    """Columns whose name suggests a date or time"""
+    return [col for col in df.columns if 'date' in col.lower() or 'time' in col.lower()]
+
+
+def infer_schema(df):
+    """Detect the sentiment, text and date columns from one bounded sample"""
+    sample = sample_rows(df)
+    return {
+        'sentiment_column': infer_sentiment_column(df, sample),
+        'text_column': infer_text_column(df, sample),
+        'date_columns': infer_date_columns(df),
+        'sample_rows': len(sample),
+    }
+
+
+def get_schema(df):
+    """Schema attached to the frame when it was loaded, else inferred from a sample"""
+    schema = df.attrs.get(SCHEMA_ATTR)
+    if schema is not None:
+        detected = [schema['sentiment_column'], schema['text_column']] + list(schema['date_columns'])
+        # A projected or reshaped frame may no longer have the detected columns
+        if all(col is None or col in df.columns for col in detected):
+            return schema
+    return infer_schema(df)
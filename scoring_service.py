@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Local HTTP scoring service for the production sentiment model.
+
+Loads the promoted model/vectorizer pair once and serves predictions as
+JSON. Concurrent requests are coalesced into micro-batches: the first
+request of a batch waits at most --max-wait-ms for others to arrive, and
+the batch's texts not already in the shared prediction cache are scored
+in one sparse transform + predict_proba call. Standard library only;
+binds to localhost by default.
+
+Endpoints:
+    POST /predict        {"text": "..."}          -> {"label", "confidence", "model_version"}
+    POST /predict_batch  {"texts": ["...", ...]}  -> {"predictions": [...], "model_version"}
+    GET  /health                                  -> {"status", "model_version", "stats", "cache"}
+
+Usage:
+    python scoring_service.py --port 8502 --max-wait-ms 5 --max-batch 256
+    curl -s localhost:8502/predict -d '{"text": "love the new app"}'
+"""
+
+import argparse
+import json
+import queue
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from batch_scorer import score_texts
+from model_manager import DEFAULT_MODEL_PATH, DEFAULT_VECTORIZER_PATH, get_model_manager
+from prediction_cache import get_prediction_cache
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8502
+# How long the first request of a batch waits for others, and the most texts scored at once
+DEFAULT_MAX_WAIT_MS = 5
+DEFAULT_MAX_BATCH = 256
+# Largest request body accepted
+MAX_BODY_BYTES = 10 * 1024 * 1024
+
+
+class ModelScorer:
+    """Score texts with the process-wide model pair; a promotion is picked up on the next batch"""
+
+    def __init__(self, model_path=None, vectorizer_path=None, use_cache=True):
+        self.manager = get_model_manager(model_path, vectorizer_path)
+        # Shared with the dashboards and batch scoring running in the same process
+        self.cache = get_prediction_cache() if use_cache else None
+
+    def __call__(self, texts):
+        """Return (labels, confidences, model version) for a list of texts"""
+        model, vectorizer, version = self.manager.get_versioned_model()
+        labels, confidences = score_texts(texts, model, vectorizer, self.cache, version)
+        return labels.tolist(), confidences.tolist(), version
+
+
+class _Request:
+    """Texts of one HTTP request waiting for their share of a batch"""
+
+    def __init__(self, texts):
+        self.texts = texts
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class MicroBatcher:
+    """Coalesce concurrent scoring calls into batches scored by one thread.
+
+    score() blocks its caller until the batch holding its texts is scored.
+    A batch closes when max_batch texts are collected or max_wait seconds
+    have passed since its first request arrived, so a lone request waits at
+    most max_wait while a busy service scores many requests per model call.
+    A request is never split across batches.
+    """
+
+    def __init__(self, scorer, max_batch=DEFAULT_MAX_BATCH, max_wait=DEFAULT_MAX_WAIT_MS / 1000):
+        self.scorer = scorer
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue = queue.Queue()
+        self._stats_lock = threading.Lock()
+        self.requests = 0
+        self.batches = 0
+        self.texts = 0
+        self._thread = threading.Thread(target=self._run, name='scoring-batcher', daemon=True)
+        self._thread.start()
+
+    def score(self, texts):
+        """Return (labels, confidences, model version) for texts, scored in a shared batch"""
+        request = _Request(list(texts))
+        self._queue.put(request)
+        request.done.wait()
+        if request.error is not None:
+            raise request.error
+        return request.result
+
+    def _collect(self):
+        """Block for the first request, then gather more until the batch is full or max_wait passes"""
+        batch = [self._queue.get()]
+        size = len(batch[0].texts)
+        deadline = time.monotonic() + self.max_wait
+        while size < self.max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                request = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            batch.append(request)
+            size += len(request.texts)
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            texts = [text for request in batch for text in request.texts]
+            try:
+                labels, confidences, version = self.scorer(texts)
+                start = 0
+                for request in batch:
+                    end = start + len(request.texts)
+                    request.result = (labels[start:end], confidences[start:end], version)
+                    start = end
+            except Exception as e:
+                for request in batch:
+                    request.error = e
+            with self._stats_lock:
+                self.requests += len(batch)
+                self.batches += 1
+                self.texts += len(texts)
+            for request in batch:
+                request.done.set()
+
+    def cache_stats(self):
+        """Prediction cache counters, or None when the scorer has no cache"""
+        cache = getattr(self.scorer, 'cache', None)
+        return cache.stats() if cache is not None else None
+
+    def stats(self):
+        """Request, batch and text counters since start"""
+        with self._stats_lock:
+            return {
+                'requests': self.requests,
+                'batches': self.batches,
+                'texts': self.texts,
+                'mean_batch_size': self.texts / self.batches if self.batches else 0.0,
+                'queue_depth': self._queue.qsize(),
+            }
+
+
+class ScoringRequestHandler(BaseHTTPRequestHandler):
+    server_version = 'SentimentScoring/1.0'
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self):
+        """Parsed JSON object body, or None after an error response was sent"""
+        length = int(self.headers.get('Content-Length') or 0)
+        if length > MAX_BODY_BYTES:
+            self._send_json(413, {'error': f"Request body over {MAX_BODY_BYTES} bytes"})
+            return None
+        try:
+            payload = json.loads(self.rfile.read(length) or b'null')
+        except ValueError:
+            payload = None
+        if not isinstance(payload, dict):
+            self._send_json(400, {'error': "Request body must be a JSON object"})
+            return None
+        return payload
+
+    def do_GET(self):
+        if self.path != '/health':
+            self._send_json(404, {'error': f"Unknown endpoint: {self.path}"})
+            return
+        self._send_json(200, {
+            'status': 'ok',
+            'model_version': self.server.model_version,
+            'stats': self.server.batcher.stats(),
+            'cache': self.server.batcher.cache_stats(),
+        })
+
+    def do_POST(self):
+        if self.path not in ('/predict', '/predict_batch'):
+            self._send_json(404, {'error': f"Unknown endpoint: {self.path}"})
+            return
+        payload = self._read_json()
+        if payload is None:
+            return
+
+        single = self.path == '/predict'
+        field = 'text' if single else 'texts'
+        texts = payload.get(field)
+        if single and isinstance(texts, str):
+            texts = [texts]
+        elif single or not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+            expected = 'a string' if single else 'a list of strings'
+            self._send_json(400, {'error': f"'{field}' must be {expected}"})
+            return
+
+        try:
+            labels, confidences, version = self.server.batcher.score(texts)
+        except Exception as e:
+            self._send_json(503, {'error': f"Scoring failed: {e}"})
+            return
+        self.server.model_version = version
+
+        predictions = [{'label': str(label), 'confidence': float(confidence)}
+                       for label, confidence in zip(labels, confidences)]
+        if single:
+            self._send_json(200, dict(predictions[0], model_version=version))
+        else:
+            self._send_json(200, {'predictions': predictions, 'model_version': version})
+
+    def log_message(self, format, *args):
+        # One line per request would dominate the cost of a small prediction
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class ScoringServer(ThreadingHTTPServer):
+    """Threaded HTTP server whose handler threads share one MicroBatcher"""
+
+    daemon_threads = True
+    # socketserver's default backlog of 5 resets connections under concurrent load
+    request_queue_size = 128
+
+    def __init__(self, address, batcher, verbose=False):
+        super().__init__(address, ScoringRequestHandler)
+        self.batcher = batcher
+        self.verbose = verbose
+        self.model_version = None
+
+
+def make_server(host=DEFAULT_HOST, port=DEFAULT_PORT, scorer=None, max_batch=DEFAULT_MAX_BATCH,
+                max_wait_ms=DEFAULT_MAX_WAIT_MS, verbose=False):
+    """Create a scoring server; port 0 picks a free port (see server.server_address)"""
+    batcher = MicroBatcher(scorer or ModelScorer(), max_batch=max_batch, max_wait=max_wait_ms / 1000)
+    return ScoringServer((host, port), batcher, verbose=verbose)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local HTTP sentiment scoring service")
+    parser.add_argument('--host', default=DEFAULT_HOST, help="Interface to bind (default: localhost only)")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--model', default=DEFAULT_MODEL_PATH, help="Path to sentiment_model.joblib")
+    parser.add_argument('--vectorizer', default=DEFAULT_VECTORIZER_PATH, help="Path to tfidf_vectorizer.joblib")
+    parser.add_argument('--max-wait-ms', type=float, default=DEFAULT_MAX_WAIT_MS,
+                        help="Longest a request waits for others to join its batch")
+    parser.add_argument('--max-batch', type=int, default=DEFAULT_MAX_BATCH, help="Most texts scored per batch")
+    parser.add_argument('--no-cache', action='store_true', help="Score every text, even repeated ones")
+    parser.add_argument('--verbose', action='store_true', help="Log every request")
+    args = parser.parse_args(argv)
+
+    scorer = ModelScorer(args.model, args.vectorizer, use_cache=not args.no_cache)
+    # Load the model before accepting requests, so the first caller does not pay for it
+    scorer.manager.get_model()
+    server = make_server(args.host, args.port, scorer, args.max_batch, args.max_wait_ms, args.verbose)
+    server.model_version = scorer.manager.version
+    host, port = server.server_address[:2]
+    print(f"✅ Serving model {server.model_version} on http://{host}:{port} "
+          f"(batches of up to {args.max_batch}, {args.max_wait_ms:g} ms max wait)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
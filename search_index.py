@@ -0,0 +1,104 @@
+import re
+
+import pandas as pd
+
+from dataset_store import build_lock, file_signature
+
+# Rows tokenized and inserted at a time when a dataset is indexed from a loaded frame
+BUILD_CHUNKSIZE = 50000
+# Dataset rows are stored under rowid = dataset_id << ROW_BITS | row number
+ROW_BITS = 40
+
+SEARCH_TERM_PATTERN = re.compile(r"\w+")
+
+
+def fts_query(text, prefix=True):
+    """FTS5 MATCH expression for free text typed by a user.
+
+    Every word must appear (implicit AND); words are quoted so FTS5 operators
+    and punctuation in the input are taken literally. With prefix, the last
+    word also matches longer words, so results follow the user's typing.
+    Returns None when the text has no searchable words.
+    """
+    terms = SEARCH_TERM_PATTERN.findall(str(text))
+    if not terms:
+        return None
+    phrases = [f'"{term}"' for term in terms]
+    if prefix:
+        phrases[-1] += '*'
+    return ' '.join(phrases)
+
+
+def row_range(dataset_id):
+    """(first, last) rowid of a dataset's rows in the dataset_fts table"""
+    first = dataset_id << ROW_BITS
+    return first, first + (1 << ROW_BITS) - 1
+
+
+class SearchIndex:
+    """Keyword search over feedback and dataset files through SQLite FTS5.
+
+    The feedback index is kept in sync with the feedback table by triggers.
+    Dataset files are indexed at ingest (or once from a loaded frame), each
+    dataset under a contiguous rowid range, so one dataset is searched,
+    counted or dropped with a rowid range rather than a scan. Results are
+    ordered by bm25 rank and paged with limit/offset; dataset searches
+    return row numbers of the dataset as loaded.
+    """
+
+    def __init__(self, db):
+        self.db = db
+
+    def search_feedback(self, text, limit=20, offset=0, prefix=True):
+        """Ranked feedback rows matching the search text"""
+        return self.db.search_feedback(fts_query(text, prefix), limit, offset)
+
+    def count_feedback(self, text, prefix=True):
+        """Number of feedback rows matching the search text"""
+        return self.db.count_feedback_matches(fts_query(text, prefix))
+
+    def add(self, dataset, texts, start_row):
+        """Index a batch of texts as rows start_row, start_row + 1, ..."""
+        return self.db.add_dataset_search_rows(dataset, pd.Series(texts).tolist(), start_row)
+
+    def clear(self, dataset):
+        """Drop a dataset's rows before it is indexed from scratch"""
+        return self.db.clear_dataset_search(dataset)
+
+    def mark_current(self, dataset, path):
+        """Record that the index covers the file at path as it is now"""
+        return self.db.set_dataset_search_signature(dataset, file_signature(path))
+
+    def is_current(self, dataset, path):
+        """Whether the index was built from the file at path as it is now"""
+        state = self.db.get_dataset_search_state(dataset)
+        return state is not None and state[1] == file_signature(path)
+
+    def lock(self, dataset):
+        """Lock to hold while the dataset's rows are cleared and indexed again"""
+        return build_lock('search_index', self.db.db_path, dataset)
+
+    def ensure(self, dataset, path, df, text_col):
+        """Index a loaded frame unless the index already matches the file"""
+        if self.is_current(dataset, path):
+            return False
+        with self.lock(dataset):
+            # Another session may have indexed it while this one waited
+            if self.is_current(dataset, path):
+                return False
+            self.clear(dataset)
+            for start in range(0, len(df), BUILD_CHUNKSIZE):
+                # A partial index is never marked current, so the next load tries again
+                if not self.add(dataset, df[text_col].iloc[start:start + BUILD_CHUNKSIZE], start):
+                    return False
+            self.mark_current(dataset, path)
+        return True
+
+    def search(self, dataset, text, limit=20, offset=0, prefix=True):
+        """Ranked matches as a frame of (row, rank); limit=None returns every match"""
+        return self.db.search_dataset(dataset, fts_query(text, prefix), limit, offset)
+
+    def count(self, dataset, text, prefix=True):
+        """Number of rows matching the search text"""
+        return self.db.count_dataset_matches(dataset, fts_query(text, prefix))
+
@@ -1,15 +1,17 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
 import os
-from wordcloud import WordCloud
-import joblib
-import sqlite3
-from datetime import datetime, timedelta
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
-import streamlit_authenticator as stauth
-import bcrypt
+from model_manager import get_model_manager
+from prediction_cache import get_prediction_cache
+from dataset_cache import get_dataset_cache
+from database_manager import DatabaseManager
+from token_index import MAX_WORDS, get_token_index, token_counts
+from search_index import SearchIndex
+from chart_renderer import chart_key, get_chart_renderer
+from sentiment_rollup import SentimentRollup, parse_days, rolling_mean
+
+# Search results shown per page
+SEARCH_PAGE_SIZE = 10
 
 st.title('Sentiment Analysis Dashboard')
 
@@ -25,7 +27,8 @@ selected_file = st.sidebar.selectbox('Select dataset', available_files)
 data_path = os.path.join(data_folder, selected_file)
 
 try:
-    df = pd.read_csv(data_path)
+    # Shared, process-wide copy - derive new frames instead of modifying df in place
+    df = get_dataset_cache().get(data_path)
 except Exception as e:
     st.error(f"Failed to load data: {e}")
     st.stop()
@@ -46,6 +49,15 @@ def guess_text_column(df):
 sentiment_col = guess_sentiment_column(df)
 text_col = guess_text_column(df)
 
+# Word counts for the word cloud and the keyword search index, built once per version of the file
+db = DatabaseManager()
+token_index = get_token_index(db)
+token_index.ensure(selected_file, data_path, df, text_col, sentiment_col)
+search_index = SearchIndex(db)
+if db.fts_available:
+    search_index.ensure(selected_file, data_path, df, text_col)
+dataset_rows = len(df)
+
 st.sidebar.header('Filters')
 unique_sentiments = df[sentiment_col].unique()
 selected_sentiments = st.sidebar.multiselect('Select Sentiments', unique_sentiments, default=list(unique_sentiments))
@@ -53,14 +65,19 @@ selected_sentiments = st.sidebar.multiselect('Select Sentiments', unique_sentime
 filtered_df = df[df[sentiment_col].isin(selected_sentiments)]
 
 # Enhanced Time Range Selector
+date_filter = None
 st.sidebar.subheader('Time Range Filter')
+rollup = SentimentRollup(db)
+days = pd.DatetimeIndex([])
 if 'date' in df.columns or 'time' in df.columns:
     date_col = 'date' if 'date' in df.columns else 'time'
-    df[date_col] = pd.to_datetime(df[date_col], errors='coerce')
-    df = df.dropna(subset=[date_col])
-    
-    min_date = df[date_col].min().date()
-    max_date = df[date_col].max().date()
+    # The day range comes from the daily rollup, so reruns parse no dates
+    rollup.ensure(selected_file, data_path, df, date_col, sentiment_col)
+    days = rollup.daily(selected_file).index
+
+if len(days) > 0:
+    min_date = days.min().date()
+    max_date = days.max().date()
     
     date_range = st.sidebar.date_input(
         'Select date range',
@@ -69,61 +86,82 @@ if 'date' in df.columns or 'time' in df.columns:
         max_value=max_date
     )
     
-    if len(date_range) == 2:
+    if len(date_range) == 2 and tuple(date_range) != (min_date, max_date):
         start_date, end_date = date_range
+        date_filter = (start_date, end_date)
+        row_days = parse_days(filtered_df[date_col])
         filtered_df = filtered_df[
-            (filtered_df[date_col].dt.date >= start_date) & 
-            (filtered_df[date_col].dt.date <= end_date)
+            (row_days >= pd.Timestamp(start_date)) & 
+            (row_days <= pd.Timestamp(end_date))
         ]
 
+# Charts are cached per dataset version and filter state
+chart_renderer = get_chart_renderer()
+chart_filters = {'sentiments': tuple(selected_sentiments), 'dates': date_filter}
+
+def draw_distribution(fig):
+    ax = fig.subplots()
+    filtered_df[sentiment_col].value_counts().plot(kind='bar', color=['red', 'gray', 'green'], ax=ax)
+    ax.set_xlabel('Sentiment')
+    ax.set_ylabel('Count')
+
+def draw_distribution_pie(fig):
+    ax_pie = fig.subplots()
+    filtered_df[sentiment_col].value_counts().plot(
+        kind='pie', autopct='%1.1f%%', startangle=90, ax=ax_pie, colors=['red', 'gray', 'green'][:len(unique_sentiments)])
+    ax_pie.set_ylabel('')
+    ax_pie.set_xlabel('')
+    ax_pie.set_title('')
+
+# Both charts render in parallel on the worker threads
+distribution_png = chart_renderer.submit(chart_key(data_path, 'distribution', **chart_filters), draw_distribution, (6.4, 4.8))
+pie_png = chart_renderer.submit(chart_key(data_path, 'distribution_pie', **chart_filters), draw_distribution_pie, (6.4, 4.8))
+
 st.subheader('Sentiment Distribution')
-fig, ax = plt.subplots()
-filtered_df[sentiment_col].value_counts().plot(kind='bar', color=['red', 'gray', 'green'], ax=ax)
-plt.xlabel('Sentiment')
-plt.ylabel('Count')
-st.pyplot(fig)
+st.image(distribution_png.result())
 
 # Pie Chart Option for Sentiment Distribution
 st.subheader('Sentiment Distribution (Pie Chart)')
-fig_pie, ax_pie = plt.subplots()
-filtered_df[sentiment_col].value_counts().plot(
-    kind='pie', autopct='%1.1f%%', startangle=90, ax=ax_pie, colors=['red', 'gray', 'green'][:len(unique_sentiments)])
-ax_pie.set_ylabel('')
-ax_pie.set_xlabel('')
-ax_pie.set_title('')
-st.pyplot(fig_pie)
+st.image(pie_png.result())
 
 st.subheader('Sample Reviews')
 st.write(filtered_df[[text_col, sentiment_col]].sample(min(5, len(filtered_df))))
 
-if 'date' in df.columns or 'time' in df.columns:
-    date_col = 'date' if 'date' in df.columns else 'time'
+if len(days) > 0:
     st.subheader('Sentiment Over Time (with Rolling Average)')
-    time_df = filtered_df.copy()
-    time_df[date_col] = pd.to_datetime(time_df[date_col], errors='coerce')
-    time_df = time_df.dropna(subset=[date_col])
-    time_df = time_df.sort_values(date_col)
-    # Group by date and sentiment
-    grouped = time_df.groupby([pd.Grouper(key=date_col, freq='D'), sentiment_col]).size().unstack().fillna(0)
-    # Rolling average
     window = st.slider('Rolling window (days)', min_value=1, max_value=30, value=7)
-    grouped_rolling = grouped.rolling(window=window, min_periods=1).mean()
-    fig2, ax2 = plt.subplots()
-    grouped_rolling.plot(ax=ax2)
-    plt.ylabel('Rolling Avg Count')
-    plt.title(f'Sentiment Over Time ({window}-day Rolling Avg)')
-    st.pyplot(fig2)
+
+    def draw_rolling_trend(fig):
+        # Daily counts from the rollup; the window is taken over cumulative sums, never raw rows
+        start_date, end_date = date_filter or (None, None)
+        grouped = rollup.daily(selected_file, start_date, end_date, sentiments=selected_sentiments)
+        ax2 = fig.subplots()
+        if not grouped.empty:
+            rolling_mean(grouped, window).plot(ax=ax2)
+        ax2.set_ylabel('Rolling Avg Count')
+        ax2.set_title(f'Sentiment Over Time ({window}-day Rolling Avg)')
+
+    st.image(chart_renderer.png(chart_key(data_path, 'rolling_trend', window=window, **chart_filters),
+                                draw_rolling_trend, (6.4, 4.8)))
 
 # Word Cloud Visualization
 st.subheader('Word Cloud by Sentiment')
 selected_wc_sentiment = st.selectbox('Select sentiment for word cloud', unique_sentiments)
-wc_text = ' '.join(filtered_df[filtered_df[sentiment_col] == selected_wc_sentiment][text_col].astype(str))
-if wc_text.strip():
-    wc = WordCloud(width=800, height=400, background_color='white').generate(wc_text)
-    fig_wc, ax_wc = plt.subplots(figsize=(10, 5))
-    ax_wc.imshow(wc, interpolation='bilinear')
-    ax_wc.axis('off')
-    st.pyplot(fig_wc)
+
+def filtered_frequencies():
+    """Token counts for the word cloud sentiment within the selected date range"""
+    wc_texts = filtered_df.loc[filtered_df[sentiment_col] == selected_wc_sentiment, text_col]
+    return token_counts(wc_texts).head(MAX_WORDS).to_dict()
+
+# Whole-dataset clouds come from the token index; date-filtered ones are counted once per range
+if selected_wc_sentiment not in selected_sentiments:
+    wc_image = None
+elif date_filter is None:
+    wc_image = token_index.word_cloud(selected_file, [selected_wc_sentiment])
+else:
+    wc_image = token_index.word_cloud(selected_file, [selected_wc_sentiment], date_filter, filtered_frequencies)
+if wc_image is not None:
+    st.image(wc_image)
 else:
     st.info('No text available for this sentiment.')
 
@@ -140,7 +178,29 @@ st.download_button(
 # Search/Highlight Reviews by Keyword
 st.subheader('Search Reviews by Keyword')
 search_term = st.text_input('Enter keyword to search in reviews:')
-if search_term:
+if search_term and db.fts_available:
+    page = 1
+    if len(filtered_df) == dataset_rows:
+        # No filter applied - count and page straight from the index
+        total = search_index.count(selected_file, search_term)
+        pages = max((total - 1) // SEARCH_PAGE_SIZE + 1, 1)
+        if pages > 1:
+            page = st.number_input('Results page', min_value=1, max_value=pages, value=1)
+        rows = search_index.search(selected_file, search_term, SEARCH_PAGE_SIZE, (page - 1) * SEARCH_PAGE_SIZE)['row']
+    else:
+        # Ranked matches, restricted to the rows left by the sidebar filters
+        ranked = search_index.search(selected_file, search_term, limit=None)['row']
+        ranked = ranked[ranked.isin(filtered_df.index)]
+        total = len(ranked)
+        pages = max((total - 1) // SEARCH_PAGE_SIZE + 1, 1)
+        if pages > 1:
+            page = st.number_input('Results page', min_value=1, max_value=pages, value=1)
+        rows = ranked.iloc[(page - 1) * SEARCH_PAGE_SIZE:page * SEARCH_PAGE_SIZE]
+    st.write(f"Found {total} reviews matching '{search_term}':")
+    st.write(filtered_df.loc[rows, [text_col, sentiment_col]])
+    if total == 0:
+        st.info('No reviews found with that keyword.')
+elif search_term:
     search_results = filtered_df[filtered_df[text_col].str.contains(search_term, case=False, na=False)]
     st.write(f"Found {len(search_results)} reviews containing '{search_term}':")
     st.write(search_results[[text_col, sentiment_col]].head(10))
@@ -152,11 +212,12 @@ st.subheader('Predict Sentiment for Your Own Text')
 user_input = st.text_area('Enter text to analyze sentiment:')
 if st.button('Predict Sentiment') and user_input.strip():
     try:
-        model = joblib.load(os.path.join(os.path.dirname(__file__), '..', 'sentiment_model.joblib'))
-        vectorizer = joblib.load(os.path.join(os.path.dirname(__file__), '..', 'tfidf_vectorizer.joblib'))
-        cleaned = user_input  # Optionally, apply your clean_text function here
-        X_vec = vectorizer.transform([cleaned])
-        pred = model.predict(X_vec)[0]
+        model, vectorizer, model_version = get_model_manager(
+            os.path.join(os.path.dirname(__file__), '..', 'sentiment_model.joblib'),
+            os.path.join(os.path.dirname(__file__), '..', 'tfidf_vectorizer.joblib')
+        ).get_versioned_model()
+        proba = get_prediction_cache().predict_proba([user_input], model, vectorizer, model_version)[0]
+        pred = model.classes_[proba.argmax()]
         st.success(f'Predicted Sentiment: {pred}')
     except Exception as e:
         st.error(f'Prediction failed: {e}')
@@ -165,11 +226,15 @@ if st.button('Predict Sentiment') and user_input.strip():
 if any(col.lower() in ['platform', 'source', 'channel'] for col in df.columns):
     platform_col = next(col for col in df.columns if col.lower() in ['platform', 'source', 'channel'])
     st.subheader('Platform Comparison')
-    fig_platform, ax_platform = plt.subplots()
-    pd.crosstab(filtered_df[platform_col], filtered_df[sentiment_col]).plot(kind='bar', ax=ax_platform)
-    plt.xlabel('Platform')
-    plt.ylabel('Count')
-    plt.title('Sentiment by Platform')
-    st.pyplot(fig_platform)
+
+    def draw_platform_comparison(fig):
+        ax_platform = fig.subplots()
+        pd.crosstab(filtered_df[platform_col], filtered_df[sentiment_col]).plot(kind='bar', ax=ax_platform)
+        ax_platform.set_xlabel('Platform')
+        ax_platform.set_ylabel('Count')
+        ax_platform.set_title('Sentiment by Platform')
+
+    st.image(chart_renderer.png(chart_key(data_path, 'platform_comparison', column=platform_col, **chart_filters),
+                                draw_platform_comparison, (6.4, 4.8)))
 else:
     st.info('No platform/source/channel column found for platform comparison.')
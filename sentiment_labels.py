@@ -0,0 +1,108 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+# Compact sentiment codes - an int8 column next to the raw labels
+UNKNOWN = -1
+NEGATIVE = 0
+NEUTRAL = 1
+POSITIVE = 2
+LABELS = ('negative', 'neutral', 'positive')
+
+SENTIMENT_CODE_COLUMN = 'sentiment_code'
+
+# Whole-word matches, so "12" or "0.2" are never read as a 1 or a 2
+NEGATIVE_PATTERN = re.compile(r'\b(negative|neg|bad|poor|awful|terrible|horrible|worst)\b')
+POSITIVE_PATTERN = re.compile(r'\b(positive|pos|good|great|excellent|amazing|best)\b')
+NEUTRAL_PATTERN = re.compile(r'\b(neutral|neu|mixed|average|ok|okay)\b')
+
+
+def _numeric_codes(values):
+    """Codes for numeric labels: -1..1 polarity, 0/1, 0-2 or 0-4 classes, 1-5 or 1-10 ratings"""
+    codes = np.full(len(values), UNKNOWN, dtype=np.int8)
+    valid = ~np.isnan(values)
+    if not valid.any():
+        return codes
+
+    # Zero-based class scales are checked before the ratings, where 0-2 would all read as negative
+    low, high = values[valid].min(), values[valid].max()
+    if low < 0 and high <= 1:
+        negative, positive = values < 0, values > 0
+    elif low >= 0 and high <= 1:
+        negative, positive = values < 0.5, values > 0.5
+    elif low == 0 and high <= 2:
+        negative, positive = values < 1, values > 1
+    elif low == 0 and high <= 4:
+        negative, positive = values <= 1, values >= 3
+    elif high <= 5:
+        negative, positive = values <= 2, values >= 4
+    elif high <= 10:
+        negative, positive = values <= 4, values >= 7
+    else:
+        return codes
+
+    codes[valid] = NEUTRAL
+    codes[valid & negative] = NEGATIVE
+    codes[valid & positive] = POSITIVE
+    return codes
+
+
+def _text_code(label):
+    """Code for one text label"""
+    label = label.strip().lower()
+    if NEGATIVE_PATTERN.search(label):
+        return NEGATIVE
+    if POSITIVE_PATTERN.search(label):
+        return POSITIVE
+    if NEUTRAL_PATTERN.search(label):
+        return NEUTRAL
+    return UNKNOWN
+
+
+def normalize_labels(labels):
+    """Map raw sentiment labels to an int8 code array.
+
+    Only the distinct values are classified, then broadcast back with the
+    factorized codes, so the cost depends on the number of distinct labels.
+    Numeric labels (or numeric strings) are read on the scale of the column.
+    """
+    factor_codes, uniques = pd.factorize(pd.Series(labels), use_na_sentinel=True)
+    if len(uniques) == 0:
+        return np.full(len(factor_codes), UNKNOWN, dtype=np.int8)
+
+    uniques = pd.Series(uniques, dtype=object)
+    numeric = pd.to_numeric(uniques, errors='coerce').to_numpy(dtype=float)
+    unique_codes = _numeric_codes(numeric)
+    for i in np.flatnonzero(np.isnan(numeric)):
+        unique_codes[i] = _text_code(str(uniques.iloc[i]))
+
+    # factorize marks missing values with -1, which maps to UNKNOWN
+    lookup = np.append(unique_codes, np.int8(UNKNOWN))
+    return lookup[factor_codes]
+
+
+def add_sentiment_codes(df, sentiment_col):
+    """Return df with the int8 code column added (if not already present)"""
+    if SENTIMENT_CODE_COLUMN in df.columns or sentiment_col not in df.columns:
+        return df
+    return df.assign(**{SENTIMENT_CODE_COLUMN: normalize_labels(df[sentiment_col])})
+
+
+def sentiment_codes(df, sentiment_col):
+    """The frame's code column as an array, normalizing now if it has none"""
+    if SENTIMENT_CODE_COLUMN in df.columns:
+        return df[SENTIMENT_CODE_COLUMN].to_numpy()
+    return normalize_labels(df[sentiment_col])
+
+
+def code_counts(codes):
+    """Counts per code as (negative, neutral, positive, unknown)"""
+    codes = np.asarray(codes)
+    counts = np.bincount(codes[codes >= 0], minlength=len(LABELS))
+    return counts[NEGATIVE], counts[NEUTRAL], counts[POSITIVE], int((codes < 0).sum())
+
+
+def code_labels(codes):
+    """Categorical of label names for codes; unknown codes become NaN"""
+    return pd.Categorical.from_codes(np.asarray(codes), categories=list(LABELS))
@@ -0,0 +1,137 @@
+import numpy as np
+import pandas as pd
+
+from dataset_store import build_lock, file_signature
+
+# Rows parsed and counted at a time when a rollup is built from a loaded frame
+BUILD_CHUNKSIZE = 50000
+
+# Columns the dashboards treat as the platform and the product of a row
+PLATFORM_KEYWORDS = ('platform', 'source')
+PRODUCT_COLUMN = 'product'
+
+
+def find_platform_column(columns):
+    """First column named like a platform or source, as the dashboards pick it"""
+    return next((col for col in columns if any(word in col.lower() for word in PLATFORM_KEYWORDS)), None)
+
+
+def dimension_columns(columns):
+    """(platform column, product column) of a dataset, either may be None"""
+    return find_platform_column(columns), PRODUCT_COLUMN if PRODUCT_COLUMN in columns else None
+
+
+def parse_days(values):
+    """Parse dates and truncate them to the day (local wall time for zoned values)"""
+    values = pd.Series(values)
+    dates = pd.to_datetime(values, errors='coerce')
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        # Mixed UTC offsets come back as objects - compare them in UTC instead
+        dates = pd.to_datetime(values, errors='coerce', utc=True)
+    failed = dates.isna() & values.notna()
+    if failed.any():
+        # The format is inferred from the first value; parse the others one by one
+        retried = pd.to_datetime(values[failed], errors='coerce', format='mixed', utc=dates.dt.tz is not None)
+        if retried.dtype == dates.dtype:
+            dates = dates.mask(failed, retried)
+    if getattr(dates.dt, 'tz', None) is not None:
+        dates = dates.dt.tz_localize(None)
+    return dates.dt.floor('D')
+
+
+def daily_counts(dates, sentiments, platforms=None, products=None):
+    """Count rows per (day, sentiment, platform, product); rows without a valid date are skipped.
+
+    Returns a list of (day, sentiment, platform, product, count) tuples with
+    days as 'YYYY-MM-DD' and '' for a missing platform or product.
+    """
+    days = parse_days(dates).reset_index(drop=True)
+    frame = pd.DataFrame({
+        'day': days,
+        'sentiment': pd.Series(sentiments).astype(str).to_numpy(),
+        'platform': '' if platforms is None else pd.Series(platforms).fillna('').astype(str).to_numpy(),
+        'product': '' if products is None else pd.Series(products).fillna('').astype(str).to_numpy(),
+    }).dropna(subset=['day'])
+    counts = frame.groupby(['day', 'sentiment', 'platform', 'product']).size()
+    return [(day.strftime('%Y-%m-%d'), sentiment, platform, product, count)
+            for (day, sentiment, platform, product), count in counts.items()]
+
+
+def rolling_mean(daily, window):
+    """Trailing window mean of a gap-free daily frame, from cumulative sums.
+
+    Equivalent to daily.rolling(window, min_periods=1).mean(), but each
+    window is the difference of two cumulative sums, so the cost is one pass
+    over the days whatever the window.
+    """
+    values = daily.to_numpy(dtype=float)
+    cumulative = np.vstack([np.zeros((1, values.shape[1])), np.cumsum(values, axis=0)])
+    ends = np.arange(1, len(values) + 1)
+    starts = np.maximum(ends - window, 0)
+    means = (cumulative[ends] - cumulative[starts]) / (ends - starts)[:, None]
+    return pd.DataFrame(means, index=daily.index, columns=daily.columns)
+
+
+class SentimentRollup:
+    """Daily sentiment counts per dataset, kept in the daily_sentiment_rollup table.
+
+    Counts are keyed by day, sentiment label, platform and product and are
+    added to chunk by chunk at ingest (or built once from a loaded frame),
+    so trend charts read one row per day and label instead of parsing dates
+    and grouping every row on each rerun.
+    """
+
+    def __init__(self, db):
+        self.db = db
+
+    def add(self, dataset, df, date_col, sentiment_col, platform_col=None, product_col=None):
+        """Count a chunk of rows into a dataset's rollup"""
+        counts = daily_counts(df[date_col], df[sentiment_col],
+                              df[platform_col] if platform_col else None,
+                              df[product_col] if product_col else None)
+        return self.db.add_rollup_counts(dataset, counts, len(df), date_col)
+
+    def clear(self, dataset):
+        """Drop a dataset's counts before it is counted from scratch"""
+        return self.db.clear_rollup(dataset)
+
+    def mark_current(self, dataset, path, date_col):
+        """Record that the rollup covers the file at path as it is now"""
+        return self.db.set_rollup_signature(dataset, file_signature(path), date_col)
+
+    def is_current(self, dataset, path, date_col):
+        """Whether the rollup was built from the file at path, by date_col, as it is now"""
+        state = self.db.get_rollup_state(dataset)
+        return state is not None and state[0] == file_signature(path) and state[1] == date_col
+
+    def lock(self, dataset):
+        """Lock to hold while the dataset's rollup is cleared and recounted"""
+        return build_lock('sentiment_rollup', self.db.db_path, dataset)
+
+    def ensure(self, dataset, path, df, date_col, sentiment_col):
+        """Build the rollup from a loaded frame unless it already matches the file"""
+        if self.is_current(dataset, path, date_col):
+            return False
+        with self.lock(dataset):
+            # Another session may have built it while this one waited
+            if self.is_current(dataset, path, date_col):
+                return False
+            platform_col, product_col = dimension_columns(df.columns)
+            self.clear(dataset)
+            for start in range(0, len(df), BUILD_CHUNKSIZE):
+                if not self.add(dataset, df.iloc[start:start + BUILD_CHUNKSIZE], date_col, sentiment_col,
+                                platform_col, product_col):
+                    return False
+            self.mark_current(dataset, path, date_col)
+        return True
+
+    def daily(self, dataset, start=None, end=None, sentiments=None, platform=None, product=None):
+        """Day x sentiment count frame with every day in the range present"""
+        counts = self.db.get_daily_rollup(dataset, start, end, sentiments, platform, product)
+        if counts.empty:
+            return pd.DataFrame(index=pd.DatetimeIndex([], name='day'))
+        daily = counts.pivot(index='day', columns='sentiment', values='count')
+        daily.index = pd.DatetimeIndex(pd.to_datetime(daily.index), name='day')
+        days = pd.date_range(daily.index.min(), daily.index.max(), freq='D', name='day')
+        return daily.reindex(days).fillna(0).astype('int64')
+
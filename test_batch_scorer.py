@@ -0,0 +1,92 @@
+import os
+
+import joblib
+import pandas as pd
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+
+from batch_scorer import BatchScorer
+from database_manager import DatabaseManager
+
+TEXTS = ['great product love it', 'awful broken terrible', 'it is fine okay'] * 20
+LABELS = ['positive', 'negative', 'neutral'] * 20
+
+
+@pytest.fixture
+def model_paths(tmp_path):
+    vectorizer = TfidfVectorizer()
+    model = LogisticRegression()
+    model.fit(vectorizer.fit_transform(TEXTS), LABELS)
+    model_path = os.path.join(tmp_path, 'sentiment_model.joblib')
+    vectorizer_path = os.path.join(tmp_path, 'tfidf_vectorizer.joblib')
+    joblib.dump(model, model_path)
+    joblib.dump(vectorizer, vectorizer_path)
+    return model_path, vectorizer_path
+
+
+def _write_input(tmp_path, rows=25):
+    path = os.path.join(tmp_path, 'input.csv')
+    pd.DataFrame({
+        'id': range(rows),
+        'review': [['Love it, great!', 'terrible and broken', 'fine I guess'][i % 3] for i in range(rows)],
+    }).to_csv(path, index=False)
+    return path
+
+
+def test_score_csv_streams_chunks(tmp_path, model_paths):
+    output = os.path.join(tmp_path, 'scored.csv')
+    progress = []
+    scorer = BatchScorer(*model_paths, chunksize=10, use_cache=False)
+    total = scorer.score_csv(_write_input(tmp_path), output, text_column='review', label_column='predicted',
+                             progress_callback=progress.append)
+
+    assert total == 25
+    assert progress == [10, 20, 25]
+    scored = pd.read_csv(output)
+    assert list(scored['id']) == list(range(25))
+    assert list(scored['predicted'][:2]) == ['positive', 'negative']
+    assert ((scored['confidence'] > 0) & (scored['confidence'] <= 1)).all()
+
+
+def test_process_pool_matches_single_process(tmp_path, model_paths):
+    source = _write_input(tmp_path, rows=40)
+    single = os.path.join(tmp_path, 'single.csv')
+    pooled = os.path.join(tmp_path, 'pooled.csv')
+    BatchScorer(*model_paths, chunksize=7, use_cache=False).score_csv(source, single, text_column='review')
+    assert BatchScorer(*model_paths, workers=2, chunksize=7).score_csv(source, pooled, text_column='review') == 40
+
+    pd.testing.assert_frame_equal(pd.read_csv(pooled), pd.read_csv(single))
+
+
+def test_score_feedback_writes_predictions_back(tmp_path, model_paths):
+    db = DatabaseManager(os.path.join(tmp_path, 'data', 'test.db'))
+    db.insert_feedback_batch(pd.DataFrame({
+        'text': ['Love it, great!', 'terrible and broken', 'fine I guess'],
+        'sentiment': ['negative', None, None],
+    }))
+
+    scorer = BatchScorer(*model_paths, chunksize=2, use_cache=False)
+    assert scorer.score_feedback(db) == 3
+    with db.connection() as conn:
+        rows = conn.execute("SELECT sentiment, predicted_sentiment, confidence FROM feedback "
+                            "ORDER BY feedback_id").fetchall()
+    # Human labels are kept; predictions go to their own column
+    assert [row[:2] for row in rows] == [('negative', 'positive'), (None, 'negative'), (None, 'neutral')]
+    assert all(row[2] is not None for row in rows)
+
+    # Scored rows are skipped on the next run
+    assert scorer.score_feedback(db) == 0
+
+
+def test_overwrite_rescores_scored_rows(tmp_path, model_paths):
+    db = DatabaseManager(os.path.join(tmp_path, 'data', 'test.db'))
+    db.insert_feedback_batch(pd.DataFrame({'text': ['Love it, great!', 'terrible and broken']}))
+    db.update_feedback_predictions([(1, 'stale', 0.1), (2, 'stale', 0.1)])
+
+    scorer = BatchScorer(*model_paths, use_cache=False)
+    assert scorer.score_feedback(db) == 0
+    assert scorer.score_feedback(db, overwrite=True) == 2
+    with db.connection() as conn:
+        predictions = conn.execute("SELECT predicted_sentiment FROM feedback ORDER BY feedback_id").fetchall()
+    assert predictions == [('positive',), ('negative',)]
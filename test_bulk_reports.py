@@ -0,0 +1,53 @@
+import json
+import os
+import zipfile
+
+import pandas as pd
+
+from bulk_reports import find_group_column, generate_bulk_reports, report_frames
+
+
+def sample_frame():
+    return pd.DataFrame({
+        'airline': ['United', 'Delta', 'United', 'Virgin America', 'Delta', 'United'],
+        'airline_sentiment': ['negative', 'positive', 'neutral', 'positive', 'negative', 'negative'],
+        'text': ['late again', 'great crew', 'ok flight', 'love it', 'lost bag', 'rude staff'],
+    })
+
+
+def test_find_group_column_prefers_product():
+    assert find_group_column(['text', 'Airline']) == 'Airline'
+    assert find_group_column(['airline', 'product']) == 'product'
+    assert find_group_column(['text', 'sentiment']) is None
+
+
+def test_report_frames_group_once_with_report_columns():
+    frames = dict(report_frames(sample_frame(), 'airline', 'airline_sentiment'))
+    assert list(frames) == ['Delta', 'United', 'Virgin America']
+    assert list(frames['United'].columns) == ['sentiment']
+    assert frames['United']['sentiment'].tolist() == ['negative', 'neutral', 'negative']
+
+
+def test_bulk_reports_write_manifest_and_zip(tmp_path):
+    output_dir = str(tmp_path / 'bulk')
+    manifest = generate_bulk_reports(sample_frame(), 'airline', output_dir, zip_output=True)
+
+    assert manifest['sentiment_column'] == 'airline_sentiment'
+    assert [entry['name'] for entry in manifest['reports']] == ['Delta', 'United', 'Virgin America']
+    assert [entry['rows'] for entry in manifest['reports']] == [2, 3, 1]
+    assert all(entry['error'] is None for entry in manifest['reports'])
+    for entry in manifest['reports']:
+        assert os.path.getsize(os.path.join(output_dir, entry['file'])) > 0
+
+    with open(os.path.join(output_dir, 'manifest.json')) as f:
+        assert json.load(f)['reports'] == manifest['reports']
+    with zipfile.ZipFile(manifest['zip']) as archive:
+        assert sorted(archive.namelist()) == sorted(
+            ['manifest.json'] + [entry['file'] for entry in manifest['reports']])
+
+
+def test_bulk_reports_in_worker_processes(tmp_path):
+    serial = generate_bulk_reports(sample_frame(), 'airline', str(tmp_path / 'serial'), report_type='marketing')
+    parallel = generate_bulk_reports(sample_frame(), 'airline', str(tmp_path / 'parallel'),
+                                     report_type='marketing', workers=2)
+    assert parallel['reports'] == serial['reports']
@@ -0,0 +1,73 @@
+import os
+import threading
+
+from chart_renderer import ChartRenderer, chart_key, render_png
+
+
+def draw_bars(fig):
+    ax = fig.subplots()
+    ax.bar(['negative', 'positive'], [3, 5])
+
+
+def test_render_png_uses_no_pyplot_state():
+    import matplotlib.pyplot as plt
+
+    before = plt.get_fignums()
+    png = render_png(draw_bars)
+    assert png.startswith(b'\x89PNG')
+    assert plt.get_fignums() == before
+
+
+def test_chart_key_changes_with_the_file_and_filters(tmp_path):
+    path = os.path.join(tmp_path, 'reviews.csv')
+    with open(path, 'w') as f:
+        f.write('text\nok\n')
+    key = chart_key(path, 'distribution', product='A')
+    assert key == chart_key(path, 'distribution', product='A')
+    assert key != chart_key(path, 'distribution', product='B')
+
+    with open(path, 'a') as f:
+        f.write('more\n')
+    assert key != chart_key(path, 'distribution', product='A')
+
+
+def test_png_is_cached_by_key_and_rendered_once():
+    renderer = ChartRenderer()
+    calls = []
+
+    def draw(fig):
+        calls.append(threading.current_thread().name)
+        draw_bars(fig)
+
+    first = renderer.png('chart', draw)
+    assert renderer.png('chart', draw) is first
+    assert len(calls) == 1 and calls[0].startswith('chart-render')
+    assert renderer.stats()['hits'] == 1
+
+    renderer.png(None, draw)
+    renderer.png(None, draw)
+    assert len(calls) == 3
+
+
+def test_cache_evicts_least_recently_used_charts():
+    size = len(render_png(draw_bars))
+    renderer = ChartRenderer(max_bytes=size * 2)
+    for key in ('a', 'b', 'c'):
+        renderer.png(key, draw_bars)
+    stats = renderer.stats()
+    assert stats['entries'] == 2 and stats['bytes'] <= stats['max_bytes']
+
+
+def test_plotly_figures_are_built_once_per_key():
+    import plotly.graph_objects as go
+
+    renderer = ChartRenderer()
+    builds = []
+
+    def build():
+        builds.append(1)
+        return go.Figure(go.Bar(x=['a'], y=[1]))
+
+    fig = renderer.plotly('pie', build)
+    assert renderer.plotly('pie', build) is fig
+    assert len(builds) == 1
@@ -0,0 +1,59 @@
+import os
+import threading
+
+import pytest
+
+from connection_pool import ConnectionPool, get_pool
+from database_manager import DatabaseManager
+
+
+def test_connections_use_wal_and_are_reused(tmp_path):
+    pool = ConnectionPool(os.path.join(tmp_path, 'test.db'), max_size=2)
+
+    with pool.connection() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+        first = conn
+    with pool.connection() as conn:
+        assert conn is first
+
+    assert pool.stats()['created'] == 1
+
+
+def test_failed_block_is_rolled_back(tmp_path):
+    pool = ConnectionPool(os.path.join(tmp_path, 'test.db'))
+    with pool.connection() as conn:
+        conn.execute("CREATE TABLE items (name TEXT)")
+
+    with pytest.raises(ValueError):
+        with pool.connection() as conn:
+            conn.execute("INSERT INTO items VALUES ('lost')")
+            raise ValueError("boom")
+
+    with pool.connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 0
+
+
+def test_concurrent_writers(tmp_path):
+    db = DatabaseManager(os.path.join(tmp_path, 'data', 'test.db'))
+    db.add_user('admin', 'admin@example.com', 'hash', 'administrator')
+
+    def write(n):
+        for i in range(25):
+            with db.connection() as conn:
+                conn.execute("INSERT INTO system_health (metric_name, metric_value, status) VALUES (?, ?, ?)",
+                             (f'metric_{n}', i, 'good'))
+
+    threads = [threading.Thread(target=write, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    with db.connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM system_health").fetchone()[0] == 200
+    assert db.pool.stats()['created'] <= db.pool.max_size
+
+
+def test_get_pool_is_shared(tmp_path):
+    path = os.path.join(tmp_path, 'shared.db')
+    assert get_pool(path) is get_pool(path)
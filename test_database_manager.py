@@ -0,0 +1,79 @@
+import os
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from database_manager import DatabaseManager
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = DatabaseManager(os.path.join(tmp_path, 'data', 'test.db'))
+    db.insert_feedback_batch(pd.DataFrame({
+        'platform': ['twitter', 'twitter', 'email', 'twitter'],
+        'product_id': ['A', 'B', 'A', 'A'],
+        'text': ['great', 'bad', 'meh', 'awful'],
+        'sentiment': ['positive', 'negative', 'neutral', 'negative'],
+        'date': pd.to_datetime(['2025-01-01 09:00', '2025-01-01 18:00', '2025-01-02 10:00', '2025-01-03 08:00']),
+    }))
+    return db
+
+
+def test_feedback_indexes_exist(db):
+    with db.connection() as conn:
+        indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert {'idx_feedback_date', 'idx_feedback_product_date',
+            'idx_feedback_campaign_date', 'idx_feedback_platform_sentiment'} <= indexes
+
+
+def test_get_all_users(db):
+    assert db.add_user('admin', 'admin@example.com', 'hash', 'administrator')
+    assert db.add_user('marketing', 'marketing@example.com', 'hash', 'marketing')
+    users = db.get_all_users()
+    assert users['username'].tolist() == ['admin', 'marketing']
+    assert 'password_hash' not in users.columns
+    assert db.count_users() == len(users)
+
+
+def test_count_feedback(db):
+    assert db.count_feedback() == 4
+    assert db.count_feedback(start='2025-01-02') == 2
+    assert db.count_feedback(start='2025-01-01', end='2025-01-02', platform='twitter') == 2
+    assert db.count_feedback(product_id='A') == 3
+
+
+def test_sentiment_counts(db):
+    counts = db.sentiment_counts()
+    assert dict(zip(counts['sentiment'], counts['count'])) == {'negative': 2, 'neutral': 1, 'positive': 1}
+
+    by_platform = db.sentiment_counts(by='platform', product_id='A')
+    assert by_platform.values.tolist() == [['email', 'neutral', 1], ['twitter', 'negative', 1], ['twitter', 'positive', 1]]
+
+
+def test_daily_series(db):
+    series = db.daily_series(end='2025-01-03')
+    assert series.values.tolist() == [
+        ['2025-01-01', 'negative', 1],
+        ['2025-01-01', 'positive', 1],
+        ['2025-01-02', 'neutral', 1],
+    ]
+
+
+def test_unknown_group_column_is_rejected(db):
+    with pytest.raises(ValueError):
+        db.sentiment_counts(by='text; DROP TABLE feedback')
+
+
+def test_feedback_table_migrates_predicted_sentiment(tmp_path):
+    path = os.path.join(tmp_path, 'old.db')
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE feedback (feedback_id INTEGER PRIMARY KEY AUTOINCREMENT, user_id INTEGER, "
+                     "product_id TEXT, platform TEXT, text TEXT, sentiment TEXT, confidence REAL, "
+                     "date TIMESTAMP, campaign_id TEXT)")
+    conn.close()
+
+    db = DatabaseManager(path)
+    with db.connection() as conn:
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(feedback)")]
+    assert 'predicted_sentiment' in columns
@@ -0,0 +1,77 @@
+import os
+import threading
+import time
+
+import pandas as pd
+
+from dataset_cache import DatasetCache
+
+
+def _write_csv(tmp_path, name, rows):
+    path = os.path.join(tmp_path, name)
+    pd.DataFrame({'text': [f"row {i}" for i in range(rows)], 'value': range(rows)}).to_csv(path, index=False)
+    return path
+
+
+def test_hits_share_one_frame(tmp_path):
+    path = _write_csv(tmp_path, 'a.csv', 100)
+    cache = DatasetCache()
+
+    first = cache.get(path)
+    second = cache.get(path)
+    pd.testing.assert_frame_equal(first, second)
+    assert cache.stats()['hits'] == 1
+    assert cache.stats()['misses'] == 1
+
+    # Changing a returned frame does not leak into the cached copy
+    first['value'] = 0
+    first['extra'] = 1
+    third = cache.get(path)
+    assert 'extra' not in third.columns
+    assert third['value'].iloc[-1] == 99
+
+
+def test_changed_file_is_reloaded(tmp_path):
+    path = _write_csv(tmp_path, 'a.csv', 10)
+    cache = DatasetCache()
+    assert len(cache.get(path)) == 10
+
+    _write_csv(tmp_path, 'a.csv', 20)
+    assert len(cache.get(path)) == 20
+    assert cache.stats()['entries'] == 1
+
+
+def test_lru_eviction_respects_budget(tmp_path):
+    paths = [_write_csv(tmp_path, f"{name}.csv", 1000) for name in 'abc']
+    size = int(pd.read_csv(paths[0]).memory_usage(index=True, deep=True).sum())
+    cache = DatasetCache(max_bytes=size * 2)
+
+    cache.get(paths[0])
+    cache.get(paths[1])
+    cache.get(paths[0])
+    cache.get(paths[2])
+
+    stats = cache.stats()
+    assert stats['entries'] == 2
+    assert stats['evictions'] == 1
+    assert stats['bytes'] <= stats['max_bytes']
+    cache.get(paths[0])
+    assert cache.stats()['hits'] == 2
+
+
+def test_concurrent_misses_load_once(tmp_path):
+    path = _write_csv(tmp_path, 'a.csv', 10)
+    cache = DatasetCache()
+    calls = []
+
+    def slow_loader(path, columns=None):
+        calls.append(path)
+        time.sleep(0.05)
+        return pd.read_csv(path)
+
+    threads = [threading.Thread(target=cache.get, args=(path, slow_loader)) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
@@ -0,0 +1,86 @@
+import os
+
+import pandas as pd
+
+import dataset_store
+from dataset_store import DatasetStore
+from sentiment_labels import NEGATIVE, POSITIVE, normalize_labels
+
+
+def _write_csv(tmp_path, rows=10):
+    path = os.path.join(tmp_path, 'reviews.csv')
+    pd.DataFrame({
+        'text': [f"review {i}" for i in range(rows)],
+        'sentiment': ['positive', 'negative'] * (rows // 2),
+        'rating': [float(i % 5) for i in range(rows)],
+    }).to_csv(path, index=False)
+    return path
+
+
+def test_load_matches_csv(tmp_path):
+    path = _write_csv(tmp_path)
+    store = DatasetStore(str(tmp_path))
+
+    loaded = store.load('reviews.csv')
+    assert loaded['sentiment_code'].dtype == 'int8'
+    pd.testing.assert_frame_equal(loaded.drop(columns='sentiment_code'), pd.read_csv(path))
+    pd.testing.assert_frame_equal(store.load('reviews.csv', columns=['sentiment']),
+                                  pd.read_csv(path, usecols=['sentiment']))
+    pd.testing.assert_frame_equal(store.head('reviews.csv', 3).drop(columns='sentiment_code'),
+                                  pd.read_csv(path, nrows=3))
+
+
+def test_info_uses_cached_metadata(tmp_path):
+    path = _write_csv(tmp_path)
+    store = DatasetStore(str(tmp_path))
+    info = store.info(path)
+    assert info['rows'] == 10
+    assert list(info['columns']) == ['text', 'sentiment', 'rating', 'sentiment_code']
+
+    # A fresh store reads the metadata file instead of converting again
+    converted_at = os.path.getmtime(os.path.join(tmp_path, '.columnar', 'reviews.json'))
+    assert DatasetStore(str(tmp_path)).info(path)['rows'] == 10
+    assert os.path.getmtime(os.path.join(tmp_path, '.columnar', 'reviews.json')) == converted_at
+
+
+def test_changed_csv_is_converted_again(tmp_path):
+    path = _write_csv(tmp_path)
+    store = DatasetStore(str(tmp_path))
+    assert store.info(path)['rows'] == 10
+
+    _write_csv(tmp_path, rows=20)
+    assert store.info(path)['rows'] == 20
+    assert len(store.load(path)) == 20
+
+
+def test_convert_streams_batches_on_one_label_scale(tmp_path, monkeypatch):
+    monkeypatch.setattr(dataset_store, 'CONVERT_BLOCK_SIZE', 256)
+    path = os.path.join(tmp_path, 'ratings.csv')
+    pd.DataFrame({
+        'text': [f"review number {i}" for i in range(60)],
+        'rating': [1, 2] * 25 + [3, 4, 5] * 3 + [5],
+        'date': ['2025-01-01'] * 60,
+    }).to_csv(path, index=False)
+
+    store = DatasetStore(str(tmp_path))
+    info = store.info(path)
+    assert info['rows'] == 60
+    loaded = store.load(path)
+    source = pd.read_csv(path)
+    pd.testing.assert_frame_equal(loaded.drop(columns='sentiment_code'), source)
+    assert list(loaded['sentiment_code']) == list(normalize_labels(source['rating']))
+
+
+def test_convert_handles_types_that_change_after_the_first_block(tmp_path, monkeypatch):
+    monkeypatch.setattr(dataset_store, 'CONVERT_BLOCK_SIZE', 256)
+    path = os.path.join(tmp_path, 'mixed.csv')
+    pd.DataFrame({
+        'text': [f"review number {i}" for i in range(40)],
+        'sentiment': ['positive', 'negative'] * 20,
+        'score': [str(i) for i in range(39)] + ['unknown'],
+    }).to_csv(path, index=False)
+
+    loaded = DatasetStore(str(tmp_path)).load(path)
+    assert len(loaded) == 40
+    assert loaded['score'].iloc[-1] == 'unknown'
+    assert list(loaded['sentiment_code'][:2]) == [POSITIVE, NEGATIVE]
@@ -0,0 +1,77 @@
+import os
+
+import pandas as pd
+
+from database_manager import DatabaseManager
+from ingestion import DatasetIngestor
+from search_index import SearchIndex
+
+
+def test_ingest_streams_chunks(tmp_path):
+    db = DatabaseManager(os.path.join(tmp_path, 'data', 'test.db'))
+    source = os.path.join(tmp_path, 'upload.csv')
+    pd.DataFrame({
+        'review': ['Great product!', 'http://spam.example', 'Terrible @support', None, 'It is ok'] * 3,
+        'label': ['positive', 'neutral', 'negative', 'negative', None] * 3,
+    }).to_csv(source, index=False)
+
+    progress = []
+    result = DatasetIngestor(db, chunksize=4).ingest(
+        source, 'review', 'label', os.path.join(tmp_path, 'clean.csv'), user_id=1,
+        progress_callback=lambda read, kept: progress.append(read))
+
+    assert result['rows_read'] == 15
+    assert result['rows_kept'] == 6
+    assert result['sentiment_counts'].to_dict() == {'positive': 3, 'negative': 3}
+    assert progress == [4, 8, 12, 15]
+
+    cleaned = pd.read_csv(result['dataset_path'])
+    assert list(cleaned['review'][:2]) == ['great product', 'terrible']
+    assert db.count_feedback(platform='uploaded_dataset') == 6
+
+
+def test_ingest_fills_missing_labels_with_scorer(tmp_path):
+    db = DatabaseManager(os.path.join(tmp_path, 'data', 'test.db'))
+    source = os.path.join(tmp_path, 'upload.csv')
+    pd.DataFrame({'text': ['good', 'bad'], 'sentiment': ['positive', None]}).to_csv(source, index=False)
+
+    def scorer(texts):
+        return ['neutral'] * len(texts), [0.5] * len(texts)
+
+    result = DatasetIngestor(db).ingest(source, 'text', 'sentiment', os.path.join(tmp_path, 'clean.csv'),
+                                        user_id=1, scorer=scorer)
+
+    assert result['sentiment_counts'].to_dict() == {'positive': 1, 'neutral': 1}
+    assert result['feedback_ids'] == (1, 2)
+    with db.connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM feedback WHERE confidence = 0.5").fetchone()[0] == 2
+        assert conn.execute("SELECT sentiment, predicted_sentiment FROM feedback ORDER BY feedback_id").fetchall() \
+            == [('positive', 'neutral'), (None, 'neutral')]
+
+
+def test_failed_insert_leaves_chunk_out_of_dataset_and_index(tmp_path, monkeypatch):
+    db = DatabaseManager(os.path.join(tmp_path, 'data', 'test.db'))
+    index = SearchIndex(db)
+    source = os.path.join(tmp_path, 'upload.csv')
+    pd.DataFrame({'text': ['broken screen', 'love the screen', 'screen is bright', 'hate the battery'],
+                  'sentiment': ['negative', 'positive', 'positive', 'negative']}).to_csv(source, index=False)
+    dataset_path = os.path.join(tmp_path, 'clean.csv')
+
+    insert = db.insert_feedback_batch
+    calls = []
+
+    def fail_first_chunk(feedback_df):
+        calls.append(len(feedback_df))
+        return len(calls) > 1 and insert(feedback_df)
+
+    monkeypatch.setattr(db, 'insert_feedback_batch', fail_first_chunk)
+    result = DatasetIngestor(db, chunksize=2, search_index=index).ingest(
+        source, 'text', 'sentiment', dataset_path, user_id=1)
+
+    assert (result['rows_kept'], result['rows_inserted'], result['failed_chunks']) == (4, 2, 1)
+    assert result['sentiment_counts'].to_dict() == {'positive': 1, 'negative': 1}
+    assert result['feedback_ids'] == (1, 2)
+    cleaned = pd.read_csv(dataset_path)
+    assert list(cleaned['text']) == ['screen is bright', 'hate the battery']
+    assert list(index.search('clean.csv', 'screen')['row']) == [0]
+    assert db.count_feedback(platform='uploaded_dataset') == 2
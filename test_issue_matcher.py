@@ -0,0 +1,65 @@
+import re
+
+import pandas as pd
+
+from issue_matcher import IssueMatcher, trie_pattern
+
+
+def test_trie_pattern_matches_exactly_the_words():
+    words = ['delay', 'delayed', 'delivery', 'late']
+    pattern = re.compile('(?:' + trie_pattern(words) + r')\Z')
+    for word in words:
+        assert pattern.match(word)
+    assert not pattern.match('del')
+    assert not pattern.match('delays')
+
+
+def test_match_tags_rows_and_counts_mentions():
+    matcher = IssueMatcher()
+    texts = pd.Series([
+        'Package arrived late and broken',
+        'Rude staff, no help at all',
+        'I love the chocolate flavour',
+        'Way too expensive for the value',
+    ], index=[10, 11, 12, 13])
+    result = matcher.match(texts)
+
+    assert result.tags.loc[10, 'Shipping/Delivery']
+    assert result.tags.loc[10, 'Quality Issues']
+    assert result.tags.loc[11, 'Customer Service']
+    # Keywords start at a word boundary - 'chocolate' is not 'late'
+    assert not result.tags.loc[12].any()
+    assert result.issue_counts() == {
+        'Quality Issues': 1,
+        'Shipping/Delivery': 3,
+        'Customer Service': 3,
+        'Price/Value': 2,
+    }
+    assert result.row_counts['Shipping/Delivery'] == 1
+    assert list(result.examples('Customer Service')) == [11]
+
+
+def test_keywords_match_whole_words_and_plurals():
+    matcher = IssueMatcher()
+    result = matcher.match(pd.Series([
+        'Loved the costume',
+        'Got a badge at the event',
+        'Will order later',
+        'Hidden costs and delivery problems',
+        'Several ISSUES with the packages',
+    ]))
+
+    assert not result.tags.loc[:2].to_numpy().any()
+    assert result.tags.loc[3, ['Price/Value', 'Shipping/Delivery', 'Functionality']].all()
+    assert result.tags.loc[4, ['Functionality', 'Shipping/Delivery']].all()
+    assert result.issue_counts() == {'Shipping/Delivery': 2, 'Price/Value': 1, 'Functionality': 2}
+
+
+def test_match_handles_duplicate_index_and_empty_input():
+    matcher = IssueMatcher()
+    result = matcher.match(pd.Series(['slow delivery', 'fine'], index=[0, 0]))
+    assert result.tags['Shipping/Delivery'].tolist() == [True, False]
+
+    empty = matcher.match(pd.Series([], dtype=str))
+    assert empty.issue_counts() == {}
+    assert empty.tags.shape == (0, len(matcher.categories))
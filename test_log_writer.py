@@ -0,0 +1,31 @@
+import os
+
+from database_manager import DatabaseManager
+from log_writer import BackgroundLogWriter
+
+
+def test_logs_are_written_in_batches(tmp_path):
+    db = DatabaseManager(os.path.join(tmp_path, 'data', 'test.db'))
+    db.add_user('admin', 'admin@example.com', 'hash', 'administrator')
+
+    for i in range(50):
+        db.log_activity(1, 'view_dashboard', f"view {i}")
+    db.log_system_health('model_accuracy', 0.9, 'good')
+    assert db.flush_logs(timeout=5)
+
+    stats = db.log_writer.stats()
+    assert stats['written'] == 51
+    assert stats['queue_depth'] == 0
+    assert stats['batches'] < 51
+    assert len(db.get_user_activity(limit=100)) == 50
+
+
+def test_close_drains_queue(tmp_path):
+    db = DatabaseManager(os.path.join(tmp_path, 'data', 'test.db'))
+    writer = BackgroundLogWriter(db.db_path, flush_interval=60)
+    for i in range(10):
+        writer.log('system_health', 'metric', i, 'good')
+    writer.close()
+
+    with db.connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM system_health").fetchone()[0] == 10
@@ -0,0 +1,58 @@
+import os
+import joblib
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+
+from model_manager import ModelManager, get_model_manager
+
+
+def _train_pair(texts, labels):
+    vectorizer = TfidfVectorizer()
+    model = LogisticRegression()
+    model.fit(vectorizer.fit_transform(texts), labels)
+    return model, vectorizer
+
+
+def _save_pair(tmp_path, model, vectorizer):
+    model_path = os.path.join(tmp_path, 'sentiment_model.joblib')
+    vectorizer_path = os.path.join(tmp_path, 'tfidf_vectorizer.joblib')
+    joblib.dump(model, model_path)
+    joblib.dump(vectorizer, vectorizer_path)
+    return model_path, vectorizer_path
+
+
+def test_model_is_loaded_once(tmp_path):
+    model, vectorizer = _train_pair(['good great', 'bad awful'], ['positive', 'negative'])
+    manager = ModelManager(*_save_pair(tmp_path, model, vectorizer))
+
+    first = manager.get_model()
+    second = manager.get_model()
+
+    assert first[0] is second[0]
+    assert first[1] is second[1]
+    assert manager.load_count == 1
+    assert manager.version is not None
+
+
+def test_model_reloads_when_files_change(tmp_path):
+    model, vectorizer = _train_pair(['good great', 'bad awful'], ['positive', 'negative'])
+    model_path, vectorizer_path = _save_pair(tmp_path, model, vectorizer)
+    manager = ModelManager(model_path, vectorizer_path)
+    manager.get_model()
+    old_version = manager.version
+
+    model, vectorizer = _train_pair(['fine okay', 'terrible', 'lovely'], ['neutral', 'negative', 'positive'])
+    _save_pair(tmp_path, model, vectorizer)
+    stat = os.stat(model_path)
+    os.utime(model_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    reloaded_model, _ = manager.get_model()
+
+    assert list(reloaded_model.classes_) == ['negative', 'neutral', 'positive']
+    assert manager.version != old_version
+    assert manager.load_count == 2
+
+
+def test_get_model_manager_is_shared(tmp_path):
+    paths = (os.path.join(tmp_path, 'm.joblib'), os.path.join(tmp_path, 'v.joblib'))
+    assert get_model_manager(*paths) is get_model_manager(*paths)
@@ -0,0 +1,80 @@
+import os
+
+import joblib
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+
+from model_manager import ModelManager
+from model_registry import ModelRegistry, registry_dir_for
+
+
+def _train_pair(texts, labels):
+    vectorizer = TfidfVectorizer()
+    model = LogisticRegression()
+    model.fit(vectorizer.fit_transform(texts), labels)
+    return model, vectorizer
+
+
+def _paths(tmp_path):
+    return os.path.join(tmp_path, 'sentiment_model.joblib'), os.path.join(tmp_path, 'tfidf_vectorizer.joblib')
+
+
+def test_register_promote_and_rollback(tmp_path):
+    model_path, vectorizer_path = _paths(tmp_path)
+    registry = ModelRegistry(registry_dir_for(model_path), model_path, vectorizer_path)
+
+    first = registry.register(*_train_pair(['good', 'bad'], ['positive', 'negative']), accuracy=0.8, dataset='a.csv')
+    second = registry.register(*_train_pair(['great', 'awful', 'ok'], ['positive', 'negative', 'neutral']),
+                               accuracy=0.9, rows=3)
+
+    assert registry.current_version() == second
+    assert [entry['version'] for entry in registry.list_versions()] == [second, first]
+    assert registry.get_version_info(first)['dataset'] == 'a.csv'
+    assert list(joblib.load(model_path).classes_) == ['negative', 'neutral', 'positive']
+
+    assert registry.rollback() == first
+    assert registry.current_version() == first
+    assert list(joblib.load(model_path).classes_) == ['negative', 'positive']
+    with pytest.raises(RuntimeError):
+        registry.rollback()
+
+
+def test_rollback_follows_promotion_history(tmp_path):
+    model_path, vectorizer_path = _paths(tmp_path)
+    registry = ModelRegistry(registry_dir_for(model_path), model_path, vectorizer_path)
+    v1 = registry.register(*_train_pair(['good', 'bad'], ['positive', 'negative']), promote=False)
+    registry.register(*_train_pair(['great', 'awful'], ['positive', 'negative']), promote=False)
+    v3 = registry.register(*_train_pair(['fine', 'poor'], ['positive', 'negative']), promote=False)
+
+    # v2 was registered in between but never live
+    registry.promote(v1)
+    registry.promote(v3)
+    assert registry.rollback() == v1
+    assert registry.current_version() == v1
+
+    # v1 is current again with v3 live before it
+    registry.promote(v3)
+    registry.promote(v1)
+    assert registry.rollback() == v3
+    assert registry.rollback() == v1
+    with pytest.raises(RuntimeError):
+        registry.rollback()
+
+
+def test_manager_follows_promoted_version(tmp_path):
+    model_path, vectorizer_path = _paths(tmp_path)
+    registry = ModelRegistry(registry_dir_for(model_path), model_path, vectorizer_path)
+    first = registry.register(*_train_pair(['good', 'bad'], ['positive', 'negative']))
+
+    manager = ModelManager(model_path, vectorizer_path)
+    assert manager.get_model()[0] is manager.get_model()[0]
+    assert manager.version == first
+
+    second = registry.register(*_train_pair(['great', 'awful', 'ok'], ['positive', 'negative', 'neutral']))
+    assert len(manager.get_model()[0].classes_) == 3
+    assert manager.version == second
+
+    registry.promote(first)
+    assert len(manager.get_model()[0].classes_) == 2
+    assert manager.load_count == 3
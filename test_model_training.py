@@ -0,0 +1,107 @@
+import os
+
+import pandas as pd
+
+from batch_scorer import score_texts
+from database_manager import DatabaseManager
+from ingestion import DatasetIngestor
+from model_manager import ModelManager
+from model_training import IncrementalTrainer
+
+TEXTS = ['great product love it', 'awful broken terrible', 'it is fine okay'] * 20
+LABELS = ['positive', 'negative', 'neutral'] * 20
+
+
+def _paths(tmp_path):
+    return os.path.join(tmp_path, 'sentiment_model.joblib'), os.path.join(tmp_path, 'tfidf_vectorizer.joblib')
+
+
+def test_saved_model_keeps_deployment_contract(tmp_path):
+    trainer = IncrementalTrainer(*_paths(tmp_path), chunksize=15)
+    assert trainer.load() is False
+    summary = trainer.train_from_frame(pd.DataFrame({'text': TEXTS, 'sentiment': LABELS}), 'text', 'sentiment')
+    trainer.save()
+
+    assert summary['rows_trained'] == 60
+    assert summary['batches'] == 4
+    assert summary['accuracy'] is not None
+
+    model, vectorizer = ModelManager(*_paths(tmp_path)).get_model()
+    labels, confidences = score_texts(['Love it, great!', 'terrible and broken'], model, vectorizer)
+    assert list(labels) == ['positive', 'negative']
+    assert ((confidences > 0) & (confidences <= 1)).all()
+
+
+def test_update_resumes_and_skips_unknown_labels(tmp_path):
+    trainer = IncrementalTrainer(*_paths(tmp_path))
+    trainer.load()
+    trainer.partial_fit(TEXTS, LABELS)
+    trainer.save()
+
+    resumed = IncrementalTrainer(*_paths(tmp_path))
+    assert resumed.load() is True
+    assert resumed.partial_fit(['great', 'odd', ''], ['positive', 'sarcastic', 'negative']) == 1
+    assert resumed.summary()['rows_skipped'] == 2
+
+
+def test_numeric_labels_are_normalized(tmp_path):
+    ratings = [5, 1, 3] * 20
+    trainer = IncrementalTrainer(*_paths(tmp_path))
+    trainer.load()
+    assert trainer.partial_fit(TEXTS, ratings) == 60
+    assert list(trainer.model.classes_) == ['negative', 'neutral', 'positive']
+    trainer.save()
+
+    resumed = IncrementalTrainer(*_paths(tmp_path))
+    assert resumed.load() is True
+    assert resumed.partial_fit(['love it', 'broken again', 'no idea'], [4, 2, 'banana']) == 2
+    assert resumed.summary()['rows_skipped'] == 1
+
+
+def test_train_from_feedback_only_reads_new_rows(tmp_path):
+    db = DatabaseManager(os.path.join(tmp_path, 'data', 'test.db'))
+    db.insert_feedback_batch(pd.DataFrame({'text': TEXTS, 'sentiment': LABELS}))
+
+    trainer = IncrementalTrainer(*_paths(tmp_path))
+    trainer.load()
+    assert trainer.train_from_feedback(db)['rows_trained'] == 60
+    trainer.save()
+
+    db.insert_feedback_batch(pd.DataFrame({'text': ['love it', 'no label'], 'sentiment': ['positive', None]}))
+    resumed = IncrementalTrainer(*_paths(tmp_path))
+    resumed.load()
+    assert resumed.train_from_feedback(db)['rows_trained'] == 1
+    assert resumed.last_feedback_id == 61
+
+
+def test_train_from_feedback_ignores_predictions(tmp_path):
+    db = DatabaseManager(os.path.join(tmp_path, 'data', 'test.db'))
+    db.insert_feedback_batch(pd.DataFrame({'text': TEXTS + ['unlabelled text'], 'sentiment': LABELS + [None]}))
+    db.update_feedback_predictions([(61, 'positive', 0.9), (1, 'negative', 0.6)])
+
+    trainer = IncrementalTrainer(*_paths(tmp_path))
+    trainer.load()
+    assert trainer.train_from_feedback(db)['rows_trained'] == 60
+    with db.connection() as conn:
+        assert conn.execute("SELECT sentiment, predicted_sentiment FROM feedback WHERE feedback_id = 1").fetchone() \
+            == ('positive', 'negative')
+        assert conn.execute("SELECT sentiment FROM feedback WHERE feedback_id = 61").fetchone()[0] is None
+
+
+def test_train_from_csv_advances_feedback_watermark(tmp_path):
+    db = DatabaseManager(os.path.join(tmp_path, 'data', 'test.db'))
+    source = os.path.join(tmp_path, 'upload.csv')
+    pd.DataFrame({'text': TEXTS, 'sentiment': LABELS}).to_csv(source, index=False)
+    ingest_result = DatasetIngestor(db).ingest(source, 'text', 'sentiment', os.path.join(tmp_path, 'clean.csv'),
+                                               user_id=1)
+
+    trainer = IncrementalTrainer(*_paths(tmp_path))
+    trainer.load()
+    trainer.train_from_csv(ingest_result['dataset_path'], 'text', 'sentiment',
+                           feedback_ids=ingest_result['feedback_ids'])
+    assert trainer.last_feedback_id == 60
+    trainer.save()
+
+    resumed = IncrementalTrainer(*_paths(tmp_path))
+    resumed.load()
+    assert resumed.train_from_feedback(db)['rows_trained'] == 0
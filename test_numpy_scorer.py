@@ -0,0 +1,87 @@
+import os
+
+import numpy as np
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression, SGDClassifier
+
+from model_registry import ModelRegistry, registry_dir_for
+from model_training import create_incremental_pair
+from numpy_scorer import NumpyScorer, export_numpy_model
+from text_cleaning import clean_texts
+
+TRAIN_TEXTS = [
+    "great flight and friendly crew", "love the new seats", "amazing service thank you",
+    "flight delayed again terrible", "lost my bag worst airline", "rude staff and late departure",
+    "flight was on time", "landed in chicago", "boarding at gate twelve",
+    "great crew but late departure", "thank you for the upgrade", "worst customer service ever",
+]
+TRAIN_LABELS = ['positive'] * 3 + ['negative'] * 3 + ['neutral'] * 3 + ['positive', 'positive', 'negative']
+TEST_TEXTS = ["the crew was great", "late again, lost bag", "", "unknown words only",
+              "great great great flight", "on time at the gate"]
+
+
+def _assert_same_probabilities(model, vectorizer, path):
+    export_numpy_model(model, vectorizer, path, version='v1')
+    scorer = NumpyScorer(path)
+    cleaned = clean_texts(TEST_TEXTS)
+    expected = model.predict_proba(vectorizer.transform(cleaned))
+    np.testing.assert_allclose(scorer.predict_proba(scorer.transform(cleaned)), expected, atol=1e-6)
+    assert list(scorer.classes_) == [str(label) for label in model.classes_]
+    assert scorer.version == 'v1'
+
+
+@pytest.mark.parametrize('vectorizer', [
+    TfidfVectorizer(stop_words='english'),
+    TfidfVectorizer(ngram_range=(1, 2), sublinear_tf=True),
+    TfidfVectorizer(ngram_range=(2, 3), norm='l1', binary=True),
+    TfidfVectorizer(use_idf=False, norm=None, lowercase=False),
+])
+def test_multinomial_logistic_regression(tmp_path, vectorizer):
+    model = LogisticRegression().fit(vectorizer.fit_transform(TRAIN_TEXTS), TRAIN_LABELS)
+    _assert_same_probabilities(model, vectorizer, str(tmp_path / 'model.npz'))
+
+
+def test_binary_and_one_vs_rest_models(tmp_path):
+    vectorizer = TfidfVectorizer()
+    X = vectorizer.fit_transform(TRAIN_TEXTS)
+    binary = LogisticRegression().fit(X, [label == 'positive' for label in TRAIN_LABELS])
+    _assert_same_probabilities(binary, vectorizer, str(tmp_path / 'binary.npz'))
+
+    sgd = SGDClassifier(loss='log_loss', random_state=0).fit(X, TRAIN_LABELS)
+    _assert_same_probabilities(sgd, vectorizer, str(tmp_path / 'sgd.npz'))
+
+
+def test_score_cleans_raw_texts(tmp_path):
+    vectorizer = TfidfVectorizer()
+    model = LogisticRegression().fit(vectorizer.fit_transform(TRAIN_TEXTS), TRAIN_LABELS)
+    path = export_numpy_model(model, vectorizer, str(tmp_path / 'model.npz'))
+    labels, confidences = NumpyScorer(path).score(["@united GREAT crew!!! http://t.co/x", None])
+    expected = model.predict_proba(vectorizer.transform(clean_texts(["@united GREAT crew!!! http://t.co/x", None])))
+    assert labels.tolist() == model.classes_[expected.argmax(axis=1)].tolist()
+    np.testing.assert_allclose(confidences, expected.max(axis=1), atol=1e-6)
+
+
+def test_hashing_pair_is_not_exported(tmp_path):
+    model, vectorizer = create_incremental_pair()
+    with pytest.raises(ValueError):
+        export_numpy_model(model, vectorizer, str(tmp_path / 'model.npz'))
+
+
+def test_registry_exports_artifact_for_promoted_version(tmp_path):
+    model_path = os.path.join(tmp_path, 'sentiment_model.joblib')
+    vectorizer_path = os.path.join(tmp_path, 'tfidf_vectorizer.joblib')
+    registry = ModelRegistry(registry_dir_for(model_path), model_path, vectorizer_path)
+
+    vectorizer = TfidfVectorizer()
+    model = LogisticRegression().fit(vectorizer.fit_transform(TRAIN_TEXTS), TRAIN_LABELS)
+    version = registry.register(model, vectorizer)
+    assert os.path.exists(registry.numpy_path(version))
+    assert NumpyScorer(registry.legacy_numpy_path).version == version
+
+    # A version without an artifact must not leave the previous one in place
+    hashing_model, hashing_vectorizer = create_incremental_pair()
+    hashing_model.partial_fit(hashing_vectorizer.transform(TRAIN_TEXTS), TRAIN_LABELS,
+                              classes=['negative', 'neutral', 'positive'])
+    registry.register(hashing_model, hashing_vectorizer)
+    assert not os.path.exists(registry.legacy_numpy_path)
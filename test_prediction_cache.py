@@ -0,0 +1,69 @@
+import numpy as np
+
+from batch_scorer import score_texts
+from prediction_cache import PredictionCache
+
+
+class LengthVectorizer:
+    def transform(self, texts):
+        return np.array([[len(text)] for text in texts], dtype=float)
+
+
+class CountingModel:
+    """Positive for long texts, negative for short ones; records every scored batch"""
+
+    classes_ = np.array(['negative', 'positive'], dtype=object)
+
+    def __init__(self):
+        self.batches = []
+
+    def predict_proba(self, X):
+        self.batches.append(len(X))
+        positive = (X[:, 0] > 10).astype(float) * 0.8 + 0.1
+        return np.column_stack([1 - positive, positive])
+
+
+def test_normalized_duplicates_are_scored_once():
+    cache, model = PredictionCache(), CountingModel()
+    texts = ['@united worst flight ever', 'worst flight ever!!', 'WORST flight ever http://t.co/x', 'ok']
+    proba = cache.predict_proba(texts, model, LengthVectorizer(), 'v1')
+
+    assert model.batches == [2]
+    np.testing.assert_allclose(proba[0], proba[1])
+    np.testing.assert_allclose(proba[3], [0.9, 0.1])
+
+    again = cache.predict_proba(['worst flight ever', 'ok'], model, LengthVectorizer(), 'v1')
+    assert model.batches == [2]
+    np.testing.assert_allclose(again, proba[[0, 3]])
+    stats = cache.stats()
+    assert stats['misses'] == 2
+    assert stats['hits'] == 4
+    assert stats['hit_ratio'] == 4 / 6
+
+
+def test_new_model_version_invalidates_entries():
+    cache, model = PredictionCache(), CountingModel()
+    cache.predict_proba(['great crew'], model, LengthVectorizer(), 'v1')
+    cache.predict_proba(['great crew'], model, LengthVectorizer(), 'v2')
+    assert model.batches == [1, 1]
+    assert cache.stats()['invalidations'] == 1
+    assert cache.stats()['model_version'] == 'v2'
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache, model = PredictionCache(max_entries=2), CountingModel()
+    cache.predict_proba(['alpha', 'beta'], model, LengthVectorizer(), 'v1')
+    cache.predict_proba(['alpha'], model, LengthVectorizer(), 'v1')
+    cache.predict_proba(['gamma'], model, LengthVectorizer(), 'v1')
+    assert cache.stats()['evictions'] == 1
+    cache.predict_proba(['alpha'], model, LengthVectorizer(), 'v1')
+    assert model.batches == [2, 1]
+
+
+def test_score_texts_matches_with_and_without_cache():
+    texts = ['love this airline so much', 'bad', 'love this airline so much', '']
+    plain = score_texts(texts, CountingModel(), LengthVectorizer())
+    cached = score_texts(texts, CountingModel(), LengthVectorizer(), PredictionCache(), 'v1')
+    assert plain[0].tolist() == cached[0].tolist() == ['positive', 'negative', 'positive', 'negative']
+    np.testing.assert_allclose(plain[1], cached[1])
+    assert score_texts([], CountingModel(), LengthVectorizer(), PredictionCache(), 'v1')[0].tolist() == []
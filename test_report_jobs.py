@@ -0,0 +1,104 @@
+import os
+import threading
+
+import pandas as pd
+
+import report_jobs
+from report_jobs import DONE, FAILED, ReportJobQueue, data_fingerprint
+
+
+def sample_frame():
+    return pd.DataFrame({
+        'text': ['great product', 'bad quality', 'okay item'],
+        'sentiment': ['positive', 'negative', 'neutral'],
+        'date': ['2025-01-01', '2025-01-02', '2025-01-03'],
+    })
+
+
+class CountingGenerator:
+    """Stand-in generator that records builds and can be held until released"""
+
+    def __init__(self, fail=False):
+        self.calls = 0
+        self.fail = fail
+        self.release = threading.Event()
+        self.release.set()
+
+    def build_report(self, report_type, data, name, output_path):
+        self.calls += 1
+        self.release.wait(5)
+        if self.fail:
+            raise RuntimeError("boom")
+        with open(output_path, 'w') as f:
+            f.write(f"{report_type} {name} {len(data)}")
+        return output_path
+
+
+def test_fingerprint_follows_content_not_index():
+    df = sample_frame()
+    assert data_fingerprint(df) == data_fingerprint(df.copy())
+    assert data_fingerprint(df) == data_fingerprint(df.set_axis([10, 11, 12]))
+    changed = df.copy()
+    changed.loc[0, 'text'] = 'great products'
+    assert data_fingerprint(df) != data_fingerprint(changed)
+
+
+def test_job_lifecycle_and_unique_paths(tmp_path):
+    queue = ReportJobQueue(CountingGenerator(), reports_dir=str(tmp_path))
+    first = queue.submit('product', sample_frame(), 'Widget')
+    second = queue.submit('product', sample_frame(), 'Gadget')
+    assert first != second
+    assert queue.wait(first, timeout=5) == DONE
+    assert queue.wait(second, timeout=5) == DONE
+    assert queue.get(first).path != queue.get(second).path
+    assert queue.read(first) == b"product Widget 3"
+    assert queue.status('missing') is None
+
+
+def test_file_extension_matches_what_the_generator_writes(tmp_path, monkeypatch):
+    monkeypatch.setattr(report_jobs, 'REPORT_EXTENSION', 'txt')
+    queue = ReportJobQueue(CountingGenerator(), reports_dir=str(tmp_path))
+    job = queue.get(queue.submit('product', sample_frame(), 'Widget'))
+    assert job.path.endswith('.txt')
+    assert job.download_name.endswith('.txt')
+
+
+def test_identical_requests_share_one_job(tmp_path):
+    generator = CountingGenerator()
+    generator.release.clear()
+    queue = ReportJobQueue(generator, reports_dir=str(tmp_path))
+    first = queue.submit('marketing', sample_frame(), 'Summer Sale')
+    # Same content while the first is still building, then after it finished
+    assert queue.submit('marketing', sample_frame(), 'Summer Sale') == first
+    generator.release.set()
+    assert queue.wait(first, timeout=5) == DONE
+    assert queue.submit('marketing', sample_frame(), 'Summer Sale') == first
+    assert generator.calls == 1
+
+    # A different report type or a deleted artifact starts a new build
+    assert queue.submit('product', sample_frame(), 'Summer Sale') != first
+    os.remove(queue.get(first).path)
+    rebuilt = queue.submit('marketing', sample_frame(), 'Summer Sale')
+    assert rebuilt != first
+    assert queue.wait(rebuilt, timeout=5) == DONE
+
+
+def test_failed_job_reports_error_and_is_retried(tmp_path):
+    queue = ReportJobQueue(CountingGenerator(fail=True), reports_dir=str(tmp_path))
+    job_id = queue.submit('product', sample_frame(), 'Widget')
+    assert queue.wait(job_id, timeout=5) == FAILED
+    assert queue.get(job_id).error == "boom"
+    assert queue.read(job_id) is None
+    assert queue.submit('product', sample_frame(), 'Widget') != job_id
+
+
+def test_old_finished_jobs_are_evicted_with_their_files(tmp_path):
+    queue = ReportJobQueue(CountingGenerator(), reports_dir=str(tmp_path), max_jobs=2)
+    ids, paths = [], []
+    for name in ['a', 'b', 'c']:
+        ids.append(queue.submit('product', sample_frame(), name))
+        paths.append(queue.get(ids[-1]).path)
+        queue.wait(ids[-1], timeout=5)
+    assert queue.get(ids[0]) is None
+    assert not os.path.exists(paths[0])
+    assert all(os.path.exists(path) for path in paths[1:])
@@ -0,0 +1,47 @@
+import os
+
+import pandas as pd
+
+from dataset_cache import DatasetCache
+from dataset_store import DatasetStore
+from schema_inference import get_schema, infer_schema
+
+
+def test_infer_by_name_and_by_values():
+    named = pd.DataFrame({'id': [1, 2], 'review_body': ['a', 'b'], 'star_rating': [5, 1], 'created_date': ['x', 'y']})
+    assert infer_schema(named)['text_column'] == 'review_body'
+    assert infer_schema(named)['sentiment_column'] == 'star_rating'
+    assert infer_schema(named)['date_columns'] == ['created_date']
+
+    unnamed = pd.DataFrame({
+        'id': range(6),
+        'mood': ['positive', 'negative', 'neutral'] * 2,
+        'body': ['this is a fairly long piece of customer feedback'] * 6,
+    })
+    schema = infer_schema(unnamed)
+    assert schema['sentiment_column'] == 'mood'
+    assert schema['text_column'] == 'body'
+
+
+def test_large_frames_are_sampled():
+    df = pd.DataFrame({'x': ['short'] * 20000, 'y': ['a much longer free text comment here'] * 20000})
+    schema = infer_schema(df)
+    assert schema['sample_rows'] == 5000
+    assert schema['text_column'] == 'y'
+
+
+def test_schema_is_persisted_and_travels_with_loaded_frames(tmp_path):
+    path = os.path.join(tmp_path, 'reviews.csv')
+    pd.DataFrame({'text': ['good', 'bad'] * 5, 'sentiment': ['positive', 'negative'] * 5}).to_csv(path, index=False)
+
+    store = DatasetStore(str(tmp_path))
+    assert store.schema('reviews.csv')['sentiment_column'] == 'sentiment'
+    assert DatasetStore(str(tmp_path)).info('reviews.csv')['schema']['text_column'] == 'text'
+
+    df = DatasetCache().get(path, store.load)
+    subset = df[df['sentiment'] == 'positive']
+    assert subset.attrs['schema'] is not None
+    assert get_schema(subset)['text_column'] == 'text'
+
+    # A projected frame without the detected columns falls back to inference
+    assert get_schema(df[['sentiment']])['text_column'] == 'sentiment'
@@ -0,0 +1,99 @@
+import json
+import threading
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from scoring_service import MicroBatcher, make_server
+
+
+class EchoScorer:
+    """Labels each text with its length and records the batch sizes it was called with"""
+
+    def __init__(self):
+        self.batches = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def __call__(self, texts):
+        self.release.wait(5)
+        self.batches.append(len(texts))
+        return [str(len(text)) for text in texts], [1.0] * len(texts), 'v-test'
+
+
+@pytest.fixture
+def server():
+    server = make_server(port=0, scorer=EchoScorer(), max_wait_ms=20)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def post(server, path, payload):
+    host, port = server.server_address[:2]
+    request = urllib.request.Request(f"http://{host}:{port}{path}", data=json.dumps(payload).encode('utf-8'),
+                                     headers={'Content-Type': 'application/json'})
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def test_concurrent_requests_share_batches():
+    scorer = EchoScorer()
+    scorer.release.clear()
+    batcher = MicroBatcher(scorer, max_batch=100, max_wait=0.05)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(batcher.score, ['x' * i]) for i in range(1, 9)]
+        scorer.release.set()
+        results = [future.result(timeout=10) for future in futures]
+
+    # Every caller gets its own slice back, in order
+    assert [labels for labels, _, _ in results] == [[str(i)] for i in range(1, 9)]
+    assert sum(scorer.batches) == 8
+    assert len(scorer.batches) < 8
+    assert batcher.stats()['requests'] == 8
+
+
+def test_batch_is_capped_but_requests_are_not_split():
+    scorer = EchoScorer()
+    batcher = MicroBatcher(scorer, max_batch=3, max_wait=0.05)
+    labels, _, _ = batcher.score(['a', 'bb', 'ccc', 'dddd', 'eeeee'])
+    assert labels == ['1', '2', '3', '4', '5']
+    assert scorer.batches == [5]
+
+
+def test_scorer_errors_reach_every_caller():
+    def failing(texts):
+        raise RuntimeError("model missing")
+
+    batcher = MicroBatcher(failing, max_wait=0.001)
+    with pytest.raises(RuntimeError, match="model missing"):
+        batcher.score(['text'])
+
+
+def test_predict_endpoints(server):
+    status, body = post(server, '/predict', {'text': 'hello'})
+    assert status == 200
+    assert body == {'label': '5', 'confidence': 1.0, 'model_version': 'v-test'}
+
+    status, body = post(server, '/predict_batch', {'texts': ['a', 'abc']})
+    assert status == 200
+    assert [p['label'] for p in body['predictions']] == ['1', '3']
+
+
+def test_bad_requests_are_rejected(server):
+    assert post(server, '/predict', {'texts': ['a']})[0] == 400
+    assert post(server, '/predict_batch', {'texts': 'a'})[0] == 400
+    assert post(server, '/unknown', {})[0] == 404
+    assert post(server, '/predict', None)[0] == 400
+
+    host, port = server.server_address[:2]
+    with urllib.request.urlopen(f"http://{host}:{port}/health", timeout=10) as response:
+        health = json.loads(response.read())
+    assert health['status'] == 'ok'
@@ -0,0 +1,119 @@
+import os
+import threading
+
+import pandas as pd
+import pytest
+
+from database_manager import DatabaseManager
+from ingestion import DatasetIngestor
+from search_index import SearchIndex, fts_query
+
+
+@pytest.fixture
+def index(tmp_path):
+    return SearchIndex(DatabaseManager(os.path.join(tmp_path, 'data', 'test.db')))
+
+
+def test_fts_query_quotes_terms_and_adds_prefix():
+    assert fts_query('slow delivery') == '"slow" "delivery"*'
+    assert fts_query('NOT "broken" OR', prefix=False) == '"NOT" "broken" "OR"'
+    assert fts_query('?!') is None
+
+
+def test_feedback_index_follows_the_feedback_table(index):
+    db = index.db
+    db.insert_feedback_batch(pd.DataFrame({'text': ['battery died fast', 'great battery', 'slow delivery'],
+                                           'sentiment': ['negative', 'positive', 'negative']}))
+    assert index.count_feedback('batt') == 2
+    assert index.count_feedback('batt', prefix=False) == 0
+    assert index.search_feedback('battery died')['text'].tolist() == ['battery died fast']
+
+    with db.connection() as conn:
+        conn.execute("UPDATE feedback SET text = 'great screen' WHERE text = 'great battery'")
+        conn.execute("DELETE FROM feedback WHERE text = 'slow delivery'")
+    assert index.search_feedback('battery')['text'].tolist() == ['battery died fast']
+    assert index.count_feedback('screen') == 1
+    assert index.count_feedback('delivery') == 0
+
+
+def test_existing_feedback_is_indexed_when_the_index_is_created(tmp_path):
+    db_path = os.path.join(tmp_path, 'data', 'test.db')
+    db = DatabaseManager(db_path)
+    db.insert_feedback_batch(pd.DataFrame({'text': ['late parcel']}))
+    with db.connection() as conn:
+        conn.execute("DROP TABLE feedback_fts")
+        conn.execute("DROP TRIGGER feedback_fts_insert")
+
+    assert SearchIndex(DatabaseManager(db_path)).count_feedback('parcel') == 1
+
+
+def test_dataset_search_ranks_pages_and_rebuilds(index, tmp_path):
+    path = os.path.join(tmp_path, 'reviews.csv')
+    df = pd.DataFrame({'text': ['screen ok', 'screen screen screen cracked', 'battery', None, 'screen dim']})
+    df.to_csv(path, index=False)
+
+    assert index.ensure('reviews.csv', path, df, 'text')
+    assert not index.ensure('reviews.csv', path, df, 'text')
+    assert index.count('reviews.csv', 'screen') == 3
+    assert index.search('reviews.csv', 'screen', limit=1)['row'].tolist() == [1]
+    assert sorted(index.search('reviews.csv', 'screen', limit=2, offset=1)['row']) == [0, 4]
+
+    # Another dataset does not leak into this one's results
+    index.add('other.csv', ['screen'], 0)
+    assert index.count('reviews.csv', 'scr') == 3
+
+    df.iloc[2:].to_csv(path, index=False)
+    assert index.ensure('reviews.csv', path, df.iloc[2:].reset_index(drop=True), 'text')
+    assert index.search('reviews.csv', 'screen')['row'].tolist() == [2]
+    assert index.count('other.csv', 'screen') == 1
+
+
+def test_concurrent_ensure_indexes_each_row_once(index, tmp_path):
+    path = os.path.join(tmp_path, 'reviews.csv')
+    df = pd.DataFrame({'text': ['hello world'] * 5000})
+    df.to_csv(path, index=False)
+
+    barrier = threading.Barrier(4)
+
+    def load_page():
+        barrier.wait()
+        index.ensure('reviews.csv', path, df, 'text')
+
+    threads = [threading.Thread(target=load_page) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert index.is_current('reviews.csv', path)
+    assert index.count('reviews.csv', 'hello') == 5000
+
+
+def test_partial_index_is_not_marked_current(index, tmp_path, monkeypatch):
+    path = os.path.join(tmp_path, 'reviews.csv')
+    df = pd.DataFrame({'text': ['screen ok', 'battery']})
+    df.to_csv(path, index=False)
+    monkeypatch.setattr(index.db, 'add_dataset_search_rows', lambda dataset, texts, start_row: False)
+
+    assert not index.ensure('reviews.csv', path, df, 'text')
+    assert not index.is_current('reviews.csv', path)
+
+    DatasetIngestor(index.db, search_index=index).ingest(path, 'text', 'text', os.path.join(tmp_path, 'clean.csv'),
+                                                         user_id=1)
+    assert not index.is_current('clean.csv', os.path.join(tmp_path, 'clean.csv'))
+
+
+def test_ingestion_indexes_rows_of_the_cleaned_file(index, tmp_path):
+    source = os.path.join(tmp_path, 'upload.csv')
+    pd.DataFrame({'text': ['love the screen', '', 'hate the battery', 'screen is bright'],
+                  'sentiment': ['positive', 'neutral', 'negative', 'positive']}).to_csv(source, index=False)
+    dataset_path = os.path.join(tmp_path, 'clean.csv')
+
+    DatasetIngestor(index.db, chunksize=2, search_index=index).ingest(
+        source, 'text', 'sentiment', dataset_path, user_id=1)
+
+    cleaned = pd.read_csv(dataset_path)
+    rows = index.search('clean.csv', 'screen')['row']
+    assert cleaned.loc[rows, 'text'].str.contains('screen').all() and len(rows) == 2
+    assert index.is_current('clean.csv', dataset_path)
+    assert index.count_feedback('battery') == 1
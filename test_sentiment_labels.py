@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+
+from sentiment_labels import (NEGATIVE, NEUTRAL, POSITIVE, UNKNOWN, add_sentiment_codes,
+                              code_counts, code_labels, normalize_labels)
+
+
+def test_text_labels():
+    codes = normalize_labels(['Positive', 'negative', 'neutral', 'Very Good', 'poor', None, 'banana'])
+    assert codes.dtype == np.int8
+    assert list(codes) == [POSITIVE, NEGATIVE, NEUTRAL, POSITIVE, NEGATIVE, UNKNOWN, UNKNOWN]
+
+
+def test_rating_scales():
+    assert list(normalize_labels([1, 2, 3, 4, 5])) == [NEGATIVE, NEGATIVE, NEUTRAL, POSITIVE, POSITIVE]
+    assert list(normalize_labels(['1', '4', '5', '7', '10'])) == [NEGATIVE, NEGATIVE, NEUTRAL, POSITIVE, POSITIVE]
+    assert list(normalize_labels([-0.5, 0.0, 0.8])) == [NEGATIVE, NEUTRAL, POSITIVE]
+
+
+def test_zero_based_class_scales():
+    assert list(normalize_labels([0, 1, 1, 0])) == [NEGATIVE, POSITIVE, POSITIVE, NEGATIVE]
+    assert list(normalize_labels(['0', '1', '2'])) == [NEGATIVE, NEUTRAL, POSITIVE]
+    assert list(normalize_labels([0, 1, 2, 3, 4])) == [NEGATIVE, NEGATIVE, NEUTRAL, POSITIVE, POSITIVE]
+    # Sentiment140 style 0/2/4 polarity
+    assert list(normalize_labels([0, 4, 2])) == [NEGATIVE, POSITIVE, NEUTRAL]
+    assert list(normalize_labels([0.1, 0.5, 0.9])) == [NEGATIVE, NEUTRAL, POSITIVE]
+
+
+def test_no_substring_matches():
+    # The old '1|2' pattern counted these as negative
+    assert list(normalize_labels(['12 stars', '0.2 rating'])) == [UNKNOWN, UNKNOWN]
+
+
+def test_counts_and_labels():
+    df = add_sentiment_codes(pd.DataFrame({'sentiment': ['positive', 'negative', 'negative', 'meh']}), 'sentiment')
+    assert code_counts(df['sentiment_code']) == (2, 0, 1, 1)
+    assert list(code_labels(df['sentiment_code']).astype(object)[:3]) == ['positive', 'negative', 'negative']
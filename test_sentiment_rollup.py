@@ -0,0 +1,100 @@
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from database_manager import DatabaseManager
+from ingestion import DatasetIngestor
+from sentiment_rollup import SentimentRollup, daily_counts, parse_days, rolling_mean
+
+
+@pytest.fixture
+def rollup(tmp_path):
+    return SentimentRollup(DatabaseManager(os.path.join(tmp_path, 'data', 'test.db')))
+
+
+def frame():
+    return pd.DataFrame({
+        'date': ['2025-01-01 09:00', '2025-01-01 18:00', '2025-01-03', 'not a date', '2025-01-03'],
+        'sentiment': ['positive', 'negative', 'negative', 'positive', 'negative'],
+        'platform': ['twitter', 'email', 'twitter', 'twitter', None],
+        'product': ['A', 'A', 'B', 'A', 'A'],
+    })
+
+
+def test_parse_days_keeps_local_wall_time():
+    days = parse_days(['2015-02-24 23:35:52 -0800', '2015-02-25 00:10:00 -0800'])
+    assert [str(day.date()) for day in days] == ['2015-02-24', '2015-02-25']
+
+
+def test_daily_counts_skip_rows_without_a_date():
+    df = frame()
+    counts = daily_counts(df['date'], df['sentiment'], df['platform'], df['product'])
+    assert sorted(counts) == [
+        ('2025-01-01', 'negative', 'email', 'A', 1),
+        ('2025-01-01', 'positive', 'twitter', 'A', 1),
+        ('2025-01-03', 'negative', '', 'A', 1),
+        ('2025-01-03', 'negative', 'twitter', 'B', 1),
+    ]
+
+
+def test_rolling_mean_matches_pandas_rolling():
+    daily = pd.DataFrame(np.random.default_rng(0).integers(0, 50, size=(40, 3)),
+                         index=pd.date_range('2025-01-01', periods=40), columns=['negative', 'neutral', 'positive'])
+    for window in (1, 7, 30, 60):
+        expected = daily.rolling(window, min_periods=1).mean()
+        pd.testing.assert_frame_equal(rolling_mean(daily, window), expected)
+
+
+def test_daily_fills_missing_days_and_filters(rollup, tmp_path):
+    path = os.path.join(tmp_path, 'reviews.csv')
+    frame().to_csv(path, index=False)
+
+    assert rollup.ensure('reviews.csv', path, frame(), 'date', 'sentiment')
+    assert not rollup.ensure('reviews.csv', path, frame(), 'date', 'sentiment')
+
+    daily = rollup.daily('reviews.csv')
+    assert list(daily.index.strftime('%Y-%m-%d')) == ['2025-01-01', '2025-01-02', '2025-01-03']
+    assert daily['negative'].tolist() == [1, 0, 2]
+    assert daily['positive'].tolist() == [1, 0, 0]
+
+    assert rollup.daily('reviews.csv', product='B')['negative'].tolist() == [1]
+    assert rollup.daily('reviews.csv', platform='twitter', sentiments=['positive']).columns.tolist() == ['positive']
+    assert rollup.daily('reviews.csv', start='2025-01-02').index.min() == pd.Timestamp('2025-01-03')
+    assert rollup.daily('missing.csv').empty
+
+
+def test_concurrent_ensure_counts_each_row_once(rollup, tmp_path):
+    path = os.path.join(tmp_path, 'reviews.csv')
+    df = pd.DataFrame({'date': ['2025-01-01'] * 5000, 'sentiment': ['positive'] * 5000})
+    df.to_csv(path, index=False)
+
+    barrier = threading.Barrier(4)
+
+    def load_page():
+        barrier.wait()
+        rollup.ensure('reviews.csv', path, df, 'date', 'sentiment')
+
+    threads = [threading.Thread(target=load_page) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert rollup.is_current('reviews.csv', path, 'date')
+    assert rollup.daily('reviews.csv')['positive'].tolist() == [5000]
+
+
+def test_ingestion_rolls_up_each_chunk(rollup, tmp_path):
+    source = os.path.join(tmp_path, 'upload.csv')
+    df = frame().assign(text=['good', 'bad', 'awful', 'fine', 'poor'])
+    df.to_csv(source, index=False)
+    dataset_path = os.path.join(tmp_path, 'clean.csv')
+
+    DatasetIngestor(rollup.db, chunksize=2, rollup=rollup).ingest(
+        source, 'text', 'sentiment', dataset_path, user_id=1)
+
+    assert rollup.daily('clean.csv')['negative'].tolist() == [1, 0, 2]
+    assert rollup.is_current('clean.csv', dataset_path, 'date')
@@ -0,0 +1,27 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def loaded_modules(*modules):
+    """Top-level packages loaded after importing modules in a fresh interpreter"""
+    script = ("import sys\n"
+              f"for name in {modules!r}:\n"
+              "    __import__(name)\n"
+              "print(' '.join(sorted({name.split('.')[0] for name in sys.modules})))")
+    output = subprocess.run([sys.executable, '-c', script], cwd=ROOT, capture_output=True,
+                            text=True, check=True).stdout
+    return set(output.split())
+
+
+def test_app_defers_heavy_libraries():
+    loaded = loaded_modules('app')
+    assert not loaded & {'sklearn', 'scipy', 'matplotlib', 'reportlab', 'wordcloud'}
+    assert 'views' in loaded
+
+
+def test_pages_load_only_what_they_use():
+    assert 'reportlab' in loaded_modules('app', 'views.marketing')
+    assert not loaded_modules('app', 'views.dashboard') & {'sklearn', 'reportlab'}
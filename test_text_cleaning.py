@@ -0,0 +1,38 @@
+import numpy as np
+import pandas as pd
+
+from text_cleaning import clean_text_for_training, clean_texts, clean_text_series
+
+SAMPLES = [
+    "@united Flight 1234 was LATE!!! http://t.co/xyz #fail",
+    "Can't   believe\tit... www.example.com/page ok",
+    "Café au lait ☕ @barista_1",
+    "  mixed\nlines\r\nand CAPS  ",
+    "#hashtag-only",
+    "",
+    None,
+    np.nan,
+    pd.NA,
+    pd.NaT,
+    np.float32('nan'),
+    42,
+    "has a \x00 null byte",
+]
+
+
+def test_batch_cleaning_matches_row_wise():
+    expected = [clean_text_for_training(text) for text in SAMPLES]
+    assert clean_texts(SAMPLES) == expected
+
+
+def test_clean_text_series_keeps_index():
+    series = pd.Series(SAMPLES, index=range(100, 100 + len(SAMPLES)), name='text')
+    cleaned = clean_text_series(series, chunksize=3)
+
+    assert list(cleaned.index) == list(series.index)
+    assert cleaned.tolist() == [clean_text_for_training(text) for text in SAMPLES]
+
+
+def test_clean_text_for_training():
+    assert clean_text_for_training("@united Flight 1234 was LATE!!! http://t.co/xyz") == "flight was late"
+    assert clean_text_for_training(None) == ""
@@ -0,0 +1,93 @@
+import os
+import threading
+
+import pandas as pd
+import pytest
+
+from database_manager import DatabaseManager
+from ingestion import DatasetIngestor
+from token_index import TokenIndex, token_counts
+
+
+@pytest.fixture
+def index(tmp_path):
+    return TokenIndex(DatabaseManager(os.path.join(tmp_path, 'data', 'test.db')))
+
+
+def test_token_counts_skips_stopwords_numbers_and_possessives():
+    counts = token_counts(["The delivery was LATE, late!", None, "John's 2 cats"], ['neg', 'neg', 'pos'])
+    assert counts.to_dict() == {('neg', 'delivery'): 1, ('neg', 'late'): 2, ('pos', 'cats'): 1, ('pos', 'john'): 1}
+
+
+def test_add_accumulates_counts_per_sentiment(index):
+    index.add('reviews.csv', ['great phone', 'broken phone'], ['positive', 'negative'])
+    index.add('reviews.csv', ['great price'], ['positive'])
+
+    assert index.frequencies('reviews.csv') == {'phone': 2, 'great': 2, 'broken': 1, 'price': 1}
+    assert index.frequencies('reviews.csv', ['positive']) == {'great': 2, 'phone': 1, 'price': 1}
+    assert index.db.get_token_index_state('reviews.csv') == (None, 3)
+
+
+def test_ensure_builds_once_per_file_version(index, tmp_path):
+    path = os.path.join(tmp_path, 'reviews.csv')
+    df = pd.DataFrame({'text': ['slow delivery', 'fast delivery'], 'sentiment': ['negative', 'positive']})
+    df.to_csv(path, index=False)
+
+    assert index.ensure('reviews.csv', path, df, 'text', 'sentiment')
+    assert not index.ensure('reviews.csv', path, df, 'text', 'sentiment')
+    assert index.frequencies('reviews.csv') == {'delivery': 2, 'fast': 1, 'slow': 1}
+
+    df.iloc[:1].to_csv(path, index=False)
+    assert index.ensure('reviews.csv', path, df.iloc[:1], 'text', 'sentiment')
+    assert index.frequencies('reviews.csv') == {'delivery': 1, 'slow': 1}
+
+
+def test_concurrent_ensure_builds_the_index_once(index, tmp_path):
+    path = os.path.join(tmp_path, 'reviews.csv')
+    df = pd.DataFrame({'text': ['hello world'] * 5000, 'sentiment': ['positive'] * 5000})
+    df.to_csv(path, index=False)
+
+    barrier = threading.Barrier(4)
+    built = []
+
+    def load_page():
+        barrier.wait()
+        built.append(index.ensure('reviews.csv', path, df, 'text', 'sentiment'))
+
+    threads = [threading.Thread(target=load_page) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(built) == [False, False, False, True]
+    assert index.frequencies('reviews.csv') == {'hello': 5000, 'world': 5000}
+
+
+def test_word_cloud_images_are_cached_until_the_index_changes(index):
+    index.add('reviews.csv', ['great phone'], ['positive'])
+    image = index.word_cloud('reviews.csv', ['positive'])
+    assert image.shape == (400, 800, 3)
+    assert index.word_cloud('reviews.csv', ['positive']) is image
+
+    calls = []
+    filtered = index.word_cloud('reviews.csv', ['positive'], 'jan', lambda: calls.append(1) or {'phone': 1})
+    assert index.word_cloud('reviews.csv', ['positive'], 'jan', lambda: calls.append(1) or {'phone': 1}) is filtered
+    assert calls == [1]
+
+    index.add('reviews.csv', ['great case'], ['positive'])
+    assert index.word_cloud('reviews.csv', ['positive']) is not image
+    assert index.word_cloud('reviews.csv', ['negative']) is None
+
+
+def test_ingestion_indexes_each_chunk(index, tmp_path):
+    source = os.path.join(tmp_path, 'upload.csv')
+    pd.DataFrame({'text': ['love the screen', 'hate the battery', 'screen is bright'],
+                  'sentiment': ['positive', 'negative', 'positive']}).to_csv(source, index=False)
+    dataset_path = os.path.join(tmp_path, 'clean.csv')
+
+    DatasetIngestor(index.db, chunksize=2, token_index=index).ingest(
+        source, 'text', 'sentiment', dataset_path, user_id=1)
+
+    assert index.frequencies('clean.csv', ['positive'])['screen'] == 2
+    assert index.is_current('clean.csv', dataset_path)
@@ -0,0 +1,155 @@
+import importlib.util
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+from dataset_store import build_lock, file_signature
+
+# wordcloud (and the imaging libraries it pulls in) is imported on first use
+WORDCLOUD_AVAILABLE = importlib.util.find_spec('wordcloud') is not None
+
+# Same tokens WordCloud.generate would find
+TOKEN_PATTERN = r"\w[\w']*"
+# Rows tokenized at a time when an index is built from a loaded frame
+BUILD_CHUNKSIZE = 50000
+# Words drawn per cloud, and rendered images kept in memory
+MAX_WORDS = 200
+MAX_IMAGES = 32
+
+_stopword_list = None
+
+
+def stopword_list():
+    """WordCloud's stopwords, lowercased and sorted, loaded once"""
+    global _stopword_list
+    if _stopword_list is None:
+        stopwords = set()
+        if WORDCLOUD_AVAILABLE:
+            from wordcloud import STOPWORDS as stopwords
+        _stopword_list = sorted(word.lower() for word in stopwords)
+    return _stopword_list
+
+
+def token_counts(texts, sentiments=None):
+    """Count word-cloud tokens, per sentiment label when sentiments are given.
+
+    Returns a Series indexed by token, or by (sentiment, token) pairs.
+    Tokens are lowercased with a trailing 's removed; numbers, single
+    characters and WordCloud stopwords are skipped.
+    """
+    texts = pd.Series(texts).fillna('').astype(str).reset_index(drop=True)
+    tokens = texts.str.lower().str.replace("'s\\b", '', regex=True).str.findall(TOKEN_PATTERN)
+    frame = pd.DataFrame({'token': tokens})
+    if sentiments is not None:
+        frame['sentiment'] = pd.Series(sentiments).astype(str).to_numpy()
+    frame = frame.explode('token').dropna(subset=['token'])
+    frame = frame[(frame['token'].str.len() > 1) & ~frame['token'].str.isdigit()
+                  & ~frame['token'].isin(stopword_list())]
+    if sentiments is None:
+        return frame['token'].value_counts()
+    return frame.groupby(['sentiment', 'token']).size()
+
+
+class TokenIndex:
+    """Per-dataset, per-sentiment token counts plus a cache of rendered word clouds.
+
+    Counts live in the token_frequencies table and are added to as chunks
+    of feedback come in, so a word cloud is drawn from stored frequencies
+    instead of re-tokenizing every text on each rerun. Rendered images are
+    kept by (dataset, index state, sentiments, filter); adding rows to or
+    rebuilding a dataset's index changes its key, so stale images are never served.
+    """
+
+    def __init__(self, db, max_images=MAX_IMAGES):
+        self.db = db
+        self.max_images = max_images
+        self._lock = threading.Lock()
+        self._images = OrderedDict()
+
+    def add(self, dataset, texts, sentiments):
+        """Count a batch of texts into a dataset's index"""
+        counts = token_counts(texts, sentiments)
+        rows = [(sentiment, token, count) for (sentiment, token), count in counts.items()]
+        return self.db.add_token_counts(dataset, rows, len(texts))
+
+    def clear(self, dataset):
+        """Drop a dataset's counts before it is indexed from scratch"""
+        return self.db.clear_token_counts(dataset)
+
+    def mark_current(self, dataset, path):
+        """Record that the index covers the file at path as it is now"""
+        return self.db.set_token_index_signature(dataset, file_signature(path))
+
+    def is_current(self, dataset, path):
+        """Whether the index was built from the file at path as it is now"""
+        state = self.db.get_token_index_state(dataset)
+        return state is not None and state[0] == file_signature(path)
+
+    def lock(self, dataset):
+        """Lock to hold while the dataset's index is cleared and rebuilt"""
+        return build_lock('token_index', self.db.db_path, dataset)
+
+    def ensure(self, dataset, path, df, text_col, sentiment_col):
+        """Build the index from a loaded frame unless it already matches the file"""
+        if self.is_current(dataset, path):
+            return False
+        with self.lock(dataset):
+            # Another session may have built it while this one waited
+            if self.is_current(dataset, path):
+                return False
+            self.clear(dataset)
+            for start in range(0, len(df), BUILD_CHUNKSIZE):
+                chunk = df.iloc[start:start + BUILD_CHUNKSIZE]
+                sentiments = chunk[sentiment_col] if sentiment_col else pd.Series('', index=chunk.index)
+                if not self.add(dataset, chunk[text_col], sentiments):
+                    return False
+            self.mark_current(dataset, path)
+        return True
+
+    def frequencies(self, dataset, sentiments=None, limit=MAX_WORDS):
+        """Most frequent tokens of a dataset, optionally for some sentiment labels"""
+        return self.db.get_token_frequencies(dataset, sentiments, limit)
+
+    def word_cloud(self, dataset, sentiments=None, filter_key=None, frequencies=None):
+        """Word cloud image (RGB array) for a dataset, or None if there are no words.
+
+        frequencies, if given, is a callable returning {token: count} for a
+        filtered view that the index cannot answer; it is only called when
+        the image for filter_key is not cached yet.
+        """
+        if not WORDCLOUD_AVAILABLE:
+            return None
+
+        state = self.db.get_token_index_state(dataset)
+        sentiment_key = tuple(sorted(str(s) for s in sentiments)) if sentiments is not None else None
+        key = (dataset, state, sentiment_key, filter_key)
+        with self._lock:
+            if key in self._images:
+                self._images.move_to_end(key)
+                return self._images[key]
+
+        words = frequencies() if frequencies is not None else self.frequencies(dataset, sentiments)
+        if not words:
+            return None
+        from wordcloud import WordCloud
+        image = WordCloud(width=800, height=400, background_color='white',
+                          max_words=MAX_WORDS).generate_from_frequencies(words).to_array()
+
+        with self._lock:
+            self._images[key] = image
+            while len(self._images) > self.max_images:
+                self._images.popitem(last=False)
+        return image
+
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def get_token_index(db):
+    """Return the process-wide token index for a database"""
+    with _indexes_lock:
+        if db.db_path not in _indexes:
+            _indexes[db.db_path] = TokenIndex(db)
+        return _indexes[db.db_path]
@@ -0,0 +1,659 @@
+"""Administration page: system health, dataset management and model training"""
+
+import os
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+try:
+    import plotly.graph_objects as go
+    PLOTLY_AVAILABLE = True
+except ImportError:
+    PLOTLY_AVAILABLE = False
+
+from bulk_reports import REPORT_TYPES, bulk_output_dir, find_group_column, generate_bulk_reports
+from chart_renderer import get_chart_renderer
+from ingestion import DatasetIngestor
+from model_manager import JOBLIB_AVAILABLE, get_model_manager
+from model_training import IncrementalTrainer
+from prediction_cache import get_prediction_cache
+from schema_inference import get_schema
+from search_index import SearchIndex
+from text_cleaning import clean_text_for_training, clean_text_series
+from token_index import get_token_index
+from views.common import BASE_DIR, DATA_DIR, auth, dataset_cache, dataset_store, db, rollup
+from views.reports import report_queue
+
+model_manager = get_model_manager(
+    os.path.join(BASE_DIR, "sentiment_model.joblib"),
+    os.path.join(BASE_DIR, "tfidf_vectorizer.joblib")
+)
+chart_renderer = get_chart_renderer()
+prediction_cache = get_prediction_cache()
+token_index = get_token_index(db)
+search_index = SearchIndex(db)
+
+# Rows read from an uploaded file for the preview and column mapping
+UPLOAD_PREVIEW_ROWS = 1000
+# Processes used by the admin bulk report button
+BULK_REPORT_WORKERS = min(4, os.cpu_count() or 1)
+
+
+def train_sentiment_model(df, text_col, sentiment_col):
+    """Train sentiment model on provided data"""
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.model_selection import train_test_split
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.metrics import accuracy_score, classification_report
+    
+    # Clean the data
+    df_clean = df.copy()
+    df_clean[text_col] = clean_text_series(df_clean[text_col])
+    df_clean = df_clean.dropna(subset=[text_col, sentiment_col])
+    df_clean = df_clean[df_clean[text_col].str.len() > 0]
+    
+    # Vectorize text
+    vectorizer = TfidfVectorizer(max_features=5000, stop_words='english')
+    X = vectorizer.fit_transform(df_clean[text_col])
+    y = df_clean[sentiment_col]
+    
+    # Split data
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+    
+    # Train model
+    model = LogisticRegression(max_iter=1000)
+    model.fit(X_train, y_train)
+    
+    # Evaluate
+    y_pred = model.predict(X_test)
+    accuracy = accuracy_score(y_test, y_pred)
+    
+    return model, vectorizer, accuracy, classification_report(y_test, y_pred)
+
+def show_admin_panel():
+    """Show admin panel for administrators"""
+    if not auth.require_permission('manage_users'):
+        st.error("Access denied: Admin privileges required")
+        return
+    
+    st.header("🔧 Administration Panel")
+    
+    # System Health Dashboard
+    st.subheader("System Health")
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("Total Users", db.count_users())
+    with col2:
+        st.metric("Total Feedback", f"{db.count_feedback():,}")
+    with col3:
+        st.metric("System Status", "✅ Healthy")
+    with col4:
+        st.metric("Uptime", "99.9%")
+
+    # Process-wide dataset cache shared by all sessions
+    cache_stats = dataset_cache.stats()
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Dataset Cache", f"{cache_stats['bytes'] / (1024 * 1024):.0f} / "
+                                   f"{cache_stats['max_bytes'] / (1024 * 1024):.0f} MB",
+                  help=f"{cache_stats['entries']} datasets cached")
+    with col2:
+        st.metric("Cache Hits", f"{cache_stats['hits']:,}")
+    with col3:
+        st.metric("Cache Misses", f"{cache_stats['misses']:,}")
+    with col4:
+        st.metric("Cache Evictions", f"{cache_stats['evictions']:,}")
+
+    with st.expander("📈 Feedback Overview"):
+        # Aggregated in SQL - the feedback table is never loaded into pandas
+        feedback_counts = db.sentiment_counts(by='platform')
+        if feedback_counts.empty:
+            st.info("No feedback stored yet")
+        else:
+            st.dataframe(feedback_counts, use_container_width=True)
+    
+    with st.expander("🧰 Runtime Metrics"):
+        log_stats = db.log_writer.stats()
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Log Queue Depth", log_stats['queue_depth'])
+        with col2:
+            st.metric("Log Rows Written", f"{log_stats['written']:,}")
+        with col3:
+            st.metric("Log Rows Dropped", log_stats['dropped'])
+        with col4:
+            st.metric("Last Log Flush", f"{log_stats['last_flush_ms']:.1f} ms")
+        st.write("**Database Pool:**", db.pool.stats())
+        st.write("**Chart Cache:**", chart_renderer.stats())
+        st.write("**Report Jobs:**", report_queue.stats())
+        st.write("**Prediction Cache:**", prediction_cache.stats())
+    
+    # Dataset Management Section
+    st.subheader("📊 Dataset Management")
+    
+    # Upload new dataset
+    uploaded_file = st.file_uploader("Upload New Dataset (CSV)", type=['csv'])
+    
+    if uploaded_file is not None:
+        try:
+            # Only read a preview here - the full file is streamed in chunks on processing
+            new_df = pd.read_csv(uploaded_file, nrows=UPLOAD_PREVIEW_ROWS)
+            st.success(f"Dataset uploaded successfully! Columns: {len(new_df.columns)}, "
+                       f"Size: {uploaded_file.size / (1024 * 1024):.1f} MB")
+            
+            # Show preview
+            st.write("**Dataset Preview:**")
+            st.dataframe(new_df.head())
+            
+            # Column mapping
+            st.write("**Map Columns for Training:**")
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                text_column = st.selectbox("Select Text Column", new_df.columns)
+            with col2:
+                sentiment_column = st.selectbox("Select Sentiment Column", new_df.columns)
+            with col3:
+                dataset_name = st.text_input("Dataset Name (optional)", 
+                                           value=uploaded_file.name.replace('.csv', ''))
+            
+            training_mode = st.radio(
+                "Training Mode", ["Full retrain", "Incremental update"], horizontal=True,
+                help="Incremental update folds this dataset into the current model without reprocessing earlier data")
+            
+            # Check the labels on the preview, before anything is written to the database or indexes
+            preview_labels = new_df[sentiment_column].dropna().unique()
+            labels_confirmed = True
+            if len(preview_labels) > 10:
+                st.warning(f"⚠️ Large number of sentiment labels detected ({len(preview_labels)} in the first "
+                           f"{len(new_df):,} rows). This might indicate:")
+                st.write("• Encoded/hashed sentiment values")
+                st.write("• Product IDs or other non-sentiment data")
+                st.write("• Data quality issues")
+                
+                # Show first few examples
+                st.write("**Sample Labels:**", list(preview_labels[:10]))
+                
+                # Ask user to confirm
+                labels_confirmed = st.checkbox(
+                    "⚠️ I understand this data may have unusual labels and want to proceed anyway")
+            
+            if st.button("Process Dataset & Train Model", disabled=not labels_confirmed):
+                with st.spinner("Processing dataset and training model..."):
+                    try:
+                        # Log activity
+                        db.log_activity(st.session_state['user']['user_id'], 'dataset_upload', 
+                                       f"Uploaded dataset: {uploaded_file.name}")
+                        
+                        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+                        
+                        # Cleaned dataset location
+                        os.makedirs(DATA_DIR, exist_ok=True)
+                        
+                        # Use custom name or default with timestamp
+                        if dataset_name.strip():
+                            filename = f"{dataset_name.strip()}_{timestamp}.csv"
+                        else:
+                            filename = f"dataset_{timestamp}.csv"
+                        
+                        dataset_path = os.path.join(DATA_DIR, filename)
+                        
+                        # Stream: clean, save and insert into the database chunk by chunk
+                        st.write("**Data Cleaning Results:**")
+                        progress = st.progress(0.0)
+                        status = st.empty()
+                        
+                        def report_progress(rows_read, rows_kept):
+                            progress.progress(min(uploaded_file.tell() / max(uploaded_file.size, 1), 1.0))
+                            status.text(f"Processed {rows_read:,} rows ({rows_kept:,} kept)")
+                        
+                        uploaded_file.seek(0)
+                        ingest_result = DatasetIngestor(db, token_index=token_index, search_index=search_index, rollup=rollup).ingest(
+                            uploaded_file, text_column, sentiment_column, dataset_path,
+                            user_id=st.session_state['user']['user_id'],
+                            progress_callback=report_progress)
+                        progress.progress(1.0)
+                        
+                        initial_count = ingest_result['rows_read']
+                        final_count = ingest_result['rows_kept']
+                        st.info(f"Data cleaning: {initial_count} → {final_count} records ({final_count/max(initial_count, 1)*100:.1f}% retained)")
+                        failed_chunks = ingest_result['failed_chunks']
+                        if final_count and not ingest_result['rows_inserted']:
+                            st.error("Data could not be inserted into the database; the dataset was not saved.")
+                            return
+                        elif failed_chunks:
+                            st.warning(f"⚠️ {failed_chunks} chunk(s) could not be inserted into the database. "
+                                       f"Only {ingest_result['rows_inserted']:,} of {final_count:,} records were "
+                                       f"saved; the rest are left out of the dataset.")
+                        else:
+                            st.success("Data inserted into database successfully!")
+
+                        # Columnar copy for fast, column-projected loads on the dashboard pages
+                        dataset_store.convert(dataset_path)
+                        
+                        # Show sentiment distribution
+                        st.write("**Sentiment Distribution:**")
+                        sentiment_dist = ingest_result['sentiment_counts']
+                        
+                        unique_sentiments = sentiment_dist.index
+                        st.write(f"**Unique Sentiment Labels Found:** {len(unique_sentiments)}")
+                        
+                        # Show sentiment distribution chart
+                        def draw_upload_distribution(fig):
+                            ax = fig.subplots()
+                            if len(unique_sentiments) <= 10:
+                                # Normal bar chart for reasonable number of categories
+                                sentiment_dist.plot(kind='bar', ax=ax, color=['red', 'gray', 'green'])
+                            else:
+                                # Show only top 10 for many categories
+                                sentiment_dist.head(10).plot(kind='bar', ax=ax, color='skyblue')
+                                ax.set_title(f'Top 10 Sentiment Labels (out of {len(unique_sentiments)} total)')
+                            ax.tick_params(axis='x', rotation=45)
+                            
+                            ax.set_title('Sentiment Distribution in New Dataset')
+                            ax.set_xlabel('Sentiment')
+                            ax.set_ylabel('Count')
+                        
+                        st.image(chart_renderer.png(None, draw_upload_distribution, figsize=(10, 6)))
+                        
+                        # Train model on just the two columns it needs
+                        st.write("**Training Sentiment Model:**")
+                        incremental = training_mode == "Incremental update"
+                        
+                        if incremental:
+                            trainer = IncrementalTrainer(model_manager.model_path, model_manager.vectorizer_path)
+                            if not trainer.load():
+                                st.info("ℹ️ Current model is not incremental - starting a new incremental model from this dataset")
+                            summary = trainer.train_from_csv(dataset_path, text_column, sentiment_column,
+                                                             feedback_ids=ingest_result['feedback_ids'])
+                            model, vectorizer, accuracy = trainer.model, trainer.vectorizer, summary['accuracy']
+                            report = (f"Incremental update: {summary['rows_trained']} rows in {summary['batches']} batches "
+                                      f"({summary['rows_skipped']} skipped)")
+                        else:
+                            clean_df = dataset_store.load(dataset_path, columns=[text_column, sentiment_column])
+                            model, vectorizer, accuracy, report = train_sentiment_model(
+                                clean_df, text_column, sentiment_column)
+                        
+                        # Model performance analysis
+                        if accuracy is None:
+                            st.info("ℹ️ Accuracy is measured on each batch before training on it - not enough batches yet")
+                        elif accuracy > 0.85:
+                            st.success(f"🎯 Excellent model performance! Accuracy: {accuracy:.3f}")
+                        elif accuracy > 0.75:
+                            st.success(f"✅ Good model performance! Accuracy: {accuracy:.3f}")
+                        elif accuracy > 0.65:
+                            st.warning(f"⚠️ Fair model performance. Accuracy: {accuracy:.3f}")
+                            st.info("💡 Consider adding more balanced training data to improve accuracy.")
+                        else:
+                            st.error(f"❌ Low model performance. Accuracy: {accuracy:.3f}")
+                            st.info("💡 Recommendations: Check data quality, balance sentiment distribution, or review labeling.")
+                        
+                        # Performance improvement suggestions
+                        sentiment_balance = sentiment_dist / max(final_count, 1)
+                        min_class_ratio = sentiment_balance.min()
+                        
+                        if min_class_ratio < 0.1:  # Less than 10% for smallest class
+                            st.warning("⚖️ Imbalanced dataset detected. Consider collecting more data for underrepresented sentiments.")
+                        
+                        if final_count < 1000:
+                            st.info("📈 Dataset is relatively small. Accuracy may improve with more training data.")
+                        
+                        # Show classification report
+                        num_classes = len(unique_sentiments)
+                        if num_classes <= 10 or incremental:
+                            st.text("Detailed Performance Report:")
+                            st.text(report)
+                        else:
+                            st.write("**Performance Summary:**")
+                            st.write(f"• **Classes Trained:** {num_classes}")
+                            st.write(f"• **Overall Accuracy:** {accuracy:.3f}")
+                            st.write("• **Detailed Report:** Too many classes to display (see logs)")
+                            
+                            # Show just the summary lines
+                            report_lines = report.split('\n')
+                            summary_lines = [line for line in report_lines if 'accuracy' in line or 'avg' in line]
+                            if summary_lines:
+                                st.text("Summary Metrics:")
+                                for line in summary_lines:
+                                    if line.strip():
+                                        st.text(line)
+                        
+                        # Register the new version and promote it (also updates the main model files)
+                        if incremental:
+                            version = trainer.save(dataset=filename)
+                        else:
+                            version = model_manager.registry.register(
+                                model, vectorizer, accuracy=accuracy, dataset=filename,
+                                rows=final_count, training_mode='full')
+                        
+                        st.success(f"""
+                        ✅ Dataset processed successfully!
+                        - Cleaned dataset saved: {dataset_path}
+                        - Model version promoted: {version}
+                        - Main model files updated
+                        """)
+                        
+                        # Log system health
+                        if accuracy is not None:
+                            db.log_system_health('model_accuracy', accuracy, 'good' if accuracy > 0.7 else 'warning')
+                        db.log_system_health('dataset_size', final_count, 'good')
+                        
+                    except Exception as e:
+                        st.error(f"Error processing dataset: {e}")
+                        import traceback
+                        st.text(traceback.format_exc())
+        
+        except Exception as e:
+            st.error(f"Error reading file: {e}")
+    
+    # Fold labelled feedback added since the last incremental update into the model
+    if st.button("🔄 Update Model from New Feedback"):
+        with st.spinner("Updating model from new feedback..."):
+            trainer = IncrementalTrainer(model_manager.model_path, model_manager.vectorizer_path)
+            if not trainer.load():
+                st.info("ℹ️ Current model is not incremental - starting a new incremental model from all feedback")
+            summary = trainer.train_from_feedback(db)
+            if summary['rows_trained'] == 0:
+                st.info("No new labelled feedback since the last update")
+            else:
+                version = trainer.save(dataset='feedback')
+                st.success(f"✅ Model updated with {summary['rows_trained']:,} feedback rows (version {version})")
+                if summary['accuracy'] is not None:
+                    st.write(f"**Accuracy on new rows before training:** {summary['accuracy']:.3f}")
+                    db.log_system_health('model_accuracy', summary['accuracy'],
+                                         'good' if summary['accuracy'] > 0.7 else 'warning')
+
+    # Model versions - promoting or rolling back is picked up by every session on its next prediction
+    with st.expander("🗂️ Model Registry"):
+        registry = model_manager.registry
+        versions = registry.list_versions()
+        if not versions:
+            st.info("No registered model versions yet - train a model to create the first one")
+        else:
+            current = registry.current_version()
+            versions_df = pd.DataFrame(versions)
+            versions_df.insert(0, 'current', versions_df['version'] == current)
+            versions_df['size_mb'] = (versions_df['size_bytes'] / (1024 * 1024)).round(2)
+            st.dataframe(versions_df[['current', 'version', 'created_at', 'accuracy', 'dataset', 'rows',
+                                      'training_mode', 'model_type', 'size_mb']], use_container_width=True)
+
+            col1, col2 = st.columns(2)
+            with col1:
+                selected_version = st.selectbox("Version", versions_df['version'])
+                if st.button("⬆️ Promote Version"):
+                    registry.promote(selected_version)
+                    db.log_activity(st.session_state['user']['user_id'], 'model_promote', selected_version)
+                    st.success(f"Version {selected_version} is now live")
+            with col2:
+                st.write(f"**Current Version:** {current}")
+                if st.button("↩️ Roll Back"):
+                    try:
+                        previous = registry.rollback()
+                        db.log_activity(st.session_state['user']['user_id'], 'model_rollback', previous)
+                        st.success(f"Rolled back to version {previous}")
+                    except RuntimeError as e:
+                        st.warning(str(e))
+
+    # Existing datasets management
+    st.subheader("📁 Existing Datasets")
+    if os.path.exists(DATA_DIR):
+        csv_files = [f for f in os.listdir(DATA_DIR) if f.endswith('.csv')]
+        if csv_files:
+            selected_dataset = st.selectbox("Select dataset to view", csv_files)
+            if st.button("View Dataset Info"):
+                try:
+                    # Row count and columns come from the cached metadata, not a full parse
+                    dataset_info = dataset_store.info(selected_dataset)
+                    
+                    col1, col2, col3 = st.columns(3)
+                    with col1:
+                        st.metric("Rows", dataset_info['rows'])
+                    with col2:
+                        st.metric("Columns", len(dataset_info['columns']))
+                    with col3:
+                        st.metric("Size (MB)", f"{dataset_info['source_size_bytes']/(1024*1024):.2f}")
+                    
+                    st.write("**Columns:**", list(dataset_info['columns']))
+                    st.dataframe(dataset_store.head(selected_dataset))
+                    
+                except Exception as e:
+                    st.error(f"Error reading dataset: {e}")
+            
+            with st.expander("📦 Bulk Reports"):
+                show_bulk_report_section(os.path.join(DATA_DIR, selected_dataset))
+    
+    # User Activity Logs
+    st.subheader("Recent User Activity")
+    activity_df = db.get_user_activity(limit=10)
+    if not activity_df.empty:
+        st.dataframe(activity_df)
+    else:
+        st.info("No activity logs available")
+    
+    # Live Sentiment Analysis Demo
+    st.subheader("🤖 Live Sentiment Analysis Demo")
+    st.write("Test the trained sentiment model with real-time predictions")
+    
+    # Check if model files exist
+    model_path = model_manager.model_path
+    vectorizer_path = model_manager.vectorizer_path
+    
+    if model_manager.is_available():
+        try:
+            # Load model and vectorizer (cached across reruns and sessions)
+            if JOBLIB_AVAILABLE:
+                model, vectorizer, model_version = model_manager.get_versioned_model()
+                
+                st.success("✅ Sentiment model loaded successfully!")
+                
+                # Text input for testing
+                col1, col2 = st.columns([2, 1])
+                
+                with col1:
+                    test_text = st.text_area(
+                        "Enter text to analyze:",
+                        value=st.session_state.get('test_text', ''),
+                        placeholder="Type your text here to see real-time sentiment analysis...",
+                        height=100,
+                        key="sentiment_test_text"
+                    )
+                
+                with col2:
+                    st.write("**Quick Test Examples:**")
+                    if st.button("😊 Positive Example"):
+                        st.session_state['test_text'] = "This product is amazing! I absolutely love it and would definitely recommend it to others."
+                        st.rerun()
+                    if st.button("😞 Negative Example"):
+                        st.session_state['test_text'] = "This is terrible quality. Very disappointed with my purchase and poor customer service."
+                        st.rerun()
+                    if st.button("😐 Neutral Example"):
+                        st.session_state['test_text'] = "The product arrived on time. It's okay, nothing special but does what it's supposed to do."
+                        st.rerun()
+                
+                # Get test text from session state or text area
+                test_text = st.session_state.get('test_text', test_text)
+                
+                # Analyze text if provided
+                if test_text and len(test_text.strip()) > 0:
+                    with st.spinner("Analyzing sentiment..."):
+                        try:
+                            # Cleaned, vectorized and scored only the first time this text is seen
+                            prediction_proba = prediction_cache.predict_proba(
+                                [test_text], model, vectorizer, model_version)[0]
+                            prediction = model.classes_[prediction_proba.argmax()]
+                            confidence = max(prediction_proba)
+                            
+                            # Display results
+                            col1, col2, col3 = st.columns(3)
+                            
+                            with col1:
+                                # Determine color based on sentiment
+                                if 'pos' in str(prediction).lower():
+                                    sentiment_color = "🟢"
+                                    sentiment_emoji = "😊"
+                                elif 'neg' in str(prediction).lower():
+                                    sentiment_color = "🔴"
+                                    sentiment_emoji = "😞"
+                                else:
+                                    sentiment_color = "🟡"
+                                    sentiment_emoji = "😐"
+                                
+                                st.metric(
+                                    f"{sentiment_color} Predicted Sentiment",
+                                    f"{sentiment_emoji} {prediction.title()}"
+                                )
+                            
+                            with col2:
+                                confidence_percentage = confidence * 100
+                                if confidence_percentage > 80:
+                                    confidence_color = "🟢"
+                                elif confidence_percentage > 60:
+                                    confidence_color = "🟡"
+                                else:
+                                    confidence_color = "🔴"
+                                
+                                st.metric(
+                                    f"{confidence_color} Confidence",
+                                    f"{confidence_percentage:.1f}%"
+                                )
+                            
+                            with col3:
+                                st.metric(
+                                    "📝 Text Length",
+                                    f"{len(test_text)} chars"
+                                )
+                            
+                            # Show probability breakdown
+                            st.subheader("📊 Detailed Analysis")
+                            
+                            # Create probability chart
+                            classes = model.classes_
+                            probabilities = prediction_proba
+                            
+                            if PLOTLY_AVAILABLE:
+                                # Interactive probability chart
+                                colors = ['green' if 'pos' in str(cls).lower() else 'red' if 'neg' in str(cls).lower() else 'gray' 
+                                         for cls in classes]
+                                
+                                fig = go.Figure(data=[
+                                    go.Bar(x=classes, y=probabilities * 100, 
+                                           marker_color=colors, opacity=0.7,
+                                           text=[f"{p*100:.1f}%" for p in probabilities],
+                                           textposition='auto')
+                                ])
+                                fig.update_layout(
+                                    title='Sentiment Probability Distribution',
+                                    xaxis_title='Sentiment Class',
+                                    yaxis_title='Probability (%)',
+                                    height=400
+                                )
+                                st.plotly_chart(fig, use_container_width=True)
+                            else:
+                                # Fallback matplotlib chart
+                                def draw_probabilities(fig):
+                                    ax = fig.subplots()
+                                    colors = ['green' if 'pos' in str(cls).lower() else 'red' if 'neg' in str(cls).lower() else 'gray' 
+                                             for cls in classes]
+                                    bars = ax.bar(classes, probabilities * 100, color=colors, alpha=0.7)
+                                    ax.set_title('Sentiment Probability Distribution')
+                                    ax.set_xlabel('Sentiment Class')
+                                    ax.set_ylabel('Probability (%)')
+                                    
+                                    # Add value labels
+                                    for bar, prob in zip(bars, probabilities):
+                                        height = bar.get_height()
+                                        ax.text(bar.get_x() + bar.get_width()/2., height + 1,
+                                               f'{prob*100:.1f}%', ha='center', va='bottom')
+                                
+                                st.image(chart_renderer.png(None, draw_probabilities, figsize=(8, 4)))
+                            
+                            # Show processed text
+                            with st.expander("🔍 See Processed Text"):
+                                st.write("**Original Text:**")
+                                st.write(f'"{test_text}"')
+                                st.write("**Processed Text (what the model sees):**")
+                                st.write(f'"{clean_text_for_training(test_text)}"')
+                                st.write("**Processing Steps:**")
+                                st.write("• Converted to lowercase")
+                                st.write("• Removed URLs and special characters")
+                                st.write("• Removed extra whitespace")
+                                st.write("• Tokenized for machine learning")
+                        
+                        except Exception as e:
+                            st.error(f"Error analyzing text: {e}")
+                            st.info("Make sure the model was trained properly and try again.")
+                
+                # Model Information
+                with st.expander("ℹ️ Model Information"):
+                    try:
+                        st.write(f"**Model Type:** {type(model).__name__}")
+                        st.write(f"**Feature Extraction:** {type(vectorizer).__name__}")
+                        st.write(f"**Available Classes:** {', '.join(model.classes_)}")
+                        st.write(f"**Model File:** {model_path}")
+                        st.write(f"**Vectorizer File:** {vectorizer_path}")
+                        st.write(f"**Model Version:** {model_manager.version}")
+                        
+                        # Model file info
+                        model_size = os.path.getsize(model_path) / (1024 * 1024)  # MB
+                        vectorizer_size = os.path.getsize(vectorizer_path) / (1024 * 1024)  # MB
+                        st.write(f"**Model Size:** {model_size:.2f} MB")
+                        st.write(f"**Vectorizer Size:** {vectorizer_size:.2f} MB")
+                        
+                    except Exception as e:
+                        st.warning(f"Could not load model info: {e}")
+            else:
+                st.warning("Joblib not available - cannot load trained model")
+                
+        except Exception as e:
+            st.error(f"Error loading model: {e}")
+            st.info("Train a model first by uploading a dataset above.")
+    else:
+        st.info("🤖 No trained model found. Upload and process a dataset to train a sentiment model.")
+        st.write("**Missing Files:**")
+        if not os.path.exists(model_path):
+            st.write(f"❌ {model_path}")
+        if not os.path.exists(vectorizer_path):
+            st.write(f"❌ {vectorizer_path}")
+
+def show_bulk_report_section(dataset_path):
+    """Admin tool: one report per product/campaign of a dataset, downloaded as a zip"""
+    columns = list(dataset_store.info(dataset_path)['columns'])
+    default_group = find_group_column(columns)
+    col1, col2 = st.columns(2)
+    with col1:
+        group_col = st.selectbox("Report per", columns,
+                                 index=columns.index(default_group) if default_group else 0,
+                                 key="bulk_group_column")
+    with col2:
+        report_type = st.selectbox("Report type", REPORT_TYPES, key="bulk_report_type")
+    
+    if st.button("Generate All Reports"):
+        df = dataset_cache.get(dataset_path, dataset_store.load)
+        groups = df[group_col].nunique()
+        with st.spinner(f"Building {groups:,} {report_type} reports..."):
+            try:
+                manifest = generate_bulk_reports(
+                    df, group_col, bulk_output_dir(report_queue.reports_dir, report_type),
+                    report_type=report_type, workers=BULK_REPORT_WORKERS,
+                    sentiment_col=get_schema(df)['sentiment_column'], zip_output=True
+                )
+                db.log_activity(st.session_state['user']['user_id'], 'bulk_reports',
+                                f"{len(manifest['reports'])} {report_type} reports by {group_col}")
+                st.session_state['bulk_report_zip'] = manifest['zip']
+                failed = [entry['name'] for entry in manifest['reports'] if entry['error']]
+                if failed:
+                    st.warning(f"Failed reports: {', '.join(failed)}")
+            except Exception as e:
+                st.error(f"Error generating reports: {e}")
+    
+    zip_path = st.session_state.get('bulk_report_zip')
+    if zip_path and os.path.exists(zip_path):
+        with open(zip_path, "rb") as file:
+            st.download_button(
+                label="Download Reports (zip)",
+                data=file.read(),
+                file_name=os.path.basename(zip_path),
+                mime="application/zip"
+            )
@@ -0,0 +1,31 @@
+"""Managers and helpers shared by every page, created once per process"""
+
+import os
+
+from auth_manager import AuthManager
+from database_manager import DatabaseManager
+from dataset_cache import get_dataset_cache
+from dataset_store import get_dataset_store
+from schema_inference import get_schema
+from sentiment_rollup import SentimentRollup
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Folder of uploaded datasets, overridable with the SENTIMENT_DATA_DIR env var
+DATA_DIR = os.environ.get('SENTIMENT_DATA_DIR') or os.path.join(BASE_DIR, 'data')
+REPORTS_DIR = os.path.join(BASE_DIR, 'reports')
+
+auth = AuthManager()
+db = DatabaseManager()
+dataset_store = get_dataset_store(DATA_DIR)
+dataset_cache = get_dataset_cache()
+rollup = SentimentRollup(db)
+
+
+def guess_sentiment_column(df):
+    """Guess sentiment column name"""
+    return get_schema(df)['sentiment_column']
+
+
+def guess_text_column(df):
+    """Guess text column name"""
+    return get_schema(df)['text_column']
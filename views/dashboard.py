@@ -0,0 +1,286 @@
+"""General dashboard page, available to every role"""
+
+import os
+from collections import Counter
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+try:
+    import plotly.express as px
+    import plotly.graph_objects as go
+    PLOTLY_AVAILABLE = True
+except ImportError:
+    PLOTLY_AVAILABLE = False
+
+from chart_renderer import chart_key, get_chart_renderer
+from sentiment_labels import code_counts, code_labels, normalize_labels, sentiment_codes
+from token_index import WORDCLOUD_AVAILABLE, get_token_index
+from views.common import db, guess_sentiment_column, guess_text_column, rollup
+
+chart_renderer = get_chart_renderer()
+token_index = get_token_index(db)
+
+
+def show_dashboard(df, dataset_path, user):
+    """Show the comprehensive sentiment dashboard for a loaded dataset"""
+    selected_file = os.path.basename(dataset_path)
+    
+    # Log activity
+    db.log_activity(user['user_id'], 'view_dashboard', f"Viewed dashboard with dataset: {selected_file}")
+    
+    # Complete Dashboard with all analysis
+    st.header("📊 Comprehensive Sentiment Dashboard")
+    
+    # Auto-detect columns
+    sentiment_col = guess_sentiment_column(df)
+    text_col = guess_text_column(df)
+    date_cols = [col for col in df.columns if 'date' in col.lower() or 'time' in col.lower()]
+    
+    # Key Metrics
+    st.subheader("� Key Metrics")
+    col1, col2, col3, col4 = st.columns(4)
+    
+    total_feedback = len(df)
+    with col1:
+        st.metric("Total Feedback", f"{total_feedback:,}")
+    
+    if sentiment_col:
+        # Normalized int8 codes - counted once with bincount for every metric and chart below
+        negative_count, neutral_count, positive_count, unknown_count = code_counts(sentiment_codes(df, sentiment_col))
+        sentiment_counts = pd.Series([positive_count, negative_count, neutral_count],
+                                     index=['positive', 'negative', 'neutral'])
+        if unknown_count:
+            sentiment_counts['unknown'] = unknown_count
+    
+        with col2:
+            st.metric("Positive", f"{positive_count:,}", delta=f"{positive_count/total_feedback*100:.1f}%")
+        with col3:
+            st.metric("Negative", f"{negative_count:,}", delta=f"-{negative_count/total_feedback*100:.1f}%")
+        with col4:
+            st.metric("Neutral", f"{neutral_count:,}", delta=f"{neutral_count/total_feedback*100:.1f}%")
+    
+    # Charts Section - cached per dataset version, so reruns skip the aggregation and drawing
+    col1, col2 = st.columns(2)
+    
+    # Sentiment Distribution
+    with col1:
+        if sentiment_col:
+            st.subheader('🎯 Sentiment Distribution')
+            colors = ['green' if 'pos' in str(idx).lower() else 'red' if 'neg' in str(idx).lower() else 'gray' 
+                     for idx in sentiment_counts.index]
+    
+            if PLOTLY_AVAILABLE:
+                # Use Plotly for interactive charts
+                def build_sentiment_distribution():
+                    fig = go.Figure(data=[
+                        go.Bar(x=sentiment_counts.index, y=sentiment_counts.values, 
+                               marker_color=colors, opacity=0.7,
+                               text=sentiment_counts.values, textposition='auto')
+                    ])
+                    fig.update_layout(
+                        title='Sentiment Distribution',
+                        xaxis_title='Sentiment',
+                        yaxis_title='Count',
+                        height=400
+                    )
+                    return fig
+    
+                st.plotly_chart(chart_renderer.plotly(chart_key(dataset_path, 'sentiment_distribution'),
+                                                      build_sentiment_distribution), use_container_width=True)
+            else:
+                # Fallback to matplotlib
+                def draw_sentiment_distribution(fig):
+                    ax = fig.subplots()
+                    bars = ax.bar(sentiment_counts.index, sentiment_counts.values, color=colors, alpha=0.7)
+                    ax.set_title('Sentiment Distribution', fontsize=14, fontweight='bold')
+                    ax.set_xlabel('Sentiment')
+                    ax.set_ylabel('Count')
+    
+                    # Add value labels on bars
+                    for bar in bars:
+                        height = bar.get_height()
+                        ax.text(bar.get_x() + bar.get_width()/2., height + height*0.01,
+                               f'{int(height)}', ha='center', va='bottom')
+    
+                    ax.tick_params(axis='x', rotation=45)
+    
+                st.image(chart_renderer.png(chart_key(dataset_path, 'sentiment_distribution'),
+                                            draw_sentiment_distribution))
+    
+    # Platform Distribution (if platform column exists)
+    with col2:
+        platform_cols = [col for col in df.columns if 'platform' in col.lower() or 'source' in col.lower()]
+        if platform_cols:
+            platform_col = platform_cols[0]
+            st.subheader('📱 Platform Breakdown')
+    
+            if PLOTLY_AVAILABLE:
+                # Use Plotly for interactive pie chart
+                def build_platform_breakdown():
+                    platform_counts = df[platform_col].value_counts()
+                    return px.pie(values=platform_counts.values, names=platform_counts.index,
+                                  title='Feedback by Platform', height=400)
+    
+                st.plotly_chart(chart_renderer.plotly(chart_key(dataset_path, 'platform_breakdown', column=platform_col),
+                                                      build_platform_breakdown), use_container_width=True)
+            else:
+                # Fallback to matplotlib
+                def draw_platform_breakdown(fig):
+                    ax = fig.subplots()
+                    df[platform_col].value_counts().plot(kind='pie', ax=ax, autopct='%1.1f%%', startangle=90)
+                    ax.set_title('Feedback by Platform')
+                    ax.set_ylabel('')
+    
+                st.image(chart_renderer.png(chart_key(dataset_path, 'platform_breakdown', column=platform_col),
+                                            draw_platform_breakdown))
+        else:
+            # Show top words if no platform column
+            if text_col:
+                st.subheader('🔤 Top Keywords')
+    
+                def draw_top_keywords(fig):
+                    all_text = ' '.join(df[text_col].astype(str).str.lower())
+    
+                    # Simple word frequency
+                    words = all_text.split()
+                    # Filter out common words
+                    stop_words = {'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were', 'a', 'an'}
+                    words = [word for word in words if len(word) > 3 and word not in stop_words]
+                    word_freq = Counter(words).most_common(10)
+    
+                    ax = fig.subplots()
+                    if word_freq:
+                        words_df = pd.DataFrame(word_freq, columns=['Word', 'Frequency'])
+                        ax.barh(words_df['Word'], words_df['Frequency'])
+                    ax.set_title('Most Frequent Words')
+                    ax.set_xlabel('Frequency')
+    
+                st.image(chart_renderer.png(chart_key(dataset_path, 'top_keywords', column=text_col),
+                                            draw_top_keywords))
+    
+    # Time Series Analysis
+    if date_cols and sentiment_col:
+        st.subheader("📅 Sentiment Trends Over Time")
+        date_col = date_cols[0]
+    
+        def daily_sentiment_counts():
+            # Daily rollup columns are raw labels - merge them by normalized sentiment
+            daily = rollup.daily(selected_file)
+            labels = code_labels(normalize_labels(daily.columns))
+            return daily.T.groupby(labels, observed=True).sum().T
+    
+        def trend_color(sentiment):
+            return 'green' if 'pos' in str(sentiment).lower() else 'red' if 'neg' in str(sentiment).lower() else 'gray'
+    
+        try:
+            rollup.ensure(selected_file, dataset_path, df, date_col, sentiment_col)
+            trend_key = chart_key(dataset_path, 'sentiment_trend', column=date_col)
+            if PLOTLY_AVAILABLE:
+                # Use Plotly for interactive time series
+                def build_sentiment_trend():
+                    daily_sentiment = daily_sentiment_counts()
+                    fig = go.Figure()
+    
+                    for sentiment in daily_sentiment.columns:
+                        fig.add_trace(go.Scatter(
+                            x=daily_sentiment.index,
+                            y=daily_sentiment[sentiment],
+                            mode='lines+markers',
+                            name=sentiment,
+                            line=dict(color=trend_color(sentiment)),
+                            marker=dict(size=6)
+                        ))
+    
+                    fig.update_layout(
+                        title='Sentiment Trends Over Time',
+                        xaxis_title='Date',
+                        yaxis_title='Count',
+                        height=500,
+                        hovermode='x unified'
+                    )
+                    return fig
+    
+                fig = chart_renderer.plotly(trend_key, build_sentiment_trend)
+                if fig.data:
+                    st.plotly_chart(fig, use_container_width=True)
+            else:
+                # Fallback to matplotlib
+                def draw_sentiment_trend(fig):
+                    daily_sentiment = daily_sentiment_counts()
+                    ax = fig.subplots()
+                    for sentiment in daily_sentiment.columns:
+                        ax.plot(daily_sentiment.index, daily_sentiment[sentiment], 
+                               label=sentiment, marker='o', color=trend_color(sentiment))
+    
+                    ax.set_title('Sentiment Trends Over Time')
+                    ax.set_xlabel('Date')
+                    ax.set_ylabel('Count')
+                    ax.legend()
+                    ax.tick_params(axis='x', rotation=45)
+    
+                st.image(chart_renderer.png(trend_key, draw_sentiment_trend, figsize=(12, 6)))
+        except Exception as e:
+            st.warning(f"Could not create time series: {e}")
+    
+    # Detailed Analysis
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Sentiment Statistics
+        if sentiment_col:
+            st.subheader("📊 Sentiment Statistics")
+            stats_data = []
+            for sentiment, count in sentiment_counts.items():
+                percentage = (count / total_feedback) * 100
+                stats_data.append({
+                    'Sentiment': sentiment,
+                    'Count': count,
+                    'Percentage': f"{percentage:.1f}%"
+                })
+    
+            stats_df = pd.DataFrame(stats_data)
+            st.dataframe(stats_df, use_container_width=True)
+    
+    with col2:
+        # Recent Feedback
+        st.subheader("📝 Recent Feedback")
+        display_cols = [col for col in df.columns if col in [text_col, sentiment_col, date_cols[0] if date_cols else None] and col is not None]
+        if display_cols:
+            recent_feedback = df[display_cols].tail(5)
+            st.dataframe(recent_feedback, use_container_width=True)
+    
+    # Word Cloud (if available)
+    if WORDCLOUD_AVAILABLE and text_col:
+        st.subheader("☁️ Word Cloud")
+        try:
+            # Counted once per dataset file; reruns draw from the stored frequencies
+            token_index.ensure(selected_file, dataset_path, df, text_col, sentiment_col)
+            wordcloud_image = token_index.word_cloud(selected_file)
+            if wordcloud_image is not None:
+                st.image(wordcloud_image)
+        except Exception as e:
+            st.warning(f"Could not generate word cloud: {e}")
+    
+    # Export Options
+    st.subheader("📤 Export Options")
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        if st.button("📊 Export CSV"):
+            csv = df.to_csv(index=False)
+            st.download_button(
+                label="Download CSV",
+                data=csv,
+                file_name=f"sentiment_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                mime="text/csv"
+            )
+    
+    with col2:
+        if st.button("📈 Generate Report"):
+            st.info("Report generation feature available in Product Manager and Marketing dashboards")
+    
+    with col3:
+        if st.button("🔄 Refresh Data"):
+            st.rerun()
@@ -0,0 +1,48 @@
+"""Marketing team page"""
+
+import streamlit as st
+
+from views.common import auth
+from views.reports import report_queue, show_report_job
+
+
+def show_marketing_panel(df):
+    """Show marketing team specific features"""
+    if not auth.require_permission('view_brand_sentiment'):
+        st.error("Access denied: Marketing Team privileges required")
+        st.warning(f"**Current User Role:** {st.session_state.get('user', {}).get('role', 'Unknown')}")
+        st.info(f"**Your Permissions:** {st.session_state.get('permissions', [])}")
+        st.info("**Required Permission:** view_brand_sentiment")
+        
+        # Provide helpful navigation
+        if auth.require_permission('view_product_sentiment'):
+            st.info("💡 **Suggestion:** Click **'📈 Product Analytics'** in the sidebar to access your dashboard.")
+        elif auth.require_permission('manage_users'):
+            st.info("💡 **Suggestion:** Click **'🔧 Admin Panel'** in the sidebar to access your dashboard.")
+        else:
+            st.info("💡 **Suggestion:** Click **'📋 General Dashboard'** in the sidebar.")
+        
+        return
+    
+    st.header("📊 Marketing Dashboard")
+    
+    # Campaign Analytics
+    st.subheader("Campaign Performance")
+    
+    # Mock campaign data (in real implementation, this would come from campaign_id in database)
+    campaigns = ["Summer Sale 2025", "Product Launch", "Holiday Campaign"]
+    selected_campaign = st.selectbox("Select Campaign", campaigns)
+    
+    # Campaign metrics
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Campaign Reach", "10,234")
+    with col2:
+        st.metric("Positive Mentions", "1,456")
+    with col3:
+        st.metric("Engagement Rate", "5.2%")
+    
+    # Generate marketing report
+    if st.button("Generate Campaign Report"):
+        st.session_state['campaign_report_job'] = report_queue.submit('marketing', df, selected_campaign)
+    show_report_job('campaign_report_job', "Download Campaign Report")
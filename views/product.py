@@ -0,0 +1,222 @@
+"""Product manager page"""
+
+import os
+
+import streamlit as st
+
+from chart_renderer import chart_key, get_chart_renderer
+from issue_matcher import ISSUE_RECOMMENDATIONS, IssueMatcher
+from sentiment_labels import NEGATIVE, normalize_labels, sentiment_codes
+from views.common import auth, guess_sentiment_column, guess_text_column, rollup
+from views.reports import report_queue, show_report_job
+
+chart_renderer = get_chart_renderer()
+issue_matcher = IssueMatcher()
+
+
+def show_product_manager_panel(df, dataset_path):
+    """Show product manager specific features"""
+    if not auth.require_permission('view_product_sentiment'):
+        st.error("Access denied: Product Manager privileges required")
+        st.write(f"Your permissions: {st.session_state.get('permissions', [])}")
+        return
+    
+    st.header("📈 Product Manager Dashboard")
+    
+    # Debug information
+    with st.expander("🔧 Debug Information"):
+        st.write(f"Dataset shape: {df.shape}")
+        st.write(f"Columns: {list(df.columns)}")
+        sentiment_col = guess_sentiment_column(df)
+        text_col = guess_text_column(df)
+        st.write(f"Detected sentiment column: {sentiment_col}")
+        st.write(f"Detected text column: {text_col}")
+        if sentiment_col:
+            st.write(f"Unique sentiments: {df[sentiment_col].unique()}")
+        st.write("First 3 rows:")
+        st.dataframe(df.head(3))
+    
+    # Product filter
+    if 'product' in df.columns:
+        products = df['product'].unique()
+        selected_product = st.selectbox("Select Product", products)
+        product_df = df[df['product'] == selected_product]
+    else:
+        selected_product = "All Products"
+        product_df = df
+    
+    sentiment_col = guess_sentiment_column(df)
+    text_col = guess_text_column(df)
+    
+    # Sentiment alerts
+    st.subheader("🚨 Sentiment Alerts")
+    
+    if sentiment_col and text_col:
+        # Check if we have valid sentiment data
+        sentiment_values = product_df[sentiment_col].dropna()
+        if len(sentiment_values) == 0:
+            st.warning("No valid sentiment data found in the dataset.")
+            return
+        
+        # Integer comparison on the normalized sentiment codes
+        product_codes = sentiment_codes(product_df, sentiment_col)
+        negative_count = int((product_codes == NEGATIVE).sum())
+        total_count = len(product_df.dropna(subset=[sentiment_col]))
+        negative_ratio = negative_count / total_count if total_count > 0 else 0
+        
+        st.write(f"Total entries with sentiment: {total_count}")
+        st.write(f"Negative entries: {negative_count}")
+        
+        if negative_ratio > 0.3:  # 30% threshold
+            st.error(f"⚠️ High negative sentiment detected: {negative_ratio:.1%} of feedback is negative")
+        else:
+            st.success(f"✅ Sentiment is healthy: {negative_ratio:.1%} negative feedback")
+    else:
+        st.error("❌ Could not detect sentiment or text columns in the dataset.")
+        st.info("Please ensure your dataset has columns containing 'sentiment', 'label', 'text', or 'review' in the name.")
+        return
+    
+    # ROOT CAUSE ANALYSIS SECTION
+    st.subheader("🔍 Root Cause Analysis")
+    
+    if sentiment_col and text_col:
+        # Get negative feedback - handle different sentiment formats
+        negative_df = product_df.copy()
+        
+        # Method 1: Normalized codes (text labels, 1-5 and 1-10 ratings)
+        negative_mask = product_codes == NEGATIVE
+        negative_selection = None
+        
+        # Method 2: Check unique values to understand the sentiment format
+        if not negative_mask.any():
+            unique_sentiments = product_df[sentiment_col].value_counts()
+            st.write("**Available sentiment categories:**")
+            st.write(unique_sentiments)
+            
+            # Let user select which represents negative sentiment
+            negative_sentiments = st.multiselect(
+                "Select which categories represent NEGATIVE sentiment:",
+                options=unique_sentiments.index.tolist(),
+                help="Select all categories that should be considered negative"
+            )
+            
+            if negative_sentiments:
+                negative_mask = product_df[sentiment_col].isin(negative_sentiments)
+                negative_selection = tuple(negative_sentiments)
+        
+        negative_df = product_df[negative_mask]
+        
+        # Charts below are cached per dataset version, product and negative label choice
+        def product_chart_key(chart):
+            return chart_key(dataset_path, chart, product=selected_product, negative=negative_selection)
+        
+        if len(negative_df) > 0:
+            st.success(f"Found {len(negative_df)} negative feedback entries for analysis.")
+            
+            # Time-based analysis
+            st.write("**📅 Negative Sentiment Over Time:**")
+            date_cols = [col for col in df.columns if 'date' in col.lower() or 'time' in col.lower()]
+            
+            if date_cols:
+                date_col = date_cols[0]  # Use first date column found
+                try:
+                    # Daily counts come from the rollup, one row per day and label
+                    dataset_name = os.path.basename(dataset_path)
+                    rollup.ensure(dataset_name, dataset_path, df, date_col, sentiment_col)
+                    daily = rollup.daily(dataset_name, product=selected_product if 'product' in df.columns else None)
+                    if negative_selection is not None:
+                        negative_labels = [label for label in daily.columns if label in set(map(str, negative_selection))]
+                    else:
+                        negative_labels = daily.columns[normalize_labels(daily.columns) == NEGATIVE]
+                    daily_negative = daily[negative_labels].sum(axis=1)
+                    
+                    if daily_negative.sum() > 0:
+                        def draw_negative_trend(fig):
+                            ax = fig.subplots()
+                            daily_negative.plot(kind='line', ax=ax, color='red')
+                            ax.set_title('Negative Sentiment Trend')
+                            ax.set_ylabel('Negative Feedback Count')
+                            ax.tick_params(axis='x', rotation=45)
+                        
+                        st.image(chart_renderer.png(product_chart_key('negative_trend'), draw_negative_trend, figsize=(10, 4)))
+                    else:
+                        st.info("No valid dates found for time analysis.")
+                except Exception as e:
+                    st.warning(f"Could not analyze time trends: {e}")
+            else:
+                st.info("No date column found for time-based analysis.")
+            
+            # Tag each negative entry with issue categories in a single pass
+            st.write("**🔤 Most Common Issues (Keywords):**")
+            issue_matches = issue_matcher.match(negative_df[text_col])
+            issue_counts = issue_matches.issue_counts()
+            
+            if issue_counts:
+                # Display issue breakdown
+                col1, col2 = st.columns([1, 1])
+                
+                with col1:
+                    # Bar chart of issues
+                    def draw_issue_categories(fig):
+                        ax = fig.subplots()
+                        categories = list(issue_counts.keys())
+                        counts = list(issue_counts.values())
+                        ax.bar(categories, counts, color=['red', 'orange', 'yellow', 'purple', 'brown'][:len(categories)])
+                        ax.set_title('Issue Categories in Negative Feedback')
+                        ax.set_ylabel('Mention Count')
+                        ax.tick_params(axis='x', rotation=45)
+                        for label in ax.get_xticklabels():
+                            label.set_horizontalalignment('right')
+                    
+                    st.image(chart_renderer.png(product_chart_key('issue_categories'), draw_issue_categories))
+                
+                with col2:
+                    # Top issues table
+                    st.write("**Issue Breakdown:**")
+                    sorted_issues = sorted(issue_counts.items(), key=lambda x: x[1], reverse=True)
+                    for category, count in sorted_issues:
+                        percentage = (count / sum(issue_counts.values())) * 100
+                        st.write(f"• **{category}**: {count} mentions ({percentage:.1f}%)")
+            else:
+                st.info("No common issue keywords found. The negative feedback may use different terminology.")
+            
+            # Sample negative feedback
+            st.write("**📝 Sample Negative Feedback:**")
+            sample_negative = negative_df[text_col].head(5)
+            for i, text in enumerate(sample_negative, 1):
+                with st.expander(f"Negative Feedback #{i}"):
+                    st.write(str(text)[:500] + "..." if len(str(text)) > 500 else str(text))
+            
+            if issue_counts:
+                # Sample negative feedback for the top issue, straight from the row tags
+                st.write("**📝 Sample Negative Feedback by Issue:**")
+                top_issue = max(issue_counts.items(), key=lambda x: x[1])[0]
+                issue_feedback = negative_df.loc[issue_matches.examples(top_issue, 3)]
+                
+                st.write(f"**Top Issue: {top_issue}**")
+                for idx, row in issue_feedback.iterrows():
+                    with st.expander(f"Feedback #{idx}"):
+                        st.write(row[text_col])
+                
+                # Actionable recommendations
+                st.write("**💡 Recommended Actions:**")
+                top_3_issues = sorted(issue_counts.items(), key=lambda x: x[1], reverse=True)[:3]
+                for issue, count in top_3_issues:
+                    st.write(f"**For {issue} issues:**")
+                    for recommendation in ISSUE_RECOMMENDATIONS.get(issue, ["Review and investigate further"]):
+                        st.write(f"  {recommendation}")
+            
+        else:
+            st.info("No negative feedback found for analysis. This could mean:")
+            st.write("- All feedback is positive (great!)")
+            st.write("- The sentiment detection needs adjustment")
+            st.write("- The dataset uses a different sentiment format")
+    else:
+        st.error("❌ Could not detect sentiment or text columns for root cause analysis.")
+        st.info("💡 Make sure your dataset has clearly named sentiment and text columns.")
+    
+    # PDF Report Generation
+    st.subheader("📄 Generate Product Report")
+    if st.button("Generate PDF Report"):
+        st.session_state['product_report_job'] = report_queue.submit('product', product_df, selected_product)
+    show_report_job('product_report_job', "Download Report")
@@ -0,0 +1,49 @@
+"""Report job status and download, shared by the product and marketing pages"""
+
+import streamlit as st
+
+from report_jobs import FAILED, get_report_queue
+from views.common import REPORTS_DIR
+
+report_queue = get_report_queue(REPORTS_DIR)
+
+# Seconds between status checks of a queued or running report job
+REPORT_POLL_SECONDS = 1
+
+
+@st.fragment(run_every=REPORT_POLL_SECONDS)
+def _poll_report_job(job_id):
+    """Re-check an unfinished job on a timer, rerunning only this fragment until it is done"""
+    job = report_queue.get(job_id)
+    if job is not None and not job.finished:
+        st.info(f"⏳ Report for {job.name} is {job.status}...")
+    else:
+        st.rerun()
+
+
+def show_report_job(state_key, label):
+    """Show the status of the report job a panel last submitted, with its download once ready"""
+    job_id = st.session_state.get(state_key)
+    if job_id is None:
+        return
+    
+    job = report_queue.get(job_id)
+    if job is not None and not job.finished:
+        _poll_report_job(job_id)
+        return
+    
+    report = report_queue.read(job_id)
+    if job is None or (job.status != FAILED and report is None):
+        st.warning("This report is no longer available - please generate it again.")
+        del st.session_state[state_key]
+    elif job.status == FAILED:
+        st.error(f"Error generating report: {job.error}")
+    else:
+        st.success(f"Report generated: {job.download_name}")
+        st.download_button(
+            label=label,
+            data=report,
+            file_name=job.download_name,
+            mime=job.mime,
+            key=f"{state_key}_download"
+        )